@@ -4,12 +4,66 @@ Database connection management for SQLAlchemy.
 Provides database connection dependency for FastAPI routers.
 """
 
-from sqlalchemy import create_engine
+from decimal import Decimal
+
+import orjson
+from sqlalchemy import JSON, Table, create_engine
 from sqlalchemy.engine import Connection
-from typing import Generator
+from typing import Any, Generator
 from core.config import settings
 
-# Create SQLAlchemy engine
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for values orjson can't serialize natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize JSON/JSONB bind values (pack_json, results_json, ...) with orjson.
+    Returns UTF-8 bytes, which psycopg sends as-is instead of re-encoding a str,
+    so it is only set as json_serializer on the seed engines; the shared
+    engine's callers expect str.
+    numpy scalars/arrays and Decimals (metric values) are converted, not rejected.
+    """
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def copy_rows(conn: Connection, table: Table, rows: list[dict]) -> None:
+    """
+    Bulk-load rows into a table with COPY ... FROM STDIN, inside conn's transaction.
+
+    For large seeds and backfills, where COPY skips per-row INSERT parsing and
+    planning. Columns are the keys of the first row; JSON/JSONB values are
+    encoded with json_dumps. Server defaults apply only to columns left out.
+    """
+    if not rows:
+        return
+
+    preparer = conn.dialect.identifier_preparer
+    columns = list(rows[0])
+    json_columns = {c for c in columns if isinstance(table.c[c].type, JSON)}
+
+    raw = conn.connection.driver_connection
+    with raw.cursor() as cursor, cursor.copy(
+        f"COPY {preparer.format_table(table)} "
+        f"({', '.join(preparer.quote(c) for c in columns)}) FROM STDIN"
+    ) as copy:
+        for row in rows:
+            copy.write_row([
+                json_dumps(row[c]).decode() if c in json_columns and row[c] is not None else row[c]
+                for c in columns
+            ])
+
+
+# Create SQLAlchemy engine; JSON/JSONB values keep SQLAlchemy's stdlib json
+# serializer and deserializer. Only the seed engines use json_dumps.
 _engine = create_engine(settings.database_url, echo=settings.debug)
 
 
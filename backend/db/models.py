@@ -1,6 +1,6 @@
 """Database table definitions using SQLAlchemy Core."""
 from sqlalchemy import Table, Column, ForeignKey, Boolean, Integer, String, JSON, Text, TIMESTAMP
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 from .meta import METADATA
 
@@ -213,13 +213,13 @@ jobs = Table(
 ml_recipe = Table(
     "ml_recipe",
     METADATA,
-    Column("id", String(255), primary_key=True),
+    Column("id", String(255, collation="C"), primary_key=True),
     Column("name", Text, nullable=False),
     Column("model_family", String(64), nullable=False),  # pricing|next_best_action|location_scoring|forecasting
     Column("level", String(32), nullable=False),  # baseline|industry|client
     Column("status", String(32), nullable=False, default="draft"),  # draft|approved|archived
-    Column("parent_id", String(255), nullable=True),  # for inheritance
-    Column("tags", JSON, nullable=False, server_default="[]"),
+    Column("parent_id", String(255, collation="C"), nullable=True),  # for inheritance
+    Column("tags", JSONB, nullable=False, server_default="[]"),
     Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
     Column("updated_at", TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()),
 )
@@ -228,11 +228,11 @@ ml_recipe = Table(
 ml_recipe_version = Table(
     "ml_recipe_version",
     METADATA,
-    Column("version_id", String(255), primary_key=True),
-    Column("recipe_id", String(255), ForeignKey("ml_recipe.id"), nullable=False),
+    Column("version_id", String(255, collation="C"), primary_key=True),
+    Column("recipe_id", String(255, collation="C"), ForeignKey("ml_recipe.id"), nullable=False),
     Column("version_number", String(64), nullable=False),
-    Column("manifest_json", JSON, nullable=False, server_default="{}"),
-    Column("diff_from_prev", JSON, nullable=True),
+    Column("manifest_json", JSONB, nullable=False, server_default="{}"),
+    Column("diff_from_prev", JSONB, nullable=True),
     Column("created_by", Text, nullable=True),
     Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
     Column("change_note", Text, nullable=True),
@@ -242,11 +242,11 @@ ml_recipe_version = Table(
 ml_model = Table(
     "ml_model",
     METADATA,
-    Column("id", String(255), primary_key=True),
+    Column("id", String(255, collation="C"), primary_key=True),
     Column("name", Text, nullable=False),
     Column("model_family", String(64), nullable=False),
-    Column("recipe_id", String(255), ForeignKey("ml_recipe.id"), nullable=False),
-    Column("recipe_version_id", String(255), ForeignKey("ml_recipe_version.version_id"), nullable=False),
+    Column("recipe_id", String(255, collation="C"), ForeignKey("ml_recipe.id"), nullable=False),
+    Column("recipe_version_id", String(255, collation="C"), ForeignKey("ml_recipe_version.version_id"), nullable=False),
     Column("status", String(32), nullable=False, default="draft"),  # draft|staging|production|retired
     Column("owner", Text, nullable=True),
     Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
@@ -257,16 +257,16 @@ ml_model = Table(
 ml_run = Table(
     "ml_run",
     METADATA,
-    Column("id", String(255), primary_key=True),
-    Column("model_id", String(255), ForeignKey("ml_model.id"), nullable=True),
-    Column("recipe_id", String(255), ForeignKey("ml_recipe.id"), nullable=False),
-    Column("recipe_version_id", String(255), ForeignKey("ml_recipe_version.version_id"), nullable=False),
+    Column("id", String(255, collation="C"), primary_key=True),
+    Column("model_id", String(255, collation="C"), ForeignKey("ml_model.id"), nullable=True),
+    Column("recipe_id", String(255, collation="C"), ForeignKey("ml_recipe.id"), nullable=False),
+    Column("recipe_version_id", String(255, collation="C"), ForeignKey("ml_recipe_version.version_id"), nullable=False),
     Column("run_type", String(32), nullable=False),  # train|eval|backtest
     Column("status", String(32), nullable=False, default="queued"),  # queued|running|succeeded|failed
     Column("started_at", TIMESTAMP(timezone=True), nullable=True),
     Column("finished_at", TIMESTAMP(timezone=True), nullable=True),
-    Column("metrics_json", JSON, nullable=False, server_default="{}"),
-    Column("artifacts_json", JSON, nullable=False, server_default="{}"),
+    Column("metrics_json", JSONB, nullable=False, server_default="{}"),
+    Column("artifacts_json", JSONB, nullable=False, server_default="{}"),
     Column("logs_text", Text, nullable=True),
 )
 
@@ -274,24 +274,24 @@ ml_run = Table(
 ml_monitor_snapshot = Table(
     "ml_monitor_snapshot",
     METADATA,
-    Column("id", String(255), primary_key=True),
-    Column("model_id", String(255), ForeignKey("ml_model.id"), nullable=False),
+    Column("id", String(255, collation="C"), primary_key=True),
+    Column("model_id", String(255, collation="C"), ForeignKey("ml_model.id"), nullable=False),
     Column("captured_at", TIMESTAMP(timezone=True), server_default=func.now()),
-    Column("performance_metrics_json", JSON, nullable=False, server_default="{}"),
-    Column("drift_metrics_json", JSON, nullable=False, server_default="{}"),
-    Column("data_freshness_json", JSON, nullable=False, server_default="{}"),
-    Column("alerts_json", JSON, nullable=False, server_default="{}"),
+    Column("performance_metrics_json", JSONB, nullable=False, server_default="{}"),
+    Column("drift_metrics_json", JSONB, nullable=False, server_default="{}"),
+    Column("data_freshness_json", JSONB, nullable=False, server_default="{}"),
+    Column("alerts_json", JSONB, nullable=False, server_default="{}"),
 )
 
 
 ml_synthetic_example = Table(
     "ml_synthetic_example",
     METADATA,
-    Column("id", String(255), primary_key=True),
-    Column("recipe_id", String(255), ForeignKey("ml_recipe.id"), nullable=False),
-    Column("dataset_schema_json", JSON, nullable=False, server_default="{}"),
-    Column("sample_rows_json", JSON, nullable=False, server_default="[]"),
-    Column("example_run_json", JSON, nullable=False, server_default="{}"),
+    Column("id", String(255, collation="C"), primary_key=True),
+    Column("recipe_id", String(255, collation="C"), ForeignKey("ml_recipe.id"), nullable=False),
+    Column("dataset_schema_json", JSONB, nullable=False, server_default="{}"),
+    Column("sample_rows_json", JSONB, nullable=False, server_default="[]"),
+    Column("example_run_json", JSONB, nullable=False, server_default="{}"),
     Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
 )
 
@@ -300,7 +300,7 @@ ml_synthetic_example = Table(
 evaluation_pack = Table(
     "evaluation_pack",
     METADATA,
-    Column("id", String(255), primary_key=True),
+    Column("id", String(255, collation="C"), primary_key=True),
     Column("name", Text, nullable=False),
     Column("model_family", String(64), nullable=False),  # pricing|next_best_action|location_scoring|forecasting
     Column("status", String(32), nullable=False, default="draft"),  # draft|approved|archived
@@ -313,8 +313,8 @@ evaluation_pack = Table(
 evaluation_pack_version = Table(
     "evaluation_pack_version",
     METADATA,
-    Column("version_id", String(255), primary_key=True),
-    Column("pack_id", String(255), ForeignKey("evaluation_pack.id"), nullable=False),
+    Column("version_id", String(255, collation="C"), primary_key=True),
+    Column("pack_id", String(255, collation="C"), ForeignKey("evaluation_pack.id"), nullable=False),
     Column("version_number", String(64), nullable=False),
     Column("pack_json", JSON, nullable=False, server_default="{}"),
     Column("diff_from_prev", JSON, nullable=True),
@@ -327,8 +327,8 @@ evaluation_pack_version = Table(
 recipe_evaluation_pack = Table(
     "recipe_evaluation_pack",
     METADATA,
-    Column("recipe_id", String(255), ForeignKey("ml_recipe.id"), nullable=False),
-    Column("pack_id", String(255), ForeignKey("evaluation_pack.id"), nullable=False),
+    Column("recipe_id", String(255, collation="C"), ForeignKey("ml_recipe.id"), nullable=False),
+    Column("pack_id", String(255, collation="C"), ForeignKey("evaluation_pack.id"), nullable=False),
     Column("created_at", TIMESTAMP(timezone=True), server_default=func.now()),
 )
 
@@ -336,13 +336,13 @@ recipe_evaluation_pack = Table(
 evaluation_result = Table(
     "evaluation_result",
     METADATA,
-    Column("id", String(255), primary_key=True),
-    Column("run_id", String(255), ForeignKey("ml_run.id"), nullable=False),
-    Column("pack_id", String(255), ForeignKey("evaluation_pack.id"), nullable=False),
-    Column("pack_version_id", String(255), ForeignKey("evaluation_pack_version.version_id"), nullable=False),
+    Column("id", String(255, collation="C"), primary_key=True),
+    Column("run_id", String(255, collation="C"), ForeignKey("ml_run.id"), nullable=False),
+    Column("pack_id", String(255, collation="C"), ForeignKey("evaluation_pack.id"), nullable=False),
+    Column("pack_version_id", String(255, collation="C"), ForeignKey("evaluation_pack_version.version_id"), nullable=False),
     Column("executed_at", TIMESTAMP(timezone=True), server_default=func.now()),
     Column("status", String(32), nullable=False),  # pass|warn|fail
-    Column("results_json", JSON, nullable=False, server_default="{}"),
+    Column("results_json", JSONB, nullable=False, server_default="{}"),
     Column("summary_text", Text, nullable=True),
 )
 
@@ -350,11 +350,11 @@ evaluation_result = Table(
 monitor_evaluation_snapshot = Table(
     "monitor_evaluation_snapshot",
     METADATA,
-    Column("id", String(255), primary_key=True),
-    Column("model_id", String(255), ForeignKey("ml_model.id"), nullable=False),
+    Column("id", String(255, collation="C"), primary_key=True),
+    Column("model_id", String(255, collation="C"), ForeignKey("ml_model.id"), nullable=False),
     Column("captured_at", TIMESTAMP(timezone=True), server_default=func.now()),
-    Column("pack_id", String(255), ForeignKey("evaluation_pack.id"), nullable=False),
-    Column("pack_version_id", String(255), ForeignKey("evaluation_pack_version.version_id"), nullable=False),
+    Column("pack_id", String(255, collation="C"), ForeignKey("evaluation_pack.id"), nullable=False),
+    Column("pack_version_id", String(255, collation="C"), ForeignKey("evaluation_pack_version.version_id"), nullable=False),
     Column("status", String(32), nullable=False),  # pass|warn|fail
     Column("results_json", JSON, nullable=False, server_default="{}"),
 )
\ No newline at end of file
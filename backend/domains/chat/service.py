@@ -24,6 +24,13 @@ from llm.providers import get_provider
 
 logger = logging.getLogger(__name__)
 
+# COPY statement for ChatService.bulk_insert_messages
+CHAT_MESSAGES_COPY_SQL = (
+    "COPY chat_messages (id, conversation_id, role, content, created_at, sequence, "
+    "provider, model, tool_name, tool_input, tool_output, raw_request, raw_response) "
+    "FROM STDIN"
+)
+
 
 # Define Data Explorer tools for LLM function calling
 DATA_EXPLORER_TOOLS = [
@@ -306,6 +313,51 @@ class ChatService:
         session.refresh(message)
         return message
     
+    @staticmethod
+    def bulk_insert_messages(session: Session, messages: List[ChatMessage]) -> int:
+        """
+        Insert many messages at once (e.g. chat history imports) using COPY.
+        
+        Rows are streamed with a single COPY instead of one INSERT per
+        message, so Postgres parses and plans once. The statement-level
+        chat_messages trigger bumps each affected conversation's updated_at
+        once for the whole batch. Callers assign ``sequence`` themselves.
+        
+        Args:
+            session: Database session
+            messages: Unsaved ChatMessage instances
+            
+        Returns:
+            Number of messages inserted
+        """
+        from psycopg.types.json import Jsonb
+        
+        def jsonb(value: Optional[Dict[str, Any]]) -> Optional[Jsonb]:
+            return Jsonb(value) if value is not None else None
+        
+        conn = session.connection().connection.driver_connection
+        with conn.cursor() as cur:
+            with cur.copy(CHAT_MESSAGES_COPY_SQL) as copy:
+                for message in messages:
+                    copy.write_row((
+                        message.id,
+                        message.conversation_id,
+                        message.role,
+                        message.content,
+                        message.created_at,
+                        message.sequence,
+                        message.provider,
+                        message.model,
+                        message.tool_name,
+                        jsonb(message.tool_input),
+                        jsonb(message.tool_output),
+                        jsonb(message.raw_request),
+                        jsonb(message.raw_response)
+                    ))
+        
+        session.commit()
+        return len(messages)
+    
     @staticmethod
     def _execute_tool(tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a Data Explorer tool and return result."""
@@ -5,9 +5,11 @@ This module provides read-only access to Postgres databases for exploration.
 Supports multiple database configurations.
 """
 import os
-from typing import Optional
+import threading
+from typing import Dict, Optional
 from contextlib import contextmanager
 import psycopg
+from psycopg_pool import ConnectionPool
 from .db_configs import DatabaseConfig, get_database_config_by_id
 
 
@@ -34,11 +36,70 @@ class ExplorerDBConfig:
 config = ExplorerDBConfig()
 
 
+# Connection pools per database configuration ID. Connections are reused so
+# statements prepared on them (see service.py) survive across calls.
+EXPLORER_POOL_SIZE = int(os.getenv("EXPLORER_DB_POOL_SIZE", "5"))
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _configure_connection(conn: psycopg.Connection) -> None:
+    """Make a newly opened pool connection start every transaction READ ONLY.
+    
+    psycopg sends BEGIN READ ONLY itself, so a query that changes
+    default_transaction_read_only cannot make later transactions writable.
+    """
+    conn.read_only = True
+
+
+def _reset_connection(conn: psycopg.Connection) -> None:
+    """Drop session settings (search_path, set_config(...), ...) before a connection is reused.
+    
+    RESET ALL leaves prepared statements in place, so they still survive
+    across calls.
+    """
+    conn.execute("RESET ALL")
+    conn.commit()
+
+
+def get_explorer_pool(db_id: str = "default") -> ConnectionPool:
+    """
+    Get (creating on first use) the read-only connection pool for a database.
+    
+    Args:
+        db_id: Database configuration ID (default: "default")
+    
+    Returns:
+        ConnectionPool: Pool of read-only connections
+    """
+    pool = _pools.get(db_id)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db_id)
+            if pool is None:
+                db_config = get_database_config_by_id(db_id)
+                conn_string = f"host={db_config.host} port={db_config.port} user={db_config.user} password={db_config.password} dbname={db_config.database}"
+                pool = ConnectionPool(
+                    conn_string,
+                    min_size=1,
+                    max_size=EXPLORER_POOL_SIZE,
+                    configure=_configure_connection,
+                    reset=_reset_connection,
+                    name=f"explorer-{db_id}",
+                    open=True
+                )
+                _pools[db_id] = pool
+    return pool
+
+
 @contextmanager
 def get_explorer_connection(db_id: str = "default"):
     """
     Context manager for getting a read-only database connection.
     
+    Connections are borrowed from a per-database pool; the transaction is
+    committed (or rolled back on error) when the block exits.
+    
     Args:
         db_id: Database configuration ID (default: "default")
     
@@ -54,22 +115,8 @@ def get_explorer_connection(db_id: str = "default"):
     Raises:
         psycopg.Error: If connection fails
     """
-    conn = None
-    try:
-        # Get the database configuration
-        db_config = get_database_config_by_id(db_id)
-        
-        # Build connection string
-        conn_string = f"host={db_config.host} port={db_config.port} user={db_config.user} password={db_config.password} dbname={db_config.database}"
-        
-        conn = psycopg.connect(conn_string)
-        # Set session to read-only for safety
-        with conn.cursor() as cur:
-            cur.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+    with get_explorer_pool(db_id).connection() as conn:
         yield conn
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_db_connection(db_id: str = "default"):
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID, uuid4
 from sqlmodel import SQLModel, Field as SQLField, Column
-from sqlalchemy.dialects.postgresql import JSONB, ARRAY, JSON
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy import String, Text
 
 
@@ -89,8 +89,8 @@ class DataDictionaryEntry(SQLModel, table=True):
     
     # Technical details
     data_type: Optional[str] = SQLField(default=None, max_length=100)
-    examples: Optional[List[str]] = SQLField(default=None, sa_column=Column(JSON))
-    tags: Optional[List[str]] = SQLField(default=None, sa_column=Column(JSON))
+    examples: Optional[List[str]] = SQLField(default=None, sa_column=Column(JSONB))
+    tags: Optional[List[str]] = SQLField(default=None, sa_column=Column(JSONB))
     
     # Metadata
     source: str = SQLField(default="llm_initial", max_length=50)  # "llm_initial", "human_edited", etc.
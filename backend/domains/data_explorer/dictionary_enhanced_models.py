@@ -1,11 +1,25 @@
 """Enhanced Data Dictionary models for semantic metadata, relationships, and data quality."""
+import os
+import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 from sqlmodel import SQLModel, Field as SQLField, Column, Relationship
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY, JSON, UUID as PG_UUID
-from sqlalchemy import String, Text, Integer, Float, Boolean
+from sqlalchemy import String, Text, Integer, BigInteger, Float, Boolean, LargeBinary
+
+
+def uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit unix ms timestamp, then random bits.
+
+    Keeps primary key inserts at the right edge of the btree; matches the
+    gen_uuid_v7() server default from migration 031.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)
 
 
 class TrustTier(str, Enum):
@@ -50,7 +64,7 @@ class DictionaryAsset(SQLModel, table=True):
     
     # Primary key
     id: Optional[UUID] = SQLField(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PG_UUID(as_uuid=True), primary_key=True)
     )
     
@@ -71,6 +85,7 @@ class DictionaryAsset(SQLModel, table=True):
     owner: Optional[str] = SQLField(default=None, max_length=255)
     steward: Optional[str] = SQLField(default=None, max_length=255)
     tags: Optional[List[str]] = SQLField(default=None, sa_column=Column(JSONB))
+    tags_flat: Optional[List[str]] = SQLField(default=None, sa_column=Column(ARRAY(Text)))  # Trigger-maintained copy of tags
     
     # Trust & quality
     trust_tier: str = SQLField(default="experimental", max_length=50)
@@ -81,12 +96,12 @@ class DictionaryAsset(SQLModel, table=True):
     issue_tags: Optional[List[str]] = SQLField(default=None, sa_column=Column(JSONB))
     
     # Usage metrics (computed/aggregated)
-    query_count_30d: int = SQLField(default=0)
+    query_count_30d: int = SQLField(default=0, sa_column=Column(BigInteger, nullable=False))
     last_queried_at: Optional[datetime] = None
     
     # Technical metadata
-    row_count_estimate: Optional[int] = None
-    size_bytes: Optional[int] = None
+    row_count_estimate: Optional[int] = SQLField(default=None, sa_column=Column(BigInteger))
+    size_bytes: Optional[int] = SQLField(default=None, sa_column=Column(BigInteger))
     
     # Timestamps
     created_at: datetime = SQLField(default_factory=datetime.utcnow)
@@ -99,7 +114,7 @@ class DictionaryField(SQLModel, table=True):
     
     # Primary key
     id: Optional[UUID] = SQLField(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PG_UUID(as_uuid=True), primary_key=True)
     )
     
@@ -122,6 +137,7 @@ class DictionaryField(SQLModel, table=True):
     business_definition: Optional[str] = None
     entity_role: str = SQLField(default="other", max_length=50)
     tags: Optional[List[str]] = SQLField(default=None, sa_column=Column(JSONB))
+    tags_flat: Optional[List[str]] = SQLField(default=None, sa_column=Column(ARRAY(Text)))  # Trigger-maintained copy of tags
     
     # Trust & quality
     trust_tier: str = SQLField(default="experimental", max_length=50)
@@ -148,7 +164,7 @@ class DictionaryRelationship(SQLModel, table=True):
     
     # Primary key
     id: Optional[UUID] = SQLField(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PG_UUID(as_uuid=True), primary_key=True)
     )
     
@@ -184,7 +200,7 @@ class DictionaryProfile(SQLModel, table=True):
     
     # Primary key
     id: Optional[UUID] = SQLField(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PG_UUID(as_uuid=True), primary_key=True)
     )
     
@@ -195,15 +211,15 @@ class DictionaryProfile(SQLModel, table=True):
     column_name: str = SQLField(max_length=255, index=True)
     
     # Table-level context
-    row_count_estimate: Optional[int] = None
+    row_count_estimate: Optional[int] = SQLField(default=None, sa_column=Column(BigInteger))
     
     # Completeness
-    null_count: Optional[int] = None
+    null_count: Optional[int] = SQLField(default=None, sa_column=Column(BigInteger))
     null_fraction: Optional[float] = None
     
     # Cardinality
-    distinct_count: Optional[int] = None
-    distinct_count_estimate: Optional[int] = None
+    distinct_count: Optional[int] = SQLField(default=None, sa_column=Column(BigInteger))
+    distinct_count_estimate: Optional[int] = SQLField(default=None, sa_column=Column(BigInteger))
     uniqueness_fraction: Optional[float] = None
     
     # Numeric stats (nullable, only for numeric columns)
@@ -229,10 +245,11 @@ class DictionaryProfile(SQLModel, table=True):
     latest_value: Optional[datetime] = None
     
     # Profiling metadata
-    sample_size: Optional[int] = None  # How many rows were sampled
+    sample_size: Optional[int] = SQLField(default=None, sa_column=Column(BigInteger))  # How many rows were sampled
     sample_method: Optional[str] = SQLField(default=None, max_length=50)  # 'full', 'sample', 'tablesample'
     profile_version: int = SQLField(default=1)
     computed_at: datetime = SQLField(default_factory=datetime.utcnow, index=True)
+    is_latest: bool = SQLField(default=True)  # Maintained by a trigger; one latest row per column
 
 
 class DictionaryUsageLog(SQLModel, table=True):
@@ -240,7 +257,7 @@ class DictionaryUsageLog(SQLModel, table=True):
     __tablename__ = "dictionary_usage_logs"
     
     id: Optional[UUID] = SQLField(
-        default_factory=uuid4,
+        default_factory=uuid7,
         sa_column=Column(PG_UUID(as_uuid=True), primary_key=True)
     )
     
@@ -255,7 +272,7 @@ class DictionaryUsageLog(SQLModel, table=True):
     
     # Query context
     query_text: Optional[str] = None  # Store for analysis
-    query_hash: Optional[str] = SQLField(default=None, max_length=64, index=True)
+    query_hash: Optional[bytes] = SQLField(default=None, sa_column=Column(LargeBinary, index=True))  # SHA-256 digest
     
     # User context
     user_id: Optional[str] = SQLField(default=None, max_length=100)
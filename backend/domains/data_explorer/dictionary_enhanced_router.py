@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query as QueryParam
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlmodel import Session
 
 from db_session import get_session
@@ -22,6 +22,9 @@ from .connection import get_db_connection
 
 router = APIRouter(prefix="/data-dictionary/enhanced", tags=["Enhanced Data Dictionary"])
 
+# Matches the length CHECK constraints on curated free-text columns (migration 045)
+NOTE_MAX_LENGTH = 2000
+
 
 # ==================== Request/Response Models ====================
 
@@ -79,10 +82,10 @@ class AssetListResponse(BaseModel):
 class AssetUpdateRequest(BaseModel):
     """Request to update asset metadata."""
     business_name: Optional[str] = None
-    business_definition: Optional[str] = None
+    business_definition: Optional[str] = Field(default=None, max_length=NOTE_MAX_LENGTH)
     business_domain: Optional[str] = None
-    grain: Optional[str] = None
-    row_meaning: Optional[str] = None
+    grain: Optional[str] = Field(default=None, max_length=NOTE_MAX_LENGTH)
+    row_meaning: Optional[str] = Field(default=None, max_length=NOTE_MAX_LENGTH)
     owner: Optional[str] = None
     steward: Optional[str] = None
     tags: Optional[List[str]] = None
@@ -90,7 +93,7 @@ class AssetUpdateRequest(BaseModel):
     trust_score: Optional[int] = None
     approved_for_reporting: Optional[bool] = None
     approved_for_ml: Optional[bool] = None
-    known_issues: Optional[str] = None
+    known_issues: Optional[str] = Field(default=None, max_length=NOTE_MAX_LENGTH)
     issue_tags: Optional[List[str]] = None
 
 
@@ -125,14 +128,14 @@ class FieldResponse(BaseModel):
 class FieldUpdateRequest(BaseModel):
     """Request to update field metadata."""
     business_name: Optional[str] = None
-    business_definition: Optional[str] = None
+    business_definition: Optional[str] = Field(default=None, max_length=NOTE_MAX_LENGTH)
     entity_role: Optional[str] = None
     tags: Optional[List[str]] = None
     trust_tier: Optional[str] = None
     trust_score: Optional[int] = None
     approved_for_reporting: Optional[bool] = None
     approved_for_ml: Optional[bool] = None
-    known_issues: Optional[str] = None
+    known_issues: Optional[str] = Field(default=None, max_length=NOTE_MAX_LENGTH)
     issue_tags: Optional[List[str]] = None
 
 
@@ -168,7 +171,7 @@ class RelationshipCreateRequest(BaseModel):
     target_column: str
     cardinality: str = "unknown"
     confidence: str = "assumed"
-    notes: Optional[str] = None
+    notes: Optional[str] = Field(default=None, max_length=NOTE_MAX_LENGTH)
 
 
 class ProfileResponse(BaseModel):
@@ -239,6 +242,7 @@ def list_assets(
     search: Optional[str] = QueryParam(None),
     trust_tier: Optional[str] = QueryParam(None),
     business_domain: Optional[str] = QueryParam(None),
+    tag: Optional[str] = QueryParam(None),
     limit: int = QueryParam(100, le=500),
     offset: int = QueryParam(0, ge=0),
     session: Session = Depends(get_session)
@@ -253,6 +257,7 @@ def list_assets(
         search_term=search,
         trust_tier=trust_tier,
         business_domain=business_domain,
+        tag=tag,
         limit=limit,
         offset=offset
     )
@@ -179,6 +179,7 @@ def search_assets(
     search_term: Optional[str] = None,
     trust_tier: Optional[str] = None,
     business_domain: Optional[str] = None,
+    tag: Optional[str] = None,
     limit: int = 100,
     offset: int = 0
 ) -> Tuple[List[DictionaryAsset], int]:
@@ -204,6 +205,9 @@ def search_assets(
     if business_domain:
         query = query.where(DictionaryAsset.business_domain == business_domain)
     
+    if tag:
+        query = query.where(DictionaryAsset.tags_flat.contains([tag]))
+    
     # Get total count
     count_query = select(func.count()).select_from(query.subquery())
     total = session.exec(count_query).one()
@@ -349,9 +353,9 @@ def get_latest_profile(
             DictionaryProfile.connection_id == connection_id,
             DictionaryProfile.schema_name == schema_name,
             DictionaryProfile.table_name == table_name,
-            DictionaryProfile.column_name == column_name
+            DictionaryProfile.column_name == column_name,
+            DictionaryProfile.is_latest
         )
-        .order_by(DictionaryProfile.computed_at.desc())
     ).first()
 
 
@@ -364,35 +368,16 @@ def get_profiles_for_table(
 ) -> List[DictionaryProfile]:
     """Get profiles for all columns in a table."""
     if latest_only:
-        # Get latest profile for each column
-        # This is a bit complex - need to group by column and get max computed_at
-        subquery = (
-            select(
-                DictionaryProfile.column_name,
-                func.max(DictionaryProfile.computed_at).label('max_computed_at')
-            )
+        # Get latest profile for each column (is_latest is maintained by a trigger)
+        return list(session.exec(
+            select(DictionaryProfile)
             .where(
                 DictionaryProfile.connection_id == connection_id,
                 DictionaryProfile.schema_name == schema_name,
-                DictionaryProfile.table_name == table_name
-            )
-            .group_by(DictionaryProfile.column_name)
-            .subquery()
-        )
-        
-        query = select(DictionaryProfile).join(
-            subquery,
-            and_(
-                DictionaryProfile.column_name == subquery.c.column_name,
-                DictionaryProfile.computed_at == subquery.c.max_computed_at
+                DictionaryProfile.table_name == table_name,
+                DictionaryProfile.is_latest
             )
-        ).where(
-            DictionaryProfile.connection_id == connection_id,
-            DictionaryProfile.schema_name == schema_name,
-            DictionaryProfile.table_name == table_name
-        )
-        
-        return list(session.exec(query).all())
+        ).all())
     else:
         # Get all profiles
         return list(session.exec(
@@ -406,6 +391,34 @@ def get_profiles_for_table(
         ).all())
 
 
+def get_profile_summaries_for_table(
+    session: Session,
+    connection_id: str,
+    schema_name: str,
+    table_name: str
+) -> Dict[str, Any]:
+    """
+    Get the latest null/distinct stats for each column in a table, keyed by column name.
+    Only reads columns stored in ix_dict_profiles_latest_one, so it can be an index-only scan.
+    """
+    rows = session.exec(
+        select(
+            DictionaryProfile.column_name,
+            DictionaryProfile.null_fraction,
+            DictionaryProfile.distinct_count,
+            DictionaryProfile.distinct_count_estimate
+        )
+        .where(
+            DictionaryProfile.connection_id == connection_id,
+            DictionaryProfile.schema_name == schema_name,
+            DictionaryProfile.table_name == table_name,
+            DictionaryProfile.is_latest
+        )
+    ).all()
+    
+    return {row.column_name: row for row in rows}
+
+
 def log_usage_event(
     session: Session,
     connection_id: str,
@@ -422,7 +435,7 @@ def log_usage_event(
     
     query_hash = None
     if query_text:
-        query_hash = hashlib.sha256(query_text.encode()).hexdigest()[:64]
+        query_hash = hashlib.sha256(query_text.encode()).digest()
     
     log_entry = DictionaryUsageLog(
         connection_id=connection_id,
@@ -511,7 +524,7 @@ def get_dictionary_context(
     
     fields = get_fields_for_asset(session, asset.id)
     relationships = get_relationships_for_table(session, connection_id, schema_name, table_name)
-    profiles = get_profiles_for_table(session, connection_id, schema_name, table_name, latest_only=True)
+    profiles = get_profile_summaries_for_table(session, connection_id, schema_name, table_name)
     
     # Build context
     context = {
@@ -532,8 +545,7 @@ def get_dictionary_context(
     
     # Add column info
     for field in fields:
-        # Find profile for this field
-        profile = next((p for p in profiles if p.column_name == field.column_name), None)
+        profile = profiles.get(field.column_name)
         
         col_info = {
             "name": field.column_name,
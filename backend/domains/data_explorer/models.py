@@ -35,6 +35,7 @@ class TableRowsResponse(BaseModel):
     page: int
     page_size: int
     total_rows: Optional[int] = None
+    next_after: Optional[str] = None  # Keyset cursor for the next page
 
 
 class QueryRequest(BaseModel):
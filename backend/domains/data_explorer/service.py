@@ -21,6 +21,118 @@ FORBIDDEN_KEYWORDS = {
     'CALL', 'MERGE', 'REPLACE', 'RENAME', 'COMMENT'
 }
 
+# Precompiled validator patterns: every forbidden keyword is matched in a
+# single pass, with word boundaries to avoid false positives (e.g. an
+# "INSERTED" column name).
+FORBIDDEN_KEYWORDS_PATTERN = re.compile(
+    r'\b(' + '|'.join(sorted(FORBIDDEN_KEYWORDS)) + r')\b',
+    re.IGNORECASE
+)
+SQL_LINE_COMMENT_PATTERN = re.compile(r'--.*?(\n|$)')
+SQL_BLOCK_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# Column types profiled with MIN/MAX/AVG
+PROFILE_NUMERIC_TYPES = {
+    'integer', 'bigint', 'smallint', 'numeric', 'decimal',
+    'real', 'double precision', 'money'
+}
+
+# Column types profiled with top values
+PROFILE_TEXT_TYPES = {
+    'character varying', 'varchar', 'char', 'character', 'text', 'bpchar'
+}
+
+
+# Fixed catalog queries. They are executed with prepare=True so each pooled
+# connection parses and plans them once and reuses the server-side statement.
+SCHEMAS_SQL = """
+    SELECT 
+        schema_name,
+        (SELECT COUNT(*) 
+         FROM information_schema.tables t 
+         WHERE t.table_schema = schema_name) as table_count
+    FROM information_schema.schemata
+    WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
+    ORDER BY schema_name
+"""
+
+TABLES_SQL = """
+    SELECT 
+        n.nspname,
+        c.relname,
+        c.relkind,
+        CASE
+            WHEN c.relkind = 'p' THEN (
+                SELECT SUM(GREATEST(pc.reltuples, 0))::bigint
+                FROM pg_partition_tree(c.oid) pt
+                JOIN pg_class pc ON pc.oid = pt.relid
+                WHERE pt.isleaf
+            )
+            WHEN c.reltuples >= 0 THEN c.reltuples::bigint
+        END as row_estimate
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %s
+    AND c.relkind IN ('r', 'p', 'f', 'v', 'm')
+    AND has_table_privilege(c.oid, 'SELECT')
+    ORDER BY c.relname
+"""
+
+COLUMNS_SQL = """
+    SELECT 
+        column_name,
+        data_type,
+        is_nullable,
+        column_default,
+        ordinal_position
+    FROM information_schema.columns
+    WHERE table_schema = %s AND table_name = %s
+    ORDER BY ordinal_position
+"""
+
+PRIMARY_KEY_SQL = """
+    SELECT a.attname
+    FROM pg_index i
+    JOIN pg_attribute a
+      ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+    WHERE i.indrelid = to_regclass(format('%%I.%%I', %s, %s))
+    AND i.indisprimary
+    ORDER BY array_position(i.indkey::int2[], a.attnum)
+"""
+
+COLUMN_NAMES_SQL = """
+    SELECT column_name
+    FROM information_schema.columns
+    WHERE table_schema = %s AND table_name = %s
+    ORDER BY ordinal_position
+"""
+
+ROW_ESTIMATE_SQL = """
+    SELECT reltuples::bigint
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %s AND c.relname = %s
+"""
+
+SUMMARY_COLUMNS_SQL = """
+    SELECT 
+        column_name,
+        data_type
+    FROM information_schema.columns
+    WHERE table_schema = %s AND table_name = %s
+    ORDER BY ordinal_position
+"""
+
+PROFILE_COLUMNS_SQL = """
+    SELECT 
+        column_name,
+        data_type,
+        is_nullable
+    FROM information_schema.columns
+    WHERE table_schema = %s AND table_name = %s
+    ORDER BY ordinal_position
+"""
+
 
 class QueryValidator:
     """Validates SQL queries for read-only safety."""
@@ -36,23 +148,19 @@ class QueryValidator:
         Returns:
             Tuple of (is_safe, error_message)
         """
-        sql_upper = sql.upper().strip()
-        
         # Must start with SELECT (after removing comments and whitespace)
         # Remove SQL comments first
-        sql_no_comments = re.sub(r'--.*?(\n|$)', '', sql_upper)
-        sql_no_comments = re.sub(r'/\*.*?\*/', '', sql_no_comments, flags=re.DOTALL)
-        sql_no_comments = sql_no_comments.strip()
+        sql_no_comments = SQL_LINE_COMMENT_PATTERN.sub('', sql)
+        sql_no_comments = SQL_BLOCK_COMMENT_PATTERN.sub('', sql_no_comments)
+        leading = sql_no_comments.lstrip()[:6].upper()
         
-        if not sql_no_comments.startswith('SELECT') and not sql_no_comments.startswith('WITH'):
+        if not leading.startswith('SELECT') and not leading.startswith('WITH'):
             return False, "Only SELECT queries are allowed"
         
         # Check for forbidden keywords
-        for keyword in FORBIDDEN_KEYWORDS:
-            # Use word boundaries to avoid false positives (e.g., "INSERTED" column name)
-            pattern = r'\b' + keyword + r'\b'
-            if re.search(pattern, sql_upper):
-                return False, f"Query contains forbidden keyword: {keyword}"
+        match = FORBIDDEN_KEYWORDS_PATTERN.search(sql)
+        if match:
+            return False, f"Query contains forbidden keyword: {match.group(1).upper()}"
         
         # Additional safety: check for semicolon-separated multiple statements
         # This is a simple check; more sophisticated parsing would be better
@@ -80,16 +188,7 @@ class DataExplorerService:
         """
         with get_explorer_connection(db_id) as conn:
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT 
-                        schema_name,
-                        (SELECT COUNT(*) 
-                         FROM information_schema.tables t 
-                         WHERE t.table_schema = schema_name) as table_count
-                    FROM information_schema.schemata
-                    WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
-                    ORDER BY schema_name
-                """)
+                cur.execute(SCHEMAS_SQL, prepare=True)
                 results = cur.fetchall()
                 
         return [SchemaInfo(name=row[0], table_count=row[1]) for row in results]
@@ -108,29 +207,16 @@ class DataExplorerService:
         """
         with get_explorer_connection(db_id) as conn:
             with conn.cursor() as cur:
-                # Get tables and views
-                cur.execute("""
-                    SELECT 
-                        table_schema,
-                        table_name,
-                        table_type,
-                        (SELECT reltuples::bigint 
-                         FROM pg_class c 
-                         JOIN pg_namespace n ON n.oid = c.relnamespace
-                         WHERE n.nspname = table_schema 
-                         AND c.relname = table_name) as row_estimate
-                    FROM information_schema.tables
-                    WHERE table_schema = %s
-                    AND table_type IN ('BASE TABLE', 'VIEW')
-                    ORDER BY table_name
-                """, (schema,))
+                # Get tables and views with their row estimates in one
+                # catalog scan; partitioned tables sum their leaf partitions
+                cur.execute(TABLES_SQL, (schema,), prepare=True)
                 results = cur.fetchall()
                 
         return [
             TableInfo(
                 schema=row[0],
                 name=row[1],
-                type='table' if row[2] == 'BASE TABLE' else 'view',
+                type='view' if row[2] in ('v', 'm') else 'table',
                 row_estimate=row[3] if row[3] else None
             )
             for row in results
@@ -151,17 +237,7 @@ class DataExplorerService:
         """
         with get_explorer_connection(db_id) as conn:
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT 
-                        column_name,
-                        data_type,
-                        is_nullable,
-                        column_default,
-                        ordinal_position
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                """, (schema, table))
+                cur.execute(COLUMNS_SQL, (schema, table), prepare=True)
                 results = cur.fetchall()
                 
         return [
@@ -175,23 +251,52 @@ class DataExplorerService:
             for row in results
         ]
     
+    @staticmethod
+    def get_primary_key_columns(schema: str, table: str, db_id: str = "default") -> List[str]:
+        """
+        Get the primary key columns of a table, in key order.
+        
+        Args:
+            schema: Schema name
+            table: Table name
+            db_id: Database configuration ID
+            
+        Returns:
+            List of primary key column names (empty if the table has none)
+        """
+        with get_explorer_connection(db_id) as conn:
+            with conn.cursor() as cur:
+                cur.execute(PRIMARY_KEY_SQL, (schema, table), prepare=True)
+                results = cur.fetchall()
+                
+        return [row[0] for row in results]
+    
     @staticmethod
     def get_table_rows(
         schema: str,
         table: str,
         page: int = 1,
         page_size: int = 50,
-        db_id: str = "default"
+        db_id: str = "default",
+        key_column: Optional[str] = None,
+        after: Optional[str] = None
     ) -> TableRowsResponse:
         """
         Get paginated rows from a table.
         
+        When ``key_column`` is given, rows are paged by key instead of by
+        offset: rows with ``key_column > after`` are returned in key order
+        and ``next_after`` holds the cursor for the following page, so
+        Postgres never scans and discards skipped rows.
+        
         Args:
             schema: Schema name
             table: Table name
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored for keyset pagination)
             page_size: Number of rows per page
             db_id: Database configuration ID
+            key_column: Unique, ordered column to page by (e.g. the primary key)
+            after: Key value to continue after (None for the first page)
             
         Returns:
             Table rows response with pagination info
@@ -202,45 +307,55 @@ class DataExplorerService:
         with get_explorer_connection(db_id) as conn:
             with conn.cursor() as cur:
                 # Get column names
-                cur.execute("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                """, (schema, table))
+                cur.execute(COLUMN_NAMES_SQL, (schema, table), prepare=True)
                 columns = [row[0] for row in cur.fetchall()]
                 
                 if not columns:
                     raise ValueError(f"Table {schema}.{table} not found or has no columns")
                 
                 # Get total row count estimate
-                cur.execute("""
-                    SELECT reltuples::bigint
-                    FROM pg_class c
-                    JOIN pg_namespace n ON n.oid = c.relnamespace
-                    WHERE n.nspname = %s AND c.relname = %s
-                """, (schema, table))
+                cur.execute(ROW_ESTIMATE_SQL, (schema, table), prepare=True)
                 result = cur.fetchone()
                 total_rows = result[0] if result and result[0] else None
                 
                 # Get rows with pagination
                 # Use parameterized query with quoted identifiers
                 from psycopg import sql
-                query = sql.SQL("SELECT * FROM {}.{} LIMIT %s OFFSET %s").format(
-                    sql.Identifier(schema),
-                    sql.Identifier(table)
-                )
-                cur.execute(query, (page_size, offset))
+                if key_column is None:
+                    query = sql.SQL("SELECT * FROM {}.{} LIMIT %s OFFSET %s").format(
+                        sql.Identifier(schema),
+                        sql.Identifier(table)
+                    )
+                    cur.execute(query, (page_size, offset))
+                elif after is None:
+                    query = sql.SQL("SELECT * FROM {}.{} ORDER BY {key} LIMIT %s").format(
+                        sql.Identifier(schema),
+                        sql.Identifier(table),
+                        key=sql.Identifier(key_column)
+                    )
+                    cur.execute(query, (page_size,))
+                else:
+                    query = sql.SQL("SELECT * FROM {}.{} WHERE {key} > %s ORDER BY {key} LIMIT %s").format(
+                        sql.Identifier(schema),
+                        sql.Identifier(table),
+                        key=sql.Identifier(key_column)
+                    )
+                    cur.execute(query, (after, page_size))
                 rows = cur.fetchall()
+        
+        next_after = None
+        if key_column is not None and len(rows) == page_size:
+            next_after = str(rows[-1][columns.index(key_column)])
                 
         return TableRowsResponse(
             schema=schema,
             table=table,
             columns=columns,
-            rows=[list(row) for row in rows],
+            rows=rows,  # tuple rows are coerced to lists by the model
             page=page,
             page_size=page_size,
-            total_rows=total_rows
+            total_rows=total_rows,
+            next_after=next_after
         )
     
     @staticmethod
@@ -278,29 +393,43 @@ class DataExplorerService:
         try:
             with get_explorer_connection(db_id) as conn:
                 # Set statement timeout for safety (30 seconds)
-                with conn.cursor() as cur:
-                    cur.execute("SET statement_timeout = '30s'")
-                    
-                    # Execute the query
-                    cur.execute(sql)
+                conn.execute("SET LOCAL statement_timeout = '30s'")
+                
+                # Run the query through a server-side cursor so only the
+                # requested page crosses the wire: skipped rows and the
+                # remainder are counted with MOVE instead of being fetched.
+                from psycopg import sql as pgsql
+                cursor_name = "explorer_query"
+                move = pgsql.SQL("MOVE FORWARD {count} FROM {cursor}")
+                offset = (page - 1) * page_size
+                
+                with conn.cursor(name=cursor_name) as cur:
+                    cur.execute(sql.strip().rstrip(';'))
                     
                     # Get column names
                     columns = [desc[0] for desc in cur.description] if cur.description else []
                     
-                    # Fetch all results (we'll apply pagination in memory for simplicity)
-                    # For very large result sets, this could be optimized
-                    all_rows = cur.fetchall()
+                    skipped = 0
+                    if offset:
+                        skipped = conn.execute(move.format(
+                            count=pgsql.Literal(offset),
+                            cursor=pgsql.Identifier(cursor_name)
+                        )).rowcount
+                    
+                    paginated_rows = cur.fetchmany(page_size)
                     
-                    # Apply pagination
-                    offset = (page - 1) * page_size
-                    paginated_rows = all_rows[offset:offset + page_size]
+                    remaining = conn.execute(move.format(
+                        count=pgsql.SQL("ALL"),
+                        cursor=pgsql.Identifier(cursor_name)
+                    )).rowcount
+                    total_rows = skipped + len(paginated_rows) + remaining
                     
                     execution_time = (time.time() - start_time) * 1000  # ms
                     
             return QueryResponse(
                 columns=columns,
-                rows=[list(row) for row in paginated_rows],
-                total_rows_estimate=len(all_rows),
+                rows=paginated_rows,  # tuple rows are coerced to lists by the model
+                total_rows_estimate=total_rows,
                 execution_time_ms=round(execution_time, 2),
                 error=None
             )
@@ -319,6 +448,128 @@ class DataExplorerService:
                 error={"message": str(e), "code": error_code}
             )
     
+    @staticmethod
+    def execute_query_json(
+        sql: str,
+        page: int = 1,
+        page_size: int = 100,
+        db_id: str = "default"
+    ) -> Dict[str, Any]:
+        """
+        Execute a read-only SQL query and have Postgres encode the page as JSON.
+        
+        The query is wrapped so the server paginates and aggregates the rows
+        into a single JSON text value; the driver never materializes the
+        result set as Python objects. Intended for callers that only need
+        to forward the encoded rows (e.g. the MCP server).
+        
+        Only the requested page (plus one probe row) is read from the query,
+        so the total is not counted: has_more tells whether a next page
+        exists, and total_rows_estimate is known only on the last page.
+        
+        Args:
+            sql: SQL query to execute
+            page: Page number (1-indexed)
+            page_size: Number of rows per page
+            db_id: Database configuration ID
+            
+        Returns:
+            Dict with columns, row_count, rows_json (a JSON array of row
+            arrays, as text), has_more, total_rows_estimate,
+            execution_time_ms and error
+        """
+        is_safe, error_msg = QueryValidator.is_safe_query(sql)
+        if not is_safe:
+            return {
+                "columns": [],
+                "row_count": 0,
+                "rows_json": "[]",
+                "has_more": False,
+                "total_rows_estimate": None,
+                "execution_time_ms": 0,
+                "error": {"message": error_msg, "code": "UNSAFE_QUERY"}
+            }
+        
+        from psycopg import sql as pgsql
+        
+        offset = (page - 1) * page_size
+        
+        # The user query is embedded as a CTE; the newline keeps a trailing
+        # line comment from swallowing the closing parenthesis. The page is
+        # read with one extra probe row to tell whether another page follows.
+        # The LIMIT 0 header joined in (it reads no rows) gives the result the
+        # query's own columns first, so their names come from the description
+        # even when the page is empty.
+        wrapped = pgsql.SQL("""
+            WITH q AS (
+            {query}
+            ),
+            page AS (
+                SELECT row_number() OVER () AS rn, q AS r
+                FROM q
+                LIMIT {probe} OFFSET {offset}
+            )
+            SELECT header.*, p.probe_count, p.rows_json
+            FROM (
+                SELECT
+                    COUNT(*) AS probe_count,
+                    COALESCE(json_agg(
+                        (SELECT json_agg(e.value ORDER BY e.ordinality)
+                         FROM json_each(row_to_json(page.r)) WITH ORDINALITY e)
+                        ORDER BY page.rn) FILTER (WHERE page.rn <= {last}), '[]'::json)::text AS rows_json
+                FROM page
+            ) p
+            LEFT JOIN (SELECT * FROM q LIMIT 0) header ON false
+        """).format(
+            query=pgsql.SQL(sql.strip().rstrip(';')),
+            probe=pgsql.Literal(page_size + 1),
+            offset=pgsql.Literal(offset),
+            last=pgsql.Literal(offset + page_size)
+        )
+        
+        start_time = time.time()
+        
+        try:
+            with get_explorer_connection(db_id) as conn:
+                # Set statement timeout for safety (30 seconds)
+                with conn.cursor() as cur:
+                    cur.execute("SET LOCAL statement_timeout = '30s'")
+                    cur.execute(wrapped)
+                    columns = [desc.name for desc in cur.description[:-2]]
+                    *_, probe_count, rows_json = cur.fetchone()
+                    
+                    execution_time = (time.time() - start_time) * 1000  # ms
+            
+            has_more = probe_count > page_size
+            row_count = min(probe_count, page_size)
+            # A page past the end does not tell where the rows ended
+            known_total = not has_more and (row_count or not offset)
+            return {
+                "columns": columns,
+                "row_count": row_count,
+                "rows_json": rows_json,
+                "has_more": has_more,
+                "total_rows_estimate": offset + row_count if known_total else None,
+                "execution_time_ms": round(execution_time, 2),
+                "error": None
+            }
+            
+        except Exception as e:
+            execution_time = (time.time() - start_time) * 1000
+            
+            # Extract error code if available
+            error_code = getattr(e, 'pgcode', None) or 'DB_ERROR'
+            
+            return {
+                "columns": [],
+                "row_count": 0,
+                "rows_json": "[]",
+                "has_more": False,
+                "total_rows_estimate": None,
+                "execution_time_ms": round(execution_time, 2),
+                "error": {"message": str(e), "code": error_code}
+            }
+    
     @staticmethod
     def get_table_summary(schema: str, table: str, db_id: str = "default") -> TableSummaryResponse:
         """
@@ -335,14 +586,7 @@ class DataExplorerService:
         with get_explorer_connection(db_id) as conn:
             with conn.cursor() as cur:
                 # Get column info
-                cur.execute("""
-                    SELECT 
-                        column_name,
-                        data_type
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                """, (schema, table))
+                cur.execute(SUMMARY_COLUMNS_SQL, (schema, table), prepare=True)
                 columns = cur.fetchall()
                 
                 column_stats = {}
@@ -399,6 +643,122 @@ class DataExplorerService:
             column_stats=column_stats
         )
     
+    @staticmethod
+    def _build_profile_query(
+        schema: str,
+        table: str,
+        columns: List[Tuple[str, str]],
+        distinct: bool = True
+    ):
+        """
+        Build a single-scan aggregate query profiling every given column.
+        
+        Each column contributes COUNT(col) and COUNT(DISTINCT col), plus
+        MIN/MAX/AVG for numeric types (money cast to numeric), so the heap
+        is read once regardless of column count.
+        
+        Args:
+            schema: Schema name
+            table: Table name
+            columns: List of (column_name, data_type) tuples
+            distinct: Include COUNT(DISTINCT col), which fails for types
+                without an equality operator (e.g. json)
+            
+        Returns:
+            Tuple of (composed query, list of (column_name, stat_key) slots
+            matching the result row positions after the leading COUNT(*))
+        """
+        from psycopg import sql
+        
+        select_items = [sql.SQL("COUNT(*)")]
+        slots = []
+        
+        for col_name, data_type in columns:
+            col = sql.Identifier(col_name)
+            select_items.append(sql.SQL("COUNT({})").format(col))
+            slots.append((col_name, 'non_null_count'))
+            if distinct:
+                select_items.append(sql.SQL("COUNT(DISTINCT {})").format(col))
+                slots.append((col_name, 'approx_distinct_count'))
+            
+            if data_type in PROFILE_NUMERIC_TYPES:
+                # money has MIN/MAX but no AVG, and loads as a currency string
+                value = sql.SQL("{}::numeric").format(col) if data_type == 'money' else col
+                select_items.append(sql.SQL("MIN({})").format(value))
+                slots.append((col_name, 'min'))
+                select_items.append(sql.SQL("MAX({})").format(value))
+                slots.append((col_name, 'max'))
+                select_items.append(sql.SQL("AVG({})").format(value))
+                slots.append((col_name, 'avg'))
+        
+        query = sql.SQL("SELECT {items} FROM {schema}.{table}").format(
+            items=sql.SQL(", ").join(select_items),
+            schema=sql.Identifier(schema),
+            table=sql.Identifier(table)
+        )
+        return query, slots
+    
+    @staticmethod
+    def _build_top_values_query(schema: str, table: str, col_names: List[str], max_distinct: int):
+        """
+        Build a GROUPING SETS query returning the top values of several columns.
+        
+        All categorical columns are grouped in one scan; a window function
+        keeps the top ``max_distinct`` values per column.
+        
+        Args:
+            schema: Schema name
+            table: Table name
+            col_names: Columns to compute top values for
+            max_distinct: Maximum number of values to keep per column
+            
+        Returns:
+            Composed query yielding (column_index, value, count) rows
+        """
+        from psycopg import sql
+        
+        idents = [sql.Identifier(name) for name in col_names]
+        set_index = sql.SQL(" ").join(
+            sql.SQL("WHEN GROUPING({col}) = 0 THEN {idx}").format(col=col, idx=sql.Literal(i))
+            for i, col in enumerate(idents)
+        )
+        set_value = sql.SQL(" ").join(
+            sql.SQL("WHEN GROUPING({col}) = 0 THEN {col}::text").format(col=col)
+            for col in idents
+        )
+        grouping_sets = sql.SQL(", ").join(
+            sql.SQL("({})").format(col) for col in idents
+        )
+        
+        return sql.SQL("""
+            SELECT col_idx, value, count
+            FROM (
+                SELECT
+                    col_idx,
+                    value,
+                    count,
+                    ROW_NUMBER() OVER (PARTITION BY col_idx ORDER BY count DESC) AS rn
+                FROM (
+                    SELECT
+                        CASE {set_index} END AS col_idx,
+                        CASE {set_value} END AS value,
+                        COUNT(*) AS count
+                    FROM {schema}.{table}
+                    GROUP BY GROUPING SETS ({grouping_sets})
+                ) grouped
+                WHERE value IS NOT NULL
+            ) ranked
+            WHERE rn <= {limit}
+            ORDER BY col_idx, rn
+        """).format(
+            set_index=set_index,
+            set_value=set_value,
+            schema=sql.Identifier(schema),
+            table=sql.Identifier(table),
+            grouping_sets=grouping_sets,
+            limit=sql.Literal(max_distinct)
+        )
+    
     @staticmethod
     def profile_table(
         schema: str,
@@ -409,6 +769,10 @@ class DataExplorerService:
         """
         Generate detailed profile for a table with enhanced statistics.
         
+        Null counts, distinct counts and numeric min/max/avg for all columns
+        are computed in a single table scan; top values for categorical
+        columns come from one additional GROUPING SETS query.
+        
         Args:
             schema: Schema name
             table: Table name
@@ -418,122 +782,107 @@ class DataExplorerService:
         Returns:
             Dict with comprehensive per-column profile
         """
+        import psycopg
+        
         with get_explorer_connection(db_id) as conn:
             with conn.cursor() as cur:
                 # Get column info
-                cur.execute("""
-                    SELECT 
-                        column_name,
-                        data_type,
-                        is_nullable
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                """, (schema, table))
+                cur.execute(PROFILE_COLUMNS_SQL, (schema, table), prepare=True)
                 columns = cur.fetchall()
                 
-                # Get total row count
-                from psycopg import sql
-                count_query = sql.SQL("SELECT COUNT(*) FROM {}.{}").format(
-                    sql.Identifier(schema),
-                    sql.Identifier(table)
-                )
-                cur.execute(count_query)
-                total_rows = cur.fetchone()[0]
-                
-                column_profiles = {}
-                
-                for col_name, data_type, is_nullable in columns:
-                    profile = {
+                column_profiles = {
+                    col_name: {
                         "data_type": data_type,
                         "nullable": is_nullable == "YES"
                     }
-                    
-                    # Get null count and null fraction
-                    try:
-                        null_query = sql.SQL("""
-                            SELECT 
-                                COUNT(*) - COUNT({col}) as null_count,
-                                CASE WHEN COUNT(*) > 0 
-                                     THEN (COUNT(*) - COUNT({col}))::float / COUNT(*) 
-                                     ELSE 0 
-                                END as null_fraction
-                            FROM {schema}.{table}
-                        """).format(
-                            col=sql.Identifier(col_name),
-                            schema=sql.Identifier(schema),
-                            table=sql.Identifier(table)
+                    for col_name, data_type, is_nullable in columns
+                }
+                stats = {col_name: {} for col_name, _, _ in columns}
+                typed_columns = [(col_name, data_type) for col_name, data_type, _ in columns]
+                
+                # One scan for every column's aggregates
+                query, slots = DataExplorerService._build_profile_query(schema, table, typed_columns)
+                try:
+                    cur.execute(query)
+                    row = cur.fetchone()
+                    total_rows = row[0]
+                    for (col_name, key), value in zip(slots, row[1:]):
+                        stats[col_name][key] = value
+                except psycopg.Error:
+                    # Some column type (e.g. json) lacks an equality operator;
+                    # fall back to per-column queries, with the distinct count
+                    # on its own so a failing one keeps the null counts.
+                    conn.rollback()
+                    from psycopg import sql
+                    count_query = sql.SQL("SELECT COUNT(*) FROM {}.{}").format(
+                        sql.Identifier(schema),
+                        sql.Identifier(table)
+                    )
+                    cur.execute(count_query)
+                    total_rows = cur.fetchone()[0]
+                    for col_name, data_type in typed_columns:
+                        col_query, col_slots = DataExplorerService._build_profile_query(
+                            schema, table, [(col_name, data_type)], distinct=False
+                        )
+                        distinct_query = sql.SQL("SELECT COUNT(DISTINCT {}) FROM {}.{}").format(
+                            sql.Identifier(col_name),
+                            sql.Identifier(schema),
+                            sql.Identifier(table)
                         )
-                        cur.execute(null_query)
-                        null_count, null_fraction = cur.fetchone()
+                        try:
+                            cur.execute(col_query)
+                            col_row = cur.fetchone()
+                            for (_, key), value in zip(col_slots, col_row[1:]):
+                                stats[col_name][key] = value
+                        except psycopg.Error:
+                            conn.rollback()
+                        try:
+                            cur.execute(distinct_query)
+                            stats[col_name]['approx_distinct_count'] = cur.fetchone()[0]
+                        except psycopg.Error:
+                            conn.rollback()
+                
+                for col_name, data_type in typed_columns:
+                    profile = column_profiles[col_name]
+                    col_stats = stats[col_name]
+                    
+                    non_null_count = col_stats.get('non_null_count')
+                    if non_null_count is not None:
+                        null_count = total_rows - non_null_count
                         profile['null_count'] = null_count
-                        profile['null_fraction'] = round(float(null_fraction), 4) if null_fraction else 0.0
-                    except:
+                        profile['null_fraction'] = round(null_count / total_rows, 4) if total_rows else 0.0
+                    else:
                         profile['null_count'] = None
                         profile['null_fraction'] = None
                     
-                    # Get distinct count (approximate)
+                    profile['approx_distinct_count'] = col_stats.get('approx_distinct_count')
+                    
+                    if data_type in PROFILE_NUMERIC_TYPES and 'min' in col_stats:
+                        for key in ('min', 'max', 'avg'):
+                            value = col_stats[key]
+                            profile[key] = float(value) if value is not None else None
+                
+                # Top values for categorical columns with a reasonable distinct count
+                topk_columns = [
+                    col_name for col_name, data_type in typed_columns
+                    if data_type in PROFILE_TEXT_TYPES
+                    and column_profiles[col_name].get('approx_distinct_count') is not None
+                    and column_profiles[col_name]['approx_distinct_count'] <= max_distinct * 2
+                ]
+                if topk_columns:
                     try:
-                        distinct_query = sql.SQL("""
-                            SELECT COUNT(DISTINCT {col})
-                            FROM {schema}.{table}
-                        """).format(
-                            col=sql.Identifier(col_name),
-                            schema=sql.Identifier(schema),
-                            table=sql.Identifier(table)
+                        topk_query = DataExplorerService._build_top_values_query(
+                            schema, table, topk_columns, max_distinct
                         )
-                        cur.execute(distinct_query)
-                        profile['approx_distinct_count'] = cur.fetchone()[0]
-                    except:
-                        profile['approx_distinct_count'] = None
-                    
-                    # Numeric column statistics
-                    if data_type in ('integer', 'bigint', 'smallint', 'numeric', 'decimal', 'real', 'double precision', 'money'):
-                        try:
-                            stats_query = sql.SQL("""
-                                SELECT 
-                                    MIN({col}),
-                                    MAX({col}),
-                                    AVG({col})
-                                FROM {schema}.{table}
-                                WHERE {col} IS NOT NULL
-                            """).format(
-                                col=sql.Identifier(col_name),
-                                schema=sql.Identifier(schema),
-                                table=sql.Identifier(table)
+                        cur.execute(topk_query)
+                        for col_name in topk_columns:
+                            column_profiles[col_name]['top_values'] = []
+                        for col_idx, value, count in cur.fetchall():
+                            column_profiles[topk_columns[col_idx]]['top_values'].append(
+                                {"value": value, "count": count}
                             )
-                            cur.execute(stats_query)
-                            min_val, max_val, avg_val = cur.fetchone()
-                            profile['min'] = float(min_val) if min_val is not None else None
-                            profile['max'] = float(max_val) if max_val is not None else None
-                            profile['avg'] = float(avg_val) if avg_val is not None else None
-                        except:
-                            pass
-                    
-                    # Categorical/text column - get top values
-                    if data_type in ('character varying', 'varchar', 'char', 'character', 'text', 'bpchar'):
-                        try:
-                            # Only get top values if distinct count is reasonable
-                            if profile.get('approx_distinct_count', 0) <= max_distinct * 2:
-                                topk_query = sql.SQL("""
-                                    SELECT {col}, COUNT(*) as count
-                                    FROM {schema}.{table}
-                                    WHERE {col} IS NOT NULL
-                                    GROUP BY {col}
-                                    ORDER BY count DESC
-                                    LIMIT %s
-                                """).format(
-                                    col=sql.Identifier(col_name),
-                                    schema=sql.Identifier(schema),
-                                    table=sql.Identifier(table)
-                                )
-                                cur.execute(topk_query, (max_distinct,))
-                                top_values = [{"value": str(row[0]), "count": row[1]} for row in cur.fetchall()]
-                                profile['top_values'] = top_values
-                        except:
-                            pass
-                    
-                    column_profiles[col_name] = profile
+                    except psycopg.Error:
+                        conn.rollback()
                 
                 return {
                     "schema": schema,
@@ -541,4 +890,3 @@ class DataExplorerService:
                     "total_rows": total_rows,
                     "column_profiles": column_profiles
                 }
-
@@ -116,7 +116,7 @@ class EvaluationPackVersionBase(BaseModel):
     pack_id: str
     version_number: str
     pack_json: PackDefinition
-    change_note: Optional[str] = None
+    change_note: Optional[str] = Field(default=None, max_length=2000)
     created_by: Optional[str] = "system"
     
     model_config = ConfigDict(from_attributes=True, protected_namespaces=())
@@ -26,11 +26,29 @@ Safety features:
 """
 
 import asyncio
-import json
+import functools
+import hashlib
 import os
+import re
+import stat
 import sys
+import threading
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import orjson
+from cachetools import TTLCache
+from pydantic import Field, create_model
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
 
 # Add parent directory to path to import from domains
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -40,6 +58,7 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from domains.data_explorer.db_configs import get_database_configs, get_database_config_by_id
+from domains.data_explorer.models import ColumnInfo, SchemaInfo, TableInfo
 from domains.data_explorer.service import DataExplorerService
 
 # Setup logging
@@ -52,19 +71,88 @@ logger = logging.getLogger("mcp_postgres_server")
 # Initialize MCP server
 app = Server("postgres-data-explorer")
 
+# Catalog metadata changes rarely; cache it so repeated exploration calls
+# from an LLM session don't re-query information_schema every time.
+METADATA_CACHE_TTL = int(os.getenv("MCP_METADATA_CACHE_TTL", "60"))
+_metadata_cache: TTLCache = TTLCache(maxsize=4096, ttl=METADATA_CACHE_TTL)
+
+# Tools run in worker threads; cachetools caches are not thread-safe
+_cache_lock = threading.Lock()
+
+
+def cached_metadata(fn):
+    """Cache a metadata handler's result keyed by its name and arguments.
+
+    Exceptions propagate without being cached, so a failed lookup is
+    retried on the next call.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__,) + args + tuple(sorted(kwargs.items()))
+        with _cache_lock:
+            result = _metadata_cache.get(key)
+        if result is not None:
+            return result
+        result = fn(*args, **kwargs)
+        with _cache_lock:
+            _metadata_cache[key] = result
+        return result
+    return wrapper
+
+
+# LLM sessions repeat the same exploration queries (counts, DISTINCTs) many
+# times; successful run_query pages are cached briefly, bounded by the total
+# size of their encoded rows.
+QUERY_CACHE_TTL = int(os.getenv("MCP_QUERY_CACHE_TTL", "30"))
+QUERY_CACHE_MAX_BYTES = int(os.getenv("MCP_QUERY_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+_query_cache: TTLCache = TTLCache(
+    maxsize=QUERY_CACHE_MAX_BYTES,
+    ttl=QUERY_CACHE_TTL,
+    getsizeof=lambda response: len(response["rows_json"]) + 1
+)
+
+# Quoted literals/identifiers are kept verbatim when normalizing SQL
+_SQL_QUOTED_PATTERN = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+_SQL_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _collapse_whitespace(match: re.Match) -> str:
+    # Keep a line break so "-- comment" text can't absorb the following line
+    return '\n' if '\n' in match.group() else ' '
+
+
+def query_cache_key(connection_id: str, sql: str, page: int, page_size: int) -> tuple:
+    """Build a run_query cache key from the whitespace-normalized SQL."""
+    parts = _SQL_QUOTED_PATTERN.split(sql.strip().rstrip(';').rstrip())
+    normalized = ''.join(
+        part if i % 2 else _SQL_WHITESPACE_PATTERN.sub(_collapse_whitespace, part)
+        for i, part in enumerate(parts)
+    )
+    digest = hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+    return (connection_id, digest, page, page_size)
+
+
+# orjson output options: pretty-printed like the previous json.dumps(indent=2)
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+# Catalog models with only scalar fields; pydantic-core serializes these to
+# JSON directly in compiled code, skipping the intermediate model_dump() dict.
+COMPILED_JSON_MODELS = (SchemaInfo, TableInfo, ColumnInfo)
+
 
-def serialize_for_json(obj: Any) -> Any:
-    """Convert objects to JSON-serializable format."""
+def json_default(obj: Any) -> Any:
+    """Fallback encoder for values orjson can't serialize natively."""
+    if isinstance(obj, COMPILED_JSON_MODELS):
+        return orjson.Fragment(obj.model_dump_json())
     if hasattr(obj, 'model_dump'):
         return obj.model_dump()
-    elif hasattr(obj, '__dict__'):
-        return obj.__dict__
-    elif isinstance(obj, (list, tuple)):
-        return [serialize_for_json(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: serialize_for_json(v) for k, v in obj.items()}
-    else:
-        return obj
+    return str(obj)
+
+
+def encode_json(obj: Any) -> str:
+    """Encode a tool result as indented JSON text."""
+    return orjson.dumps(obj, default=json_default, option=JSON_OPTIONS).decode()
 
 
 @app.list_tools()
@@ -190,6 +278,13 @@ async def list_tools() -> List[Tool]:
                         "description": "Number of rows to skip (default: 0)",
                         "default": 0,
                         "minimum": 0
+                    },
+                    "after": {
+                        "type": "string",
+                        "description": (
+                            "Continue after this primary key value; pass the "
+                            "previous response's next_after to fetch the next page"
+                        )
                     }
                 },
                 "required": ["schema", "table"]
@@ -239,7 +334,7 @@ async def list_tools() -> List[Tool]:
             description=(
                 "Execute a custom SQL query (SELECT only, read-only). "
                 "Enforces safety: only SELECT/WITH queries allowed, no mutations. "
-                "Returns columns, rows, execution time, and row count. "
+                "Returns columns, rows, execution time, row count, and whether more pages follow. "
                 "Query timeout is 30 seconds. Maximum page size is 1000 rows. "
                 "Use this for custom analysis after exploring table structures."
             ),
@@ -282,55 +377,11 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     try:
         logger.info(f"Executing tool: {name} with arguments: {arguments}")
         
-        if name == "list_connections":
-            result = handle_list_connections()
-            
-        elif name == "list_schemas":
-            connection_id = arguments.get("connection_id", "default")
-            result = handle_list_schemas(connection_id)
-            
-        elif name == "list_tables":
-            connection_id = arguments.get("connection_id", "default")
-            schema = arguments.get("schema", "public")
-            result = handle_list_tables(connection_id, schema)
-            
-        elif name == "get_table_info":
-            connection_id = arguments.get("connection_id", "default")
-            schema = arguments["schema"]
-            table = arguments["table"]
-            result = handle_get_table_info(connection_id, schema, table)
-            
-        elif name == "sample_rows":
-            connection_id = arguments.get("connection_id", "default")
-            schema = arguments["schema"]
-            table = arguments["table"]
-            limit = arguments.get("limit", 50)
-            offset = arguments.get("offset", 0)
-            result = handle_sample_rows(connection_id, schema, table, limit, offset)
-            
-        elif name == "profile_table":
-            connection_id = arguments.get("connection_id", "default")
-            schema = arguments["schema"]
-            table = arguments["table"]
-            max_distinct = arguments.get("max_distinct", 50)
-            result = handle_profile_table(connection_id, schema, table, max_distinct)
-            
-        elif name == "run_query":
-            connection_id = arguments.get("connection_id", "default")
-            sql = arguments["sql"]
-            page = arguments.get("page", 1)
-            page_size = arguments.get("page_size", 100)
-            result = handle_run_query(connection_id, sql, page, page_size)
-            
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-        
-        # Convert result to JSON string
-        result_json = json.dumps(result, indent=2, default=str)
+        result = await run_tool(name, arguments)
         
         return [TextContent(
             type="text",
-            text=result_json
+            text=encode_json(result)
         )]
         
     except Exception as e:
@@ -343,10 +394,53 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         }
         return [TextContent(
             type="text",
-            text=json.dumps(error_result, indent=2)
+            text=encode_json(error_result)
         )]
 
 
+# Tool calls currently executing, keyed by tool name and canonical arguments
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+async def run_tool(name: str, arguments: Dict[str, Any]) -> Any:
+    """Run a tool in a worker thread, coalescing identical concurrent calls.
+    
+    When the same tool is called with the same arguments while an earlier
+    call is still running (e.g. parallel tool use by the LLM), the later
+    caller awaits the first call's result instead of querying Postgres again.
+    
+    The call runs in its own task that every caller awaits through a shield,
+    so a cancelled caller stops waiting without cancelling the shared call
+    for the others (the worker thread could not be stopped anyway).
+    """
+    key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(dispatch_tool, name, arguments))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_finish_tool_call, key))
+    return await asyncio.shield(task)
+
+
+def _finish_tool_call(key: tuple, task: asyncio.Future) -> None:
+    """Forget a finished tool call so the next identical call runs afresh."""
+    del _inflight[key]
+    # Mark retrieved so an exception nobody is still awaiting isn't logged
+    if not task.cancelled():
+        task.exception()
+
+
+def dispatch_tool(name: str, arguments: Dict[str, Any]) -> Any:
+    """Validate a tool call's arguments and route it to its handler."""
+    tool = TOOLS.get(name)
+    if tool is None:
+        raise ValueError(f"Unknown tool: {name}")
+    handler, args_model = tool
+    args = args_model(**(arguments or {}))
+    return handler(**args.model_dump())
+
+
+@cached_metadata
 def handle_list_connections() -> List[Dict[str, Any]]:
     """Handle list_connections tool."""
     configs = get_database_configs()
@@ -362,39 +456,68 @@ def handle_list_connections() -> List[Dict[str, Any]]:
     ]
 
 
-def handle_list_schemas(connection_id: str) -> List[Dict[str, Any]]:
+@cached_metadata
+def handle_list_schemas(connection_id: str) -> List[SchemaInfo]:
     """Handle list_schemas tool."""
-    schemas = DataExplorerService.get_schemas(db_id=connection_id)
-    return [serialize_for_json(schema) for schema in schemas]
+    return DataExplorerService.get_schemas(db_id=connection_id)
 
 
-def handle_list_tables(connection_id: str, schema: str) -> List[Dict[str, Any]]:
+def handle_list_tables(connection_id: str, schema: str) -> List[TableInfo]:
     """Handle list_tables tool."""
-    tables = DataExplorerService.get_tables(schema=schema, db_id=connection_id)
-    return [serialize_for_json(table) for table in tables]
+    return DataExplorerService.get_tables(schema=schema, db_id=connection_id)
 
 
+@cached_metadata
 def handle_get_table_info(connection_id: str, schema: str, table: str) -> Dict[str, Any]:
     """Handle get_table_info tool."""
     columns = DataExplorerService.get_columns(schema=schema, table=table, db_id=connection_id)
     return {
         "schema": schema,
         "table": table,
-        "columns": [serialize_for_json(col) for col in columns]
+        "columns": columns
     }
 
 
+@cached_metadata
+def get_primary_key_columns(connection_id: str, schema: str, table: str) -> List[str]:
+    """Look up a table's primary key columns."""
+    return DataExplorerService.get_primary_key_columns(
+        schema=schema,
+        table=table,
+        db_id=connection_id
+    )
+
+
 def handle_sample_rows(
     connection_id: str,
     schema: str,
     table: str,
     limit: int,
-    offset: int
+    offset: int,
+    after: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Handle sample_rows tool."""
+    """Handle sample_rows tool.
+    
+    Tables with a single-column primary key are paged by key (keyset
+    pagination) unless an explicit offset is requested; the response's
+    next_after is the cursor for the following page.
+    """
+    page_size = min(limit, 500)
+    
+    pk_columns = get_primary_key_columns(connection_id, schema, table)
+    if len(pk_columns) == 1 and (after is not None or offset == 0):
+        result = DataExplorerService.get_table_rows(
+            schema=schema,
+            table=table,
+            page_size=page_size,
+            db_id=connection_id,
+            key_column=pk_columns[0],
+            after=after
+        )
+        return result.model_dump()
+    
     # Convert limit/offset to page/page_size for the service
     page = (offset // limit) + 1
-    page_size = min(limit, 500)
     
     result = DataExplorerService.get_table_rows(
         schema=schema,
@@ -403,7 +526,7 @@ def handle_sample_rows(
         page_size=page_size,
         db_id=connection_id
     )
-    return serialize_for_json(result)
+    return result.model_dump()
 
 
 def handle_profile_table(
@@ -428,28 +551,138 @@ def handle_run_query(
     page: int,
     page_size: int
 ) -> Dict[str, Any]:
-    """Handle run_query tool."""
-    result = DataExplorerService.execute_query(
-        sql=sql,
-        page=page,
-        page_size=page_size,
-        db_id=connection_id
-    )
+    """Handle run_query tool.
+    
+    Rows are JSON-encoded by Postgres and embedded into the response as a
+    pre-encoded fragment, so they are never decoded into Python objects.
+    Successful pages are served from a short-lived cache on repeat calls.
+    """
+    cache_key = query_cache_key(connection_id, sql, page, page_size)
+    with _cache_lock:
+        result = _query_cache.get(cache_key)
+    if result is None:
+        result = DataExplorerService.execute_query_json(
+            sql=sql,
+            page=page,
+            page_size=page_size,
+            db_id=connection_id
+        )
+        if not result["error"]:
+            try:
+                with _cache_lock:
+                    _query_cache[cache_key] = result
+            except ValueError:
+                # Larger than the whole cache; serve it uncached
+                pass
     
-    response = serialize_for_json(result)
+    response = {
+        "columns": result["columns"],
+        "rows": orjson.Fragment(result["rows_json"]),
+        "has_more": result["has_more"],
+        "total_rows_estimate": result["total_rows_estimate"],
+        "execution_time_ms": result["execution_time_ms"],
+        "error": result["error"]
+    }
     
     # Add optional summary if no error
-    if not response.get('error'):
-        row_count = len(response.get('rows', []))
-        total_rows = response.get('total_rows_estimate', row_count)
+    if not response['error']:
+        row_count = result["row_count"]
+        if response['has_more']:
+            total = f"more on page {page + 1}"
+        elif response['total_rows_estimate'] is None:
+            total = "past the last page"
+        else:
+            total = f"total: {response['total_rows_estimate']}"
         response['summary'] = (
-            f"Query returned {row_count} row(s) (total: {total_rows}) "
-            f"in {response.get('execution_time_ms', 0):.2f}ms"
+            f"Query returned {row_count} row(s) ({total}) "
+            f"in {response['execution_time_ms']:.2f}ms"
         )
     
     return response
 
 
+# Tool name -> (handler, argument model). Argument models mirror the
+# inputSchema declared in list_tools and supply its defaults.
+TOOLS = {
+    "list_connections": (
+        handle_list_connections,
+        create_model("ListConnectionsArgs")
+    ),
+    "list_schemas": (
+        handle_list_schemas,
+        create_model("ListSchemasArgs", connection_id=(str, "default"))
+    ),
+    "list_tables": (
+        handle_list_tables,
+        create_model(
+            "ListTablesArgs",
+            connection_id=(str, "default"),
+            schema=(str, "public")
+        )
+    ),
+    "get_table_info": (
+        handle_get_table_info,
+        create_model(
+            "GetTableInfoArgs",
+            connection_id=(str, "default"),
+            schema=(str, ...),
+            table=(str, ...)
+        )
+    ),
+    "sample_rows": (
+        handle_sample_rows,
+        create_model(
+            "SampleRowsArgs",
+            connection_id=(str, "default"),
+            schema=(str, ...),
+            table=(str, ...),
+            limit=(int, Field(50, ge=1, le=500)),
+            offset=(int, Field(0, ge=0)),
+            after=(Optional[str], None)
+        )
+    ),
+    "profile_table": (
+        handle_profile_table,
+        create_model(
+            "ProfileTableArgs",
+            connection_id=(str, "default"),
+            schema=(str, ...),
+            table=(str, ...),
+            max_distinct=(int, Field(50, ge=1, le=200))
+        )
+    ),
+    "run_query": (
+        handle_run_query,
+        create_model(
+            "RunQueryArgs",
+            connection_id=(str, "default"),
+            sql=(str, ...),
+            page=(int, Field(1, ge=1)),
+            page_size=(int, Field(100, ge=1, le=1000))
+        )
+    ),
+}
+
+
+# Pipe buffer size requested for stdin/stdout (Linux only)
+STDIO_PIPE_SIZE = 1 << 20
+
+
+def enlarge_stdio_pipes() -> None:
+    """Grow the stdin/stdout pipe buffers so large tool results (e.g. run_query
+    JSON) are written with fewer blocking write() calls."""
+    set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None) if fcntl else None
+    if set_pipe_size is None:
+        return
+    for fd in (0, 1):
+        try:
+            if stat.S_ISFIFO(os.fstat(fd).st_mode):
+                fcntl.fcntl(fd, set_pipe_size, STDIO_PIPE_SIZE)
+        except OSError as e:
+            # Capped by /proc/sys/fs/pipe-max-size for unprivileged users
+            logger.debug(f"Could not resize pipe buffer for fd {fd}: {e}")
+
+
 async def main():
     """Main entry point for the MCP server."""
     logger.info("Starting Postgres Data Explorer MCP Server")
@@ -469,6 +702,8 @@ async def main():
         logger.error(f"Error loading database configurations: {e}")
         sys.exit(1)
     
+    enlarge_stdio_pipes()
+    
     # Start the stdio server
     async with stdio_server() as (read_stream, write_stream):
         logger.info("MCP Server ready - waiting for client connections")
@@ -476,5 +711,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
 
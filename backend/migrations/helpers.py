@@ -0,0 +1,122 @@
+"""Shared DDL helpers for Alembic revisions.
+
+Import from a revision with ``from migrations.helpers import ...``; alembic.ini
+puts the backend directory on sys.path. This module lives outside versions/
+because Alembic treats every module there as a revision.
+"""
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+LOCK_TIMEOUT = '5s'
+
+# Conservative defaults for index builds after bulk copies/rewrites; raise them
+# on large instances with -x maintenance_work_mem=2GB (or the
+# MIGRATION_MAINTENANCE_WORK_MEM env var), likewise for the worker count
+MAINTENANCE_WORK_MEM = '256MB'
+MAX_PARALLEL_MAINTENANCE_WORKERS = 2
+
+# (index name, columns, extra op.create_index keyword arguments)
+IndexSpec = Tuple[str, Sequence[Any], Dict[str, Any]]
+
+
+@contextmanager
+def lock_timeout(timeout: str = LOCK_TIMEOUT) -> Iterator[None]:
+    """Make DDL in the block fail fast instead of queueing behind long-running transactions.
+
+    A session-level SET, so it also covers the autocommit blocks of
+    create_index_concurrently(); it is RESET when the block exits so later
+    revisions in the same `alembic upgrade` run keep the server default.
+    """
+    op.execute(f"SET lock_timeout = '{timeout}'")
+    yield
+    op.execute("RESET lock_timeout")
+
+
+def _setting(name: str, default: Any) -> str:
+    """An `alembic -x name=value` argument, else the MIGRATION_<NAME> env var, else default."""
+    return str(
+        context.get_x_argument(as_dictionary=True).get(name)
+        or os.getenv(f'MIGRATION_{name.upper()}')
+        or default
+    )
+
+
+@contextmanager
+def maintenance_settings() -> Iterator[None]:
+    """Give index builds and table rewrites in the block more memory and parallel workers.
+
+    The settings are RESET when the block exits, so they do not carry over to
+    later revisions in the same `alembic upgrade` run. A failed block aborts
+    the revision and its transaction, which reverts them anyway.
+    """
+    work_mem = _setting('maintenance_work_mem', MAINTENANCE_WORK_MEM).replace("'", "''")
+    workers = int(_setting('max_parallel_maintenance_workers', MAX_PARALLEL_MAINTENANCE_WORKERS))
+    op.execute(f"SET maintenance_work_mem = '{work_mem}'")
+    op.execute(f"SET max_parallel_maintenance_workers = {workers}")
+    yield
+    op.execute("RESET maintenance_work_mem")
+    op.execute("RESET max_parallel_maintenance_workers")
+
+
+def _is_invalid_index(name: str) -> bool:
+    """Whether an index of this name exists but was left INVALID by a failed concurrent build."""
+    if op.get_context().as_sql:
+        return False
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {'name': name}
+    ).first() is not None
+
+
+def create_index_concurrently(name: str, table: str, columns: Sequence[Any], **kw: Any) -> None:
+    """Build an index without blocking writes to a populated table.
+
+    Runs in its own autocommit block (CONCURRENTLY cannot run inside a
+    transaction), so it must not be called from within another one.
+    Partitioned tables do not support CONCURRENTLY; use op.create_index.
+
+    Safe to rerun: each autocommit block commits on its own, so a revision
+    that fails halfway keeps the indexes it already built (skipped by IF NOT
+    EXISTS) and may leave an INVALID one behind (dropped and rebuilt).
+    """
+    with op.get_context().autocommit_block():
+        if _is_invalid_index(name):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **kw)
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    """Drop an index without blocking reads or writes on its table; no-op if already gone."""
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def create_indexed_table(
+    table: str,
+    *columns: sa.schema.SchemaItem,
+    indexes: Iterable[IndexSpec] = (),
+    concurrent: bool = False,
+    **table_kw: Any
+) -> Optional[sa.Table]:
+    """Create a table, then its indexes.
+
+    Indexes are built after the table so a revision reads as "table, then
+    indexes" in one call. A new table is empty, so a plain CREATE INDEX is
+    instant; pass concurrent=True only when the table may already be
+    populated by the time the indexes are built.
+    """
+    created = op.create_table(table, *columns, **table_kw)
+    for name, index_columns, index_kw in indexes:
+        if concurrent:
+            create_index_concurrently(name, table, index_columns, **index_kw)
+        else:
+            op.create_index(name, table, index_columns, **index_kw)
+    return created
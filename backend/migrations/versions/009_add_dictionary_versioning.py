@@ -17,7 +17,9 @@ depends_on = None
 
 def upgrade():
     """Add version and active status fields."""
-    # Add version_number column (defaults to 1 for existing entries)
+    # Add version_number column (defaults to 1 for existing entries).
+    # A constant default is stored in the catalog (PostgreSQL 11+), so this
+    # does not rewrite the table and needs no batched backfill.
     op.add_column('data_dictionary_entries', 
         sa.Column('version_number', sa.Integer(), nullable=False, server_default='1'))
     
@@ -0,0 +1,47 @@
+"""Add composite indexes for "recent items per connection" queries
+
+Revision ID: 012_composite_indexes
+Revises: 010_add_evaluation_packs, 011_enhanced_dict
+Create Date: 2026-10-17
+
+Saved analyses are listed with WHERE db_id = ? ORDER BY created_at DESC LIMIT n,
+which previously had to combine ix_ai_analysis_results_db_id with a sort.
+A (db_id, created_at DESC) index answers it with one ordered index scan and
+makes the single-column db_id index redundant.
+
+chat_messages is always read by conversation ordered by sequence, which the
+existing (conversation_id, sequence) index already serves in either
+direction, so the single-column conversation_id index is redundant too.
+
+Indexes are built and dropped CONCURRENTLY so the tables stay writable.
+
+This revision also merges the 010/011 heads.
+"""
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012_composite_indexes'
+down_revision = ('010_add_evaluation_packs', '011_enhanced_dict')
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        create_index_concurrently(
+            'ix_ai_analysis_results_db_created',
+            'ai_analysis_results',
+            ['db_id', sa.text('created_at DESC')]
+        )
+        drop_index_concurrently('ix_ai_analysis_results_db_id', 'ai_analysis_results')
+
+        drop_index_concurrently('ix_chat_messages_conversation_id', 'chat_messages')
+
+
+def downgrade() -> None:
+    create_index_concurrently('ix_chat_messages_conversation_id', 'chat_messages', ['conversation_id'])
+    
+    create_index_concurrently('ix_ai_analysis_results_db_id', 'ai_analysis_results', ['db_id'])
+    drop_index_concurrently('ix_ai_analysis_results_db_created', 'ai_analysis_results')
@@ -0,0 +1,54 @@
+"""Use BRIN indexes for chat created_at columns
+
+Revision ID: 013_brin_chat_created_at
+Revises: 012_composite_indexes
+Create Date: 2026-10-17
+
+chat_messages and chat_conversations are append-only, so created_at follows
+physical row order. A BRIN index stores one summary per block range, a small
+fraction of the btree's size, and is cheap to maintain on insert while still
+serving time-window range scans. Neither table orders by created_at (messages
+are ordered by sequence, conversations by updated_at).
+
+ix_ai_analysis_results_created_at stays a btree: the unfiltered saved-analyses
+listing uses it for ORDER BY created_at DESC LIMIT n, which BRIN cannot serve.
+
+Indexes are built and dropped CONCURRENTLY so the tables stay writable.
+"""
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '013_brin_chat_created_at'
+down_revision = '012_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        create_index_concurrently(
+            'ix_chat_messages_created_at_brin',
+            'chat_messages',
+            ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        )
+        drop_index_concurrently('ix_chat_messages_created_at', 'chat_messages')
+
+        create_index_concurrently(
+            'ix_chat_conversations_created_at_brin',
+            'chat_conversations',
+            ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        )
+        drop_index_concurrently('ix_chat_conversations_created_at', 'chat_conversations')
+
+
+def downgrade() -> None:
+    create_index_concurrently('ix_chat_conversations_created_at', 'chat_conversations', ['created_at'], postgresql_using='btree')
+    drop_index_concurrently('ix_chat_conversations_created_at_brin', 'chat_conversations')
+    
+    create_index_concurrently('ix_chat_messages_created_at', 'chat_messages', ['created_at'], postgresql_using='btree')
+    drop_index_concurrently('ix_chat_messages_created_at_brin', 'chat_messages')
@@ -0,0 +1,86 @@
+"""Hash-partition chat_messages by conversation_id
+
+Revision ID: 014_partition_chat_messages
+Revises: 013_brin_chat_created_at
+Create Date: 2026-10-17
+
+Every chat_messages query filters by conversation_id, so hash partitioning on
+it lets Postgres prune to a single partition per read and spreads inserts
+across 16 smaller heaps and indexes.
+
+The primary key becomes (id, conversation_id) because a partitioned table's
+unique constraints must include the partition key; id remains unique in
+practice (gen_random_uuid()).
+"""
+from alembic import op
+from migrations.helpers import maintenance_settings
+
+
+# revision identifiers, used by Alembic.
+revision = '014_partition_chat_messages'
+down_revision = '013_brin_chat_created_at'
+branch_labels = None
+depends_on = None
+
+PARTITION_COUNT = 16
+
+
+def _create_indexes_and_trigger() -> None:
+    op.create_index('ix_chat_messages_conversation_sequence', 'chat_messages', ['conversation_id', 'sequence'], postgresql_using='btree')
+    op.create_index('ix_chat_messages_role', 'chat_messages', ['role'])
+    op.create_index(
+        'ix_chat_messages_created_at_brin',
+        'chat_messages',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+    op.execute("""
+        CREATE TRIGGER chat_messages_update_conversation_updated_at
+        AFTER INSERT ON chat_messages
+        FOR EACH ROW
+        EXECUTE FUNCTION update_chat_conversation_updated_at();
+    """)
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE chat_messages RENAME TO chat_messages_unpartitioned')
+    op.execute('ALTER TABLE chat_messages_unpartitioned RENAME CONSTRAINT chat_messages_pkey TO chat_messages_unpartitioned_pkey')
+
+    op.execute("""
+        CREATE TABLE chat_messages (
+            LIKE chat_messages_unpartitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id, conversation_id),
+            FOREIGN KEY (conversation_id) REFERENCES chat_conversations (id) ON DELETE CASCADE
+        ) PARTITION BY HASH (conversation_id)
+    """)
+    for remainder in range(PARTITION_COUNT):
+        op.execute(
+            f'CREATE TABLE chat_messages_p{remainder:02d} PARTITION OF chat_messages '
+            f'FOR VALUES WITH (MODULUS {PARTITION_COUNT}, REMAINDER {remainder})'
+        )
+
+    # Copy before the trigger exists so conversations keep their updated_at
+    op.execute('INSERT INTO chat_messages SELECT * FROM chat_messages_unpartitioned')
+    op.execute('DROP TABLE chat_messages_unpartitioned')
+
+    with maintenance_settings():
+        _create_indexes_and_trigger()
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE chat_messages RENAME TO chat_messages_partitioned')
+    op.execute('ALTER TABLE chat_messages_partitioned RENAME CONSTRAINT chat_messages_pkey TO chat_messages_partitioned_pkey')
+
+    op.execute("""
+        CREATE TABLE chat_messages (
+            LIKE chat_messages_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (conversation_id) REFERENCES chat_conversations (id) ON DELETE CASCADE
+        )
+    """)
+    op.execute('INSERT INTO chat_messages SELECT * FROM chat_messages_partitioned')
+    # Dropping the parent drops all of its partitions
+    op.execute('DROP TABLE chat_messages_partitioned')
+
+    _create_indexes_and_trigger()
@@ -0,0 +1,66 @@
+"""Make the chat_messages updated_at trigger statement-level
+
+Revision ID: 015_statement_level_chat_trigger
+Revises: 014_partition_chat_messages
+Create Date: 2026-10-17
+
+The row-level trigger from 002 ran one UPDATE on chat_conversations per
+inserted message. A statement-level trigger with a transition table touches
+each affected conversation once per INSERT statement, so bulk history
+imports cost one UPDATE instead of N.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015_statement_level_chat_trigger'
+down_revision = '014_partition_chat_messages'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS chat_messages_update_conversation_updated_at ON chat_messages')
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_chat_conversation_updated_at()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE chat_conversations
+            SET updated_at = NOW()
+            WHERE id IN (SELECT DISTINCT conversation_id FROM new_rows);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER chat_messages_update_conversation_updated_at
+        AFTER INSERT ON chat_messages
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION update_chat_conversation_updated_at();
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS chat_messages_update_conversation_updated_at ON chat_messages')
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_chat_conversation_updated_at()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE chat_conversations
+            SET updated_at = NOW()
+            WHERE id = NEW.conversation_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER chat_messages_update_conversation_updated_at
+        AFTER INSERT ON chat_messages
+        FOR EACH ROW
+        EXECUTE FUNCTION update_chat_conversation_updated_at();
+    """)
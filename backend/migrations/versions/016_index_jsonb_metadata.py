@@ -0,0 +1,56 @@
+"""Index chat metadata JSONB and promote analysis execution time
+
+Revision ID: 016_index_jsonb_metadata
+Revises: 015_statement_level_chat_trigger
+Create Date: 2026-10-17
+
+- chat_conversations.metadata gets a GIN index with the jsonb_path_ops
+  opclass, so containment filters such as metadata @> '{"tags": ["x"]}'
+  use an index instead of parsing every row. jsonb_path_ops indexes are
+  smaller and faster than the default opclass for @>.
+- ai_analysis_results gets a stored generated column extracted from
+  execution_metadata->>'execution_time_seconds' (the key written by
+  AIAnalysisService), with a btree index for sorting and range filters.
+
+Indexes are built CONCURRENTLY so the tables stay writable.
+"""
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016_index_jsonb_metadata'
+down_revision = '015_statement_level_chat_trigger'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        # Adding a stored generated column rewrites the table under lock anyway
+        op.add_column(
+            'ai_analysis_results',
+            sa.Column(
+                'execution_time_seconds',
+                sa.Float,
+                sa.Computed("(execution_metadata->>'execution_time_seconds')::double precision", persisted=True),
+                comment='Promoted from execution_metadata'
+            )
+        )
+
+        create_index_concurrently(
+            'ix_chat_conversations_metadata_gin',
+            'chat_conversations',
+            ['metadata'],
+            postgresql_using='gin',
+            postgresql_ops={'metadata': 'jsonb_path_ops'}
+        )
+        create_index_concurrently('ix_ai_analysis_results_execution_time', 'ai_analysis_results', ['execution_time_seconds'])
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_ai_analysis_results_execution_time', 'ai_analysis_results')
+    drop_index_concurrently('ix_chat_conversations_metadata_gin', 'chat_conversations')
+    
+    op.drop_column('ai_analysis_results', 'execution_time_seconds')
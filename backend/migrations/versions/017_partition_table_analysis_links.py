@@ -0,0 +1,142 @@
+"""Range-partition table_analysis_links by created_at
+
+Revision ID: 017_partition_table_links
+Revises: 016_index_jsonb_metadata
+Create Date: 2026-10-17
+
+table_analysis_links grows by one row per (analysis, table) and is read over
+time windows, so quarterly RANGE partitions on created_at let Postgres prune
+whole quarters, keep each btree small, and turn purging old links into a
+DETACH PARTITION instead of DELETE + VACUUM.
+
+Partitions are named table_analysis_links_<year>_q<quarter> and created by
+create_table_analysis_links_partitions(start_date, quarters_ahead), which is
+idempotent. The migration covers existing rows through four quarters ahead;
+run the function periodically (e.g. SELECT
+create_table_analysis_links_partitions()) to keep partitions ahead of NOW().
+A DEFAULT partition catches rows outside every range so inserts never fail.
+If rows for a quarter landed there before its partition existed, the function
+detaches the DEFAULT partition, moves them into the new partition and
+reattaches it. That briefly takes an ACCESS EXCLUSIVE lock on the table.
+
+The primary key becomes (id, created_at) because a partitioned table's unique
+constraints must include the partition key.
+
+analysis_jobs is not partitioned: jobs are fetched and updated by id, which
+would probe every partition, and they are not purged by age.
+"""
+from alembic import op
+from migrations.helpers import maintenance_settings
+
+
+# revision identifiers, used by Alembic.
+revision = '017_partition_table_links'
+down_revision = '016_index_jsonb_metadata'
+branch_labels = None
+depends_on = None
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_table_links_analysis_id', 'table_analysis_links', ['analysis_id'])
+    op.create_index('ix_table_links_database_id', 'table_analysis_links', ['database_id'])
+    op.create_index('ix_table_links_schema', 'table_analysis_links', ['schema_name'])
+    op.create_index('ix_table_links_table', 'table_analysis_links', ['table_name'])
+    op.create_index('ix_table_links_table_lookup', 'table_analysis_links', ['database_id', 'schema_name', 'table_name'])
+    op.create_index('ix_table_links_analysis_tables', 'table_analysis_links', ['analysis_id', 'table_name'])
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE table_analysis_links RENAME TO table_analysis_links_unpartitioned')
+    op.execute('ALTER TABLE table_analysis_links_unpartitioned RENAME CONSTRAINT table_analysis_links_pkey TO table_analysis_links_unpartitioned_pkey')
+
+    op.execute("""
+        CREATE TABLE table_analysis_links (
+            LIKE table_analysis_links_unpartitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id, created_at),
+            FOREIGN KEY (analysis_id) REFERENCES ai_analysis_results (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_table_analysis_links_partitions(
+            start_date date DEFAULT CURRENT_DATE,
+            quarters_ahead integer DEFAULT 4
+        )
+        RETURNS void AS $$
+        DECLARE
+            quarter_start date := date_trunc('quarter', start_date)::date;
+            quarter_end date;
+            last_start date := (date_trunc('quarter', NOW()) + make_interval(months => 3 * quarters_ahead))::date;
+            partition_name text;
+            move_rows boolean;
+        BEGIN
+            WHILE quarter_start <= last_start LOOP
+                quarter_end := (quarter_start + interval '3 months')::date;
+                partition_name := format('table_analysis_links_%s_q%s', to_char(quarter_start, 'YYYY'), to_char(quarter_start, 'Q'));
+
+                IF to_regclass(quote_ident(partition_name)) IS NULL THEN
+                    -- Rows for this quarter already in the DEFAULT partition would
+                    -- violate its new constraint, so move them over while it is detached
+                    move_rows := false;
+                    IF to_regclass('table_analysis_links_default') IS NOT NULL THEN
+                        move_rows := EXISTS (
+                            SELECT 1 FROM table_analysis_links_default
+                            WHERE created_at >= quarter_start AND created_at < quarter_end
+                        );
+                    END IF;
+                    IF move_rows THEN
+                        ALTER TABLE table_analysis_links DETACH PARTITION table_analysis_links_default;
+                    END IF;
+
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF table_analysis_links FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, quarter_start, quarter_end
+                    );
+
+                    IF move_rows THEN
+                        INSERT INTO table_analysis_links
+                        SELECT * FROM table_analysis_links_default
+                        WHERE created_at >= quarter_start AND created_at < quarter_end;
+                        DELETE FROM table_analysis_links_default
+                        WHERE created_at >= quarter_start AND created_at < quarter_end;
+                        ALTER TABLE table_analysis_links ATTACH PARTITION table_analysis_links_default DEFAULT;
+                    END IF;
+                END IF;
+
+                quarter_start := quarter_end;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        SELECT create_table_analysis_links_partitions(
+            COALESCE((SELECT min(created_at)::date FROM table_analysis_links_unpartitioned), CURRENT_DATE)
+        )
+    """)
+    op.execute('CREATE TABLE table_analysis_links_default PARTITION OF table_analysis_links DEFAULT')
+
+    op.execute('INSERT INTO table_analysis_links SELECT * FROM table_analysis_links_unpartitioned')
+    op.execute('DROP TABLE table_analysis_links_unpartitioned')
+
+    # Indexes on the parent cascade to every partition
+    with maintenance_settings():
+        _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE table_analysis_links RENAME TO table_analysis_links_partitioned')
+    op.execute('ALTER TABLE table_analysis_links_partitioned RENAME CONSTRAINT table_analysis_links_pkey TO table_analysis_links_partitioned_pkey')
+
+    op.execute("""
+        CREATE TABLE table_analysis_links (
+            LIKE table_analysis_links_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (analysis_id) REFERENCES ai_analysis_results (id) ON DELETE CASCADE
+        )
+    """)
+    op.execute('INSERT INTO table_analysis_links SELECT * FROM table_analysis_links_partitioned')
+    # Dropping the parent drops all of its partitions
+    op.execute('DROP TABLE table_analysis_links_partitioned')
+    op.execute('DROP FUNCTION IF EXISTS create_table_analysis_links_partitions(date, integer)')
+
+    _create_indexes()
@@ -0,0 +1,53 @@
+"""Make the table-link and job lookup indexes cover their queries
+
+Revision ID: 018_covering_lookup_indexes
+Revises: 017_partition_table_links
+Create Date: 2026-10-17
+
+- ix_table_links_table_lookup INCLUDEs analysis_id, quality_score and
+  anomaly_count, so "analyses and scores for table X" is answered by an
+  index-only scan without heap fetches.
+- ix_analysis_jobs_user_status gains created_at DESC as a trailing key.
+  list_jobs filters by user/status and orders by created_at DESC LIMIT n,
+  so the index now returns rows in order and the sort goes away. It selects
+  whole rows, so INCLUDE columns could not make it index-only.
+
+table_analysis_links is partitioned, where CREATE INDEX CONCURRENTLY is not
+supported, so its index is rebuilt in the migration transaction.
+"""
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018_covering_lookup_indexes'
+down_revision = '017_partition_table_links'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        op.drop_index('ix_table_links_table_lookup', table_name='table_analysis_links')
+        op.create_index(
+            'ix_table_links_table_lookup',
+            'table_analysis_links',
+            ['database_id', 'schema_name', 'table_name'],
+            postgresql_include=['analysis_id', 'quality_score', 'anomaly_count']
+        )
+
+        create_index_concurrently(
+            'ix_analysis_jobs_user_status_created',
+            'analysis_jobs',
+            ['user_id', 'status', sa.text('created_at DESC')]
+        )
+        drop_index_concurrently('ix_analysis_jobs_user_status', 'analysis_jobs')
+
+
+def downgrade() -> None:
+    create_index_concurrently('ix_analysis_jobs_user_status', 'analysis_jobs', ['user_id', 'status'])
+    drop_index_concurrently('ix_analysis_jobs_user_status_created', 'analysis_jobs')
+
+    op.drop_index('ix_table_links_table_lookup', table_name='table_analysis_links')
+    op.create_index('ix_table_links_table_lookup', 'table_analysis_links', ['database_id', 'schema_name', 'table_name'])
@@ -0,0 +1,59 @@
+"""Replace full status/is_active indexes with partial indexes on hot rows
+
+Revision ID: 019_partial_status_indexes
+Revises: 018_covering_lookup_indexes
+Create Date: 2026-10-17
+
+- analysis_jobs: the actionable working set is status IN ('pending',
+  'running'); terminal jobs pile up and are never looked up by status.
+  ix_analysis_jobs_active indexes only those rows, ordered by created_at,
+  and replaces the full ix_analysis_jobs_status. Filters on a single active
+  status (status = 'running') still match the partial predicate.
+- data_dictionary_entries: every lookup filters is_active = true, and
+  inactive rows are superseded versions. ix_data_dictionary_active_lookup
+  becomes a partial index on (database, schema, table, column) WHERE
+  is_active, which serves both the per-column upsert lookup and the
+  per-table listing. The standalone is_active index is then redundant.
+"""
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '019_partial_status_indexes'
+down_revision = '018_covering_lookup_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        create_index_concurrently(
+            'ix_analysis_jobs_active',
+            'analysis_jobs',
+            [sa.text('created_at DESC')],
+            postgresql_where=sa.text("status IN ('pending', 'running')")
+        )
+        drop_index_concurrently('ix_analysis_jobs_status', 'analysis_jobs')
+
+        create_index_concurrently(
+            'ix_data_dictionary_active_column',
+            'data_dictionary_entries',
+            ['database_name', 'schema_name', 'table_name', 'column_name'],
+            postgresql_where=sa.text('is_active')
+        )
+        drop_index_concurrently('ix_data_dictionary_active_lookup', 'data_dictionary_entries')
+        drop_index_concurrently('ix_data_dictionary_entries_is_active', 'data_dictionary_entries')
+
+
+def downgrade() -> None:
+    create_index_concurrently('ix_data_dictionary_entries_is_active', 'data_dictionary_entries', ['is_active'])
+    create_index_concurrently(
+        'ix_data_dictionary_active_lookup',
+        'data_dictionary_entries',
+        ['database_name', 'schema_name', 'table_name', 'is_active']
+    )
+    drop_index_concurrently('ix_data_dictionary_active_column', 'data_dictionary_entries')
+
+    create_index_concurrently('ix_analysis_jobs_status', 'analysis_jobs', ['status'])
+    drop_index_concurrently('ix_analysis_jobs_active', 'analysis_jobs')
@@ -0,0 +1,96 @@
+"""Store JSON documents as JSONB and GIN-index the queried ones
+
+Revision ID: 020_jsonb_gin_indexes
+Revises: 019_partial_status_indexes
+Create Date: 2026-10-17
+
+The json columns from 008, 009_ml_development and evaluation_result are
+converted to jsonb in place (USING col::jsonb). JSONB is stored parsed, so
+reads skip re-parsing the text, and it supports GIN indexes.
+
+GIN indexes with the jsonb_path_ops opclass are added on the documents that
+are filtered with @> containment: table_analysis_links.findings,
+analysis_jobs.job_metadata, ml_run.metrics_json,
+ml_monitor_snapshot.drift_metrics_json and evaluation_result.results_json.
+jsonb_path_ops indexes are much smaller than the default opclass and only
+serve @>, which is all these columns need.
+
+Note that jsonb does not keep key order or duplicate keys.
+"""
+from alembic import op
+from migrations.helpers import create_index_concurrently, lock_timeout, maintenance_settings
+
+
+# revision identifiers, used by Alembic.
+revision = '020_jsonb_gin_indexes'
+down_revision = '019_partial_status_indexes'
+branch_labels = None
+depends_on = None
+
+# (table, column, server default)
+JSON_COLUMNS = [
+    ('data_dictionary_entries', 'examples', None),
+    ('data_dictionary_entries', 'tags', None),
+    ('ml_recipe', 'tags', "'[]'"),
+    ('ml_recipe_version', 'manifest_json', "'{}'"),
+    ('ml_recipe_version', 'diff_from_prev', None),
+    ('ml_run', 'metrics_json', "'{}'"),
+    ('ml_run', 'artifacts_json', "'{}'"),
+    ('ml_monitor_snapshot', 'performance_metrics_json', "'{}'"),
+    ('ml_monitor_snapshot', 'drift_metrics_json', "'{}'"),
+    ('ml_monitor_snapshot', 'data_freshness_json', "'{}'"),
+    ('ml_monitor_snapshot', 'alerts_json', "'{}'"),
+    ('ml_synthetic_example', 'dataset_schema_json', "'{}'"),
+    ('ml_synthetic_example', 'sample_rows_json', "'[]'"),
+    ('ml_synthetic_example', 'example_run_json', "'{}'"),
+    ('evaluation_result', 'results_json', "'{}'"),
+]
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ('ix_table_links_findings_gin', 'table_analysis_links', 'findings'),
+    ('ix_analysis_jobs_job_metadata_gin', 'analysis_jobs', 'job_metadata'),
+    ('ix_ml_run_metrics_gin', 'ml_run', 'metrics_json'),
+    ('ix_ml_monitor_snapshot_drift_gin', 'ml_monitor_snapshot', 'drift_metrics_json'),
+    ('ix_evaluation_result_results_gin', 'evaluation_result', 'results_json'),
+]
+
+
+def _alter_json_type(table: str, column: str, default: str, type_name: str) -> None:
+    """Change a json/jsonb column's type, re-casting its default."""
+    if default is None:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}')
+    else:
+        op.execute(
+            f'ALTER TABLE {table} '
+            f'ALTER COLUMN {column} DROP DEFAULT, '
+            f'ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}, '
+            f'ALTER COLUMN {column} SET DEFAULT {default}::{type_name}'
+        )
+
+
+def upgrade() -> None:
+    with lock_timeout(), maintenance_settings():
+        for table, column, default in JSON_COLUMNS:
+            _alter_json_type(table, column, default, 'jsonb')
+
+        # table_analysis_links is partitioned, which rules out CONCURRENTLY
+        name, table, column = GIN_INDEXES[0]
+        op.create_index(name, table, [column], postgresql_using='gin', postgresql_ops={column: 'jsonb_path_ops'})
+
+        for name, table, column in GIN_INDEXES[1:]:
+            create_index_concurrently(
+                name,
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'}
+            )
+
+
+def downgrade() -> None:
+    for name, table, _ in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table, column, default in JSON_COLUMNS:
+        _alter_json_type(table, column, default, 'json')
@@ -0,0 +1,61 @@
+"""Use the C collation for ML and evaluation pack id columns
+
+Revision ID: 021_c_collation_ml_ids
+Revises: 020_jsonb_gin_indexes
+Create Date: 2026-10-17
+
+The ML recipe/model/run and evaluation pack tables key on readable string
+ids ('recipe_pricing_base', 'pack_nba_standard', ...) that the seed scripts
+and API clients depend on, so they cannot become UUIDs or ULIDs. varchar
+also only stores the actual string length, so String(255) does not pad the
+btree keys.
+
+What these ids do pay for is locale-aware comparison on every index probe
+and join. Switching the key columns to COLLATE "C" makes comparisons
+plain byte comparisons and lets sorts use abbreviated keys. Equality
+semantics are unchanged; only ORDER BY id switches to byte order.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout, maintenance_settings
+
+
+# revision identifiers, used by Alembic.
+revision = '021_c_collation_ml_ids'
+down_revision = '020_jsonb_gin_indexes'
+branch_labels = None
+depends_on = None
+
+# Primary key and foreign key id columns, referenced tables first
+ID_COLUMNS = {
+    'ml_recipe': ['id', 'parent_id'],
+    'ml_recipe_version': ['version_id', 'recipe_id'],
+    'ml_model': ['id', 'recipe_id', 'recipe_version_id'],
+    'ml_run': ['id', 'model_id', 'recipe_id', 'recipe_version_id'],
+    'ml_monitor_snapshot': ['id', 'model_id'],
+    'ml_synthetic_example': ['id', 'recipe_id'],
+    'evaluation_pack': ['id'],
+    'evaluation_pack_version': ['version_id', 'pack_id'],
+    'recipe_evaluation_pack': ['recipe_id', 'pack_id'],
+    'evaluation_result': ['id', 'run_id', 'pack_id', 'pack_version_id'],
+    'monitor_evaluation_snapshot': ['id', 'model_id', 'pack_id', 'pack_version_id'],
+}
+
+
+def _set_collation(collation: str) -> None:
+    # One ALTER TABLE per table so its indexes are rebuilt once
+    for table, columns in ID_COLUMNS.items():
+        clauses = ', '.join(
+            f'ALTER COLUMN {column} TYPE varchar(255) COLLATE {collation}'
+            for column in columns
+        )
+        op.execute(f'ALTER TABLE {table} {clauses}')
+
+
+def upgrade() -> None:
+    # The collation change rebuilds every index on these columns
+    with lock_timeout(), maintenance_settings():
+        _set_collation('"C"')
+
+
+def downgrade() -> None:
+    _set_collation('"default"')
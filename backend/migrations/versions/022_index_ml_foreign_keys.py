@@ -0,0 +1,61 @@
+"""Index the unindexed foreign keys of the ML and evaluation pack tables
+
+Revision ID: 022_index_ml_foreign_keys
+Revises: 021_c_collation_ml_ids
+Create Date: 2026-10-17
+
+Postgres does not index the referencing side of a foreign key. Without one,
+every parent DELETE (and each ON DELETE CASCADE) scans the whole child table,
+and "runs for model X" style lookups cannot use a nested-loop index scan.
+
+Already covered and skipped: ml_recipe_version.recipe_id,
+ml_monitor_snapshot.model_id and ml_synthetic_example.recipe_id (own index),
+and recipe_evaluation_pack.recipe_id (leading primary key column).
+
+Remaining unindexed foreign keys can be listed with:
+
+    SELECT c.conrelid::regclass, a.attname
+    FROM pg_constraint c
+    JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1]
+    WHERE c.contype = 'f'
+      AND NOT EXISTS (
+          SELECT 1 FROM pg_index i
+          WHERE i.indrelid = c.conrelid AND i.indkey[0] = c.conkey[1]
+      );
+"""
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '022_index_ml_foreign_keys'
+down_revision = '021_c_collation_ml_ids'
+branch_labels = None
+depends_on = None
+
+# (table, column), most frequently cascaded first
+FK_COLUMNS = [
+    ('ml_run', 'model_id'),
+    ('evaluation_result', 'run_id'),
+    ('monitor_evaluation_snapshot', 'model_id'),
+    ('ml_run', 'recipe_id'),
+    ('ml_run', 'recipe_version_id'),
+    ('ml_model', 'recipe_id'),
+    ('ml_model', 'recipe_version_id'),
+    ('evaluation_pack_version', 'pack_id'),
+    ('recipe_evaluation_pack', 'pack_id'),
+    ('evaluation_result', 'pack_id'),
+    ('evaluation_result', 'pack_version_id'),
+    ('monitor_evaluation_snapshot', 'pack_id'),
+    ('monitor_evaluation_snapshot', 'pack_version_id'),
+]
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        for table, column in FK_COLUMNS:
+            create_index_concurrently(f'ix_{table}_{column}', table, [column])
+
+
+def downgrade() -> None:
+    for table, column in reversed(FK_COLUMNS):
+        drop_index_concurrently(f'ix_{table}_{column}', table)
@@ -0,0 +1,55 @@
+"""Use BRIN for monitoring snapshot capture times
+
+Revision ID: 023_brin_snapshot_captured_at
+Revises: 022_index_ml_foreign_keys
+Create Date: 2026-10-17
+
+ml_monitor_snapshot is append-only and the largest of the ML tables, and
+captured_at follows insert order, so the standalone captured_at btree is
+replaced by a BRIN index for time-window scans across models.
+
+The one query that sorts by captured_at (snapshots for a model, newest
+first) is served by a (model_id, captured_at DESC) btree instead, which
+also replaces the single-column model_id index.
+
+ix_analysis_jobs_created_at stays a btree: list_jobs orders by created_at
+DESC LIMIT n, which BRIN cannot serve. table_analysis_links is range
+partitioned on created_at, so partition pruning already covers it.
+"""
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '023_brin_snapshot_captured_at'
+down_revision = '022_index_ml_foreign_keys'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        create_index_concurrently(
+            'ix_ml_monitor_snapshot_model_captured',
+            'ml_monitor_snapshot',
+            ['model_id', sa.text('captured_at DESC')]
+        )
+        drop_index_concurrently('ix_ml_monitor_snapshot_model_id', 'ml_monitor_snapshot')
+
+        create_index_concurrently(
+            'ix_ml_monitor_snapshot_captured_at_brin',
+            'ml_monitor_snapshot',
+            ['captured_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        )
+        drop_index_concurrently('ix_ml_monitor_snapshot_captured_at', 'ml_monitor_snapshot')
+
+
+def downgrade() -> None:
+    create_index_concurrently('ix_ml_monitor_snapshot_captured_at', 'ml_monitor_snapshot', ['captured_at'])
+    drop_index_concurrently('ix_ml_monitor_snapshot_captured_at_brin', 'ml_monitor_snapshot')
+
+    create_index_concurrently('ix_ml_monitor_snapshot_model_id', 'ml_monitor_snapshot', ['model_id'])
+    drop_index_concurrently('ix_ml_monitor_snapshot_model_captured', 'ml_monitor_snapshot')
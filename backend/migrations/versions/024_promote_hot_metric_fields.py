@@ -0,0 +1,86 @@
+"""Promote hot monitoring and job timing fields to typed columns
+
+Revision ID: 024_promote_hot_fields
+Revises: 023_brin_snapshot_captured_at
+Create Date: 2026-10-17
+
+Monitoring views filter and sort snapshots by drift and alert counts, which
+today means extracting them from drift_metrics_json / alerts_json on every
+row. They become stored generated columns, so they stay in sync with the
+JSONB without application changes, are stored inline, and get real
+statistics:
+
+- ml_monitor_snapshot.psi from drift_metrics_json->'psi' (indexed)
+- ml_monitor_snapshot.triggered_alerts from alerts_json->'triggered_alerts'
+
+A key holding a non-numeric value yields NULL rather than failing the write.
+
+analysis_jobs.duration_ms is generated from started_at/completed_at, so job
+dashboards can sort by run time without computing it per row.
+
+ml_run.metrics_json keys differ per model family (MAPE, revenue_lift,
+uplift, rank_correlation, ...), so there is no shared metric to promote.
+"""
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '024_promote_hot_fields'
+down_revision = '023_brin_snapshot_captured_at'
+branch_labels = None
+depends_on = None
+
+
+def _numeric_key(column: str, key: str, type_name: str) -> str:
+    """Generated-column expression casting a JSONB key only when it is a number."""
+    return (
+        f"CASE WHEN jsonb_typeof({column}->'{key}') = 'number' "
+        f"THEN ({column}->>'{key}')::{type_name} END"
+    )
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        op.add_column(
+            'ml_monitor_snapshot',
+            sa.Column(
+                'psi',
+                sa.Float,
+                sa.Computed(_numeric_key('drift_metrics_json', 'psi', 'double precision'), persisted=True),
+                comment='Promoted from drift_metrics_json'
+            )
+        )
+        op.add_column(
+            'ml_monitor_snapshot',
+            sa.Column(
+                'triggered_alerts',
+                sa.Integer,
+                sa.Computed(_numeric_key('alerts_json', 'triggered_alerts', 'numeric::integer'), persisted=True),
+                comment='Promoted from alerts_json'
+            )
+        )
+
+        op.add_column(
+            'analysis_jobs',
+            sa.Column(
+                'duration_ms',
+                sa.BigInteger,
+                sa.Computed(
+                    "(EXTRACT(EPOCH FROM (completed_at - started_at)) * 1000)::bigint",
+                    persisted=True
+                ),
+                comment='Run time derived from started_at/completed_at'
+            )
+        )
+
+        create_index_concurrently('ix_ml_monitor_snapshot_psi', 'ml_monitor_snapshot', ['psi'])
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_ml_monitor_snapshot_psi', 'ml_monitor_snapshot')
+
+    op.drop_column('analysis_jobs', 'duration_ms')
+    op.drop_column('ml_monitor_snapshot', 'triggered_alerts')
+    op.drop_column('ml_monitor_snapshot', 'psi')
@@ -0,0 +1,89 @@
+"""Store prompt recipe and dictionary timestamps as timestamptz
+
+Revision ID: 025_timestamptz
+Revises: 024_promote_hot_fields
+Create Date: 2026-10-17
+
+006, 008 and 011 declared their timestamps with sa.DateTime(), i.e.
+timestamp without time zone, while every other table uses timestamptz.
+Comparing or joining the two kinds applies a time zone conversion per row.
+The application writes datetime.utcnow(), so existing values are read as UTC.
+
+created_at/updated_at also get NOW() server defaults, and updated_at is
+maintained by a BEFORE UPDATE trigger so raw SQL writers keep it current
+too (SQLAlchemy onupdate only fires for ORM/Core updates).
+"""
+from alembic import op
+from migrations.helpers import lock_timeout, maintenance_settings
+
+
+# revision identifiers, used by Alembic.
+revision = '025_timestamptz'
+down_revision = '024_promote_hot_fields'
+branch_labels = None
+depends_on = None
+
+# table -> timestamp columns
+TIMESTAMP_COLUMNS = {
+    'prompt_recipes': ['created_at', 'updated_at'],
+    'data_dictionary_entries': ['created_at', 'updated_at'],
+    'dictionary_assets': ['created_at', 'updated_at', 'last_queried_at'],
+    'dictionary_fields': ['created_at', 'updated_at', 'last_queried_at'],
+    'dictionary_relationships': ['created_at', 'updated_at'],
+    'dictionary_profiles': ['computed_at'],
+    'dictionary_usage_logs': ['event_at'],
+}
+
+DEFAULTED_COLUMNS = ('created_at', 'updated_at')
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        # One ALTER TABLE per table so each is rewritten (and reindexed) once
+        with maintenance_settings():
+            for table, columns in TIMESTAMP_COLUMNS.items():
+                clauses = [
+                    f"ALTER COLUMN {column} TYPE timestamptz USING {column} AT TIME ZONE 'UTC'"
+                    for column in columns
+                ]
+                clauses += [
+                    f'ALTER COLUMN {column} SET DEFAULT NOW()'
+                    for column in columns if column in DEFAULTED_COLUMNS
+                ]
+                op.execute(f"ALTER TABLE {table} {', '.join(clauses)}")
+
+        op.execute("""
+            CREATE OR REPLACE FUNCTION set_updated_at()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW.updated_at = NOW();
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """)
+        for table, columns in TIMESTAMP_COLUMNS.items():
+            if 'updated_at' in columns:
+                op.execute(f"""
+                    CREATE TRIGGER {table}_set_updated_at
+                    BEFORE UPDATE ON {table}
+                    FOR EACH ROW
+                    EXECUTE FUNCTION set_updated_at();
+                """)
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if 'updated_at' in columns:
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        clauses = [
+            f'ALTER COLUMN {column} DROP DEFAULT'
+            for column in columns if column in DEFAULTED_COLUMNS
+        ]
+        clauses += [
+            f"ALTER COLUMN {column} TYPE timestamp USING {column} AT TIME ZONE 'UTC'"
+            for column in columns
+        ]
+        op.execute(f"ALTER TABLE {table} {', '.join(clauses)}")
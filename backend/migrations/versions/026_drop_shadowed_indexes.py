@@ -0,0 +1,45 @@
+"""Drop single-column indexes shadowed by composite indexes
+
+Revision ID: 026_drop_shadowed_indexes
+Revises: 025_timestamptz
+Create Date: 2026-10-17
+
+Each of these indexes is the leading column of a wider index that serves
+the same lookups, so it only costs an extra index write per row:
+
+- ix_table_links_database_id     -> ix_table_links_table_lookup
+- ix_table_links_analysis_id     -> ix_table_links_analysis_tables
+- ix_analysis_jobs_user_id       -> ix_analysis_jobs_user_status_created
+- ix_data_dictionary_entries_database_name -> uq_dictionary_entry_version
+
+ix_data_dictionary_entries_schema_name and _table_name stay: they are not
+leading columns of any other index, and the dictionary listing filters on
+either one alone.
+"""
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '026_drop_shadowed_indexes'
+down_revision = '025_timestamptz'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        # table_analysis_links is partitioned, which rules out CONCURRENTLY
+        op.drop_index('ix_table_links_database_id', table_name='table_analysis_links')
+        op.drop_index('ix_table_links_analysis_id', table_name='table_analysis_links')
+
+        drop_index_concurrently('ix_analysis_jobs_user_id', 'analysis_jobs')
+        drop_index_concurrently('ix_data_dictionary_entries_database_name', 'data_dictionary_entries')
+
+
+def downgrade() -> None:
+    create_index_concurrently('ix_data_dictionary_entries_database_name', 'data_dictionary_entries', ['database_name'])
+    create_index_concurrently('ix_analysis_jobs_user_id', 'analysis_jobs', ['user_id'])
+
+    op.create_index('ix_table_links_analysis_id', 'table_analysis_links', ['analysis_id'])
+    op.create_index('ix_table_links_database_id', 'table_analysis_links', ['database_id'])
@@ -0,0 +1,57 @@
+"""Use bigint identity columns for prompt recipe and dictionary ids
+
+Revision ID: 027_identity_primary_keys
+Revises: 026_drop_shadowed_indexes
+Create Date: 2026-10-17
+
+prompt_recipes.id and data_dictionary_entries.id were created as serial
+integers. They become GENERATED ALWAYS AS IDENTITY bigints:
+
+- data_dictionary_entries gains a row per column per version, so bigint
+  removes the 2^31 ceiling;
+- identity sequences belong to the column, so dumps/restores and
+  ownership changes cannot detach them;
+- CACHE 256 lets concurrent dictionary imports draw ids without
+  contending on the sequence.
+
+The application never supplies ids, so ALWAYS does not affect inserts.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '027_identity_primary_keys'
+down_revision = '026_drop_shadowed_indexes'
+branch_labels = None
+depends_on = None
+
+TABLES = ('prompt_recipes', 'data_dictionary_entries')
+
+
+def _restart_sequence(table: str) -> None:
+    op.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+    )
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        for table in TABLES:
+            # Detach and drop the serial sequence before the identity takes its name
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT')
+            op.execute(f'DROP SEQUENCE IF EXISTS {table}_id_seq')
+            op.execute(
+                f'ALTER TABLE {table} '
+                f'ALTER COLUMN id TYPE bigint, '
+                f'ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (CACHE 256)'
+            )
+            _restart_sequence(table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY, ALTER COLUMN id TYPE integer')
+        op.execute(f'CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id')
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+        _restart_sequence(table)
@@ -0,0 +1,158 @@
+"""Track data dictionary version validity as a tstzrange
+
+Revision ID: 028_dictionary_validity
+Revises: 027_identity_primary_keys
+Create Date: 2026-10-17
+
+Each data_dictionary_entries version gets valid_range, the period during
+which it was the active documentation for its column. An exclusion
+constraint guarantees that the versions of one column never overlap, which
+is_active alone could not enforce, and its GiST index serves point-in-time
+lookups:
+
+    SELECT * FROM data_dictionary_entries
+    WHERE database_name = ... AND table_name = ...
+      AND valid_range @> TIMESTAMPTZ '2026-01-01'
+
+"Current" is valid_range @> now(); history is ORDER BY lower(valid_range).
+
+is_active and version_number stay, since the API and UI are built on them.
+A trigger derives valid_range from is_active transitions, so existing
+writers need no changes: inserting an active version opens [now, ),
+deactivating closes the range at now, and re-activating (restore) opens a
+new range at now. The constraint is deferred to commit because the
+service deactivates the old version and inserts the new one in either
+order within a transaction.
+
+Existing rows are backfilled from created_at, ordered by version_number:
+each inactive version runs until the next one starts (the last until its
+updated_at), and the active version runs from after the history onward.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '028_dictionary_validity'
+down_revision = '027_identity_primary_keys'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    op.execute('ALTER TABLE data_dictionary_entries ADD COLUMN valid_range tstzrange')
+
+    # Inactive versions: contiguous ranges in version order
+    op.execute("""
+        WITH entries AS (
+            SELECT
+                id, database_name, schema_name, table_name, column_name,
+                version_number, created_at, updated_at,
+                is_active AND version_number = max(version_number) FILTER (WHERE is_active) OVER (
+                    PARTITION BY database_name, schema_name, table_name, column_name
+                ) AS is_current
+            FROM data_dictionary_entries
+        ),
+        history AS (
+            SELECT
+                id, database_name, schema_name, table_name, column_name,
+                version_number, updated_at,
+                max(created_at) OVER (
+                    PARTITION BY database_name, schema_name, table_name, column_name
+                    ORDER BY version_number, id
+                ) AS starts_at
+            FROM entries
+            WHERE NOT is_current
+        ),
+        ranges AS (
+            SELECT
+                id,
+                starts_at,
+                COALESCE(
+                    lead(starts_at) OVER (
+                        PARTITION BY database_name, schema_name, table_name, column_name
+                        ORDER BY version_number, id
+                    ),
+                    GREATEST(updated_at, starts_at)
+                ) AS ends_at
+            FROM history
+        )
+        UPDATE data_dictionary_entries d
+        SET valid_range = tstzrange(r.starts_at, r.ends_at)
+        FROM ranges r
+        WHERE d.id = r.id
+    """)
+
+    # Active versions: open-ended, starting after their column's history
+    op.execute("""
+        UPDATE data_dictionary_entries d
+        SET valid_range = tstzrange(
+            GREATEST(
+                d.created_at,
+                (
+                    SELECT max(upper(h.valid_range))
+                    FROM data_dictionary_entries h
+                    WHERE h.database_name = d.database_name
+                      AND h.schema_name = d.schema_name
+                      AND h.table_name = d.table_name
+                      AND h.column_name = d.column_name
+                      AND h.valid_range IS NOT NULL
+                )
+            ),
+            NULL
+        )
+        WHERE d.valid_range IS NULL
+    """)
+
+    op.alter_column('data_dictionary_entries', 'valid_range', nullable=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_dictionary_entry_valid_range()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                IF NEW.valid_range IS NULL THEN
+                    NEW.valid_range := CASE
+                        WHEN NEW.is_active THEN tstzrange(NOW(), NULL)
+                        ELSE 'empty'::tstzrange
+                    END;
+                END IF;
+            ELSIF OLD.is_active AND NOT NEW.is_active AND NOT isempty(OLD.valid_range) THEN
+                NEW.valid_range := tstzrange(
+                    lower(OLD.valid_range),
+                    GREATEST(NOW(), lower(OLD.valid_range))
+                );
+            ELSIF NOT OLD.is_active AND NEW.is_active THEN
+                NEW.valid_range := tstzrange(NOW(), NULL);
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER data_dictionary_entries_valid_range
+        BEFORE INSERT OR UPDATE OF is_active ON data_dictionary_entries
+        FOR EACH ROW
+        EXECUTE FUNCTION set_dictionary_entry_valid_range();
+    """)
+
+    op.execute("""
+        ALTER TABLE data_dictionary_entries
+        ADD CONSTRAINT ex_dictionary_entry_valid_range
+        EXCLUDE USING gist (
+            database_name WITH =,
+            schema_name WITH =,
+            table_name WITH =,
+            column_name WITH =,
+            valid_range WITH &&
+        )
+        DEFERRABLE INITIALLY DEFERRED
+    """)
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE data_dictionary_entries DROP CONSTRAINT ex_dictionary_entry_valid_range')
+    op.execute('DROP TRIGGER IF EXISTS data_dictionary_entries_valid_range ON data_dictionary_entries')
+    op.execute('DROP FUNCTION IF EXISTS set_dictionary_entry_valid_range()')
+    op.drop_column('data_dictionary_entries', 'valid_range')
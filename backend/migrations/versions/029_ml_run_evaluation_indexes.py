@@ -0,0 +1,54 @@
+"""Index the ML run and evaluation result listing paths
+
+Revision ID: 029_ml_run_evaluation_indexes
+Revises: 028_dictionary_validity
+Create Date: 2026-10-17
+
+- ix_ml_run_started_at (started_at DESC): list_runs orders by started_at
+  DESC LIMIT n, with or without a model/recipe/status filter, and sorted the
+  whole table for it.
+- ix_evaluation_result_run_executed (run_id, executed_at DESC):
+  list_run_results filters by run and orders by executed_at. It replaces
+  the single-column run_id index from 022.
+- ix_evaluation_result_status_executed (status, executed_at DESC) WHERE
+  status <> 'pass': "warned/failed evaluations in the last N hours" reads
+  only the non-passing results, which stay a small share of the table.
+"""
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '029_ml_run_evaluation_indexes'
+down_revision = '028_dictionary_validity'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        create_index_concurrently('ix_ml_run_started_at', 'ml_run', [sa.text('started_at DESC')])
+
+        create_index_concurrently(
+            'ix_evaluation_result_run_executed',
+            'evaluation_result',
+            ['run_id', sa.text('executed_at DESC')]
+        )
+        drop_index_concurrently('ix_evaluation_result_run_id', 'evaluation_result')
+
+        create_index_concurrently(
+            'ix_evaluation_result_status_executed',
+            'evaluation_result',
+            ['status', sa.text('executed_at DESC')],
+            postgresql_where=sa.text("status <> 'pass'")
+        )
+
+
+def downgrade() -> None:
+    drop_index_concurrently('ix_evaluation_result_status_executed', 'evaluation_result')
+
+    create_index_concurrently('ix_evaluation_result_run_id', 'evaluation_result', ['run_id'])
+    drop_index_concurrently('ix_evaluation_result_run_executed', 'evaluation_result')
+
+    drop_index_concurrently('ix_ml_run_started_at', 'ml_run')
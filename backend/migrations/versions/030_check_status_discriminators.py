@@ -0,0 +1,71 @@
+"""Constrain status and type discriminators to their known values
+
+Revision ID: 030_check_discriminators
+Revises: 029_ml_run_evaluation_indexes
+Create Date: 2026-10-17
+
+The status/level/type columns are free-form varchar, although the
+application only ever writes the values of its Python enums
+(ml_development.models, evaluation_packs.models, the job service). CHECK
+constraints pin them to those values, so the database rejects typos that
+would silently fall out of every status filter and partial index.
+
+These are CHECK constraints rather than PostgreSQL ENUM types. SQLAlchemy's
+psycopg dialect binds strings as ::VARCHAR, and varchar has no assignment
+cast to an enum, so every writer would have to change. Postgres already
+keeps most-common-value statistics for varchar columns, so an ENUM would
+not improve selectivity estimates either. To extend a list, drop and re-add
+its constraint.
+
+Constraints are added NOT VALID and validated separately, so existing rows
+are checked under SHARE UPDATE EXCLUSIVE instead of blocking writes.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '030_check_discriminators'
+down_revision = '029_ml_run_evaluation_indexes'
+branch_labels = None
+depends_on = None
+
+MODEL_FAMILIES = ('pricing', 'next_best_action', 'location_scoring', 'forecasting')
+EVALUATION_STATUSES = ('pass', 'warn', 'fail')
+
+# (table, column) -> allowed values
+ALLOWED_VALUES = {
+    ('analysis_jobs', 'status'): ('pending', 'running', 'completed', 'failed', 'cancelled'),
+    ('ml_recipe', 'status'): ('draft', 'approved', 'archived'),
+    ('ml_recipe', 'level'): ('baseline', 'industry', 'client'),
+    ('ml_recipe', 'model_family'): MODEL_FAMILIES,
+    ('ml_model', 'status'): ('draft', 'staging', 'production', 'retired'),
+    ('ml_model', 'model_family'): MODEL_FAMILIES,
+    ('ml_run', 'status'): ('queued', 'running', 'succeeded', 'failed'),
+    ('ml_run', 'run_type'): ('train', 'eval', 'backtest'),
+    ('evaluation_pack', 'status'): ('draft', 'approved', 'archived'),
+    ('evaluation_result', 'status'): EVALUATION_STATUSES,
+    ('monitor_evaluation_snapshot', 'status'): EVALUATION_STATUSES,
+}
+
+
+def _constraint_name(table: str, column: str) -> str:
+    return f'ck_{table}_{column}'
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        for (table, column), values in ALLOWED_VALUES.items():
+            allowed = ', '.join(f"'{value}'" for value in values)
+            op.execute(
+                f'ALTER TABLE {table} ADD CONSTRAINT {_constraint_name(table, column)} '
+                f'CHECK ({column} IN ({allowed})) NOT VALID'
+            )
+
+        for table, column in ALLOWED_VALUES:
+            op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {_constraint_name(table, column)}')
+
+
+def downgrade() -> None:
+    for table, column in ALLOWED_VALUES:
+        op.drop_constraint(_constraint_name(table, column), table, type_='check')
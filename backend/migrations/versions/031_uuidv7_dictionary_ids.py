@@ -0,0 +1,69 @@
+"""Default the enhanced dictionary ids to time-ordered UUIDv7
+
+Revision ID: 031_uuidv7_dictionary_ids
+Revises: 030_check_discriminators
+Create Date: 2026-10-17
+
+The five tables from 011 had uuid primary keys filled with random UUIDv4
+values, so every insert landed on a random leaf of the primary key btree.
+UUIDv7 (RFC 9562) starts with a 48-bit millisecond timestamp, so new ids
+append to the rightmost leaf. That matters most for dictionary_usage_logs
+and dictionary_profiles, which only grow.
+
+gen_uuid_v7() is defined here in SQL rather than taken from the pg_uuidv7
+extension, which managed Postgres offerings do not all ship. It overlays
+the timestamp onto gen_random_uuid() and flips the version nibble from 4 to 7.
+The ORM models generate ids with the matching
+dictionary_enhanced_models.uuid7(); the server default covers raw SQL
+inserts. Existing ids are left alone.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '031_uuidv7_dictionary_ids'
+down_revision = '030_check_discriminators'
+branch_labels = None
+depends_on = None
+
+TABLES = (
+    'dictionary_assets',
+    'dictionary_fields',
+    'dictionary_relationships',
+    'dictionary_profiles',
+    'dictionary_usage_logs',
+)
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        op.execute("""
+            CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+                SELECT encode(
+                    set_bit(
+                        set_bit(
+                            overlay(
+                                uuid_send(gen_random_uuid())
+                                PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                                FROM 1 FOR 6
+                            ),
+                            52, 1
+                        ),
+                        53, 1
+                    ),
+                    'hex'
+                )::uuid
+            $$ LANGUAGE sql VOLATILE
+        """)
+
+        for table in TABLES:
+            op.alter_column(table, 'id', server_default=sa.text('gen_uuid_v7()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
+
+    op.execute('DROP FUNCTION IF EXISTS gen_uuid_v7()')
@@ -0,0 +1,57 @@
+"""Consolidate the single-column dictionary_assets indexes
+
+Revision ID: 032_dict_asset_indexes
+Revises: 031_uuidv7_dictionary_ids
+Create Date: 2026-10-17
+
+search_assets always filters on connection_id, optionally narrows by
+schema_name, trust_tier or business_domain, and orders by (schema_name,
+table_name). 011 gave each of those columns its own index, so the planner
+either picked one and filtered the rest or bitmap-ANDed several.
+
+- ix_dict_assets_connection_id, _schema and _table are dropped: the
+  uq_dict_asset index (connection_id, schema_name, table_name) already
+  serves connection and connection+schema lookups in listing order.
+- ix_dict_assets_trust_tier becomes ix_dict_assets_conn_trust_schema_table
+  (connection_id, trust_tier, schema_name, table_name): equality columns
+  first, then the ORDER BY columns, so a trust-tier listing is read in
+  order without a sort. Putting trust_tier last would leave the index
+  ordered by schema and unable to skip to one tier.
+
+ix_dict_assets_domain is kept for the business_domain filter.
+"""
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '032_dict_asset_indexes'
+down_revision = '031_uuidv7_dictionary_ids'
+branch_labels = None
+depends_on = None
+
+# index name -> column, as created by 011
+REPLACED_INDEXES = {
+    'ix_dict_assets_connection_id': 'connection_id',
+    'ix_dict_assets_schema': 'schema_name',
+    'ix_dict_assets_table': 'table_name',
+    'ix_dict_assets_trust_tier': 'trust_tier',
+}
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        create_index_concurrently(
+            'ix_dict_assets_conn_trust_schema_table',
+            'dictionary_assets',
+            ['connection_id', 'trust_tier', 'schema_name', 'table_name']
+        )
+
+        for name in REPLACED_INDEXES:
+            drop_index_concurrently(name, 'dictionary_assets')
+
+
+def downgrade() -> None:
+    for name, column in REPLACED_INDEXES.items():
+        create_index_concurrently(name, 'dictionary_assets', [column])
+
+    drop_index_concurrently('ix_dict_assets_conn_trust_schema_table', 'dictionary_assets')
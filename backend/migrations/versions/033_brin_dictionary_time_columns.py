@@ -0,0 +1,48 @@
+"""Use BRIN for dictionary usage and profile timestamps
+
+Revision ID: 033_brin_dictionary_time_columns
+Revises: 032_dict_asset_indexes
+Create Date: 2026-10-17
+
+dictionary_usage_logs and dictionary_profiles are append-only, and
+event_at/computed_at are set at insert time, so both follow the physical
+row order. The only queries that use them alone are range filters:
+aggregate_usage_stats reads the last N days of usage logs. The standalone
+btrees are replaced with BRIN indexes, as 023 did for ml_monitor_snapshot.
+
+"Latest profile" lookups order by computed_at within a column, which is
+served by ix_dict_profiles_latest and is unaffected.
+"""
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '033_brin_dictionary_time_columns'
+down_revision = '032_dict_asset_indexes'
+branch_labels = None
+depends_on = None
+
+# (table, column, btree index created by 011)
+TIME_COLUMNS = [
+    ('dictionary_usage_logs', 'event_at', 'ix_dict_usage_event_at'),
+    ('dictionary_profiles', 'computed_at', 'ix_dict_profiles_computed_at'),
+]
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        for table, column, btree_index in TIME_COLUMNS:
+            create_index_concurrently(
+                f'{btree_index}_brin',
+                table,
+                [column],
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32}
+            )
+            drop_index_concurrently(btree_index, table)
+
+
+def downgrade() -> None:
+    for table, column, btree_index in reversed(TIME_COLUMNS):
+        create_index_concurrently(btree_index, table, [column])
+        drop_index_concurrently(f'{btree_index}_brin', table)
@@ -0,0 +1,54 @@
+"""Widen dictionary row, byte and usage counters to bigint
+
+Revision ID: 034_bigint_dictionary_counts
+Revises: 033_brin_dictionary_time_columns
+Create Date: 2026-10-17
+
+These counters describe the profiled warehouse tables, not the dictionary
+itself, and 011 created them as integer. A table over 2 GiB already
+overflows size_bytes, and fact tables routinely pass 2^31 rows, so profiling
+them failed on insert. distinct_count_estimate is widened along with
+distinct_count.
+
+Each table is altered in a single ALTER TABLE so it is rewritten once. The
+dictionary tables hold one row per profiled table/column, so the rewrite is
+short; on a much larger deployment, add a bigint column, backfill it in
+batches and swap names instead.
+
+Downgrade fails if any value no longer fits in an integer.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '034_bigint_dictionary_counts'
+down_revision = '033_brin_dictionary_time_columns'
+branch_labels = None
+depends_on = None
+
+COUNT_COLUMNS = {
+    'dictionary_assets': ['row_count_estimate', 'size_bytes', 'query_count_30d'],
+    'dictionary_profiles': [
+        'row_count_estimate',
+        'null_count',
+        'distinct_count',
+        'distinct_count_estimate',
+        'sample_size',
+    ],
+}
+
+
+def _set_type(type_: str) -> None:
+    for table, columns in COUNT_COLUMNS.items():
+        clauses = ', '.join(f'ALTER COLUMN {column} TYPE {type_}' for column in columns)
+        op.execute(f'ALTER TABLE {table} {clauses}')
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        _set_type('bigint')
+
+
+def downgrade() -> None:
+    _set_type('integer')
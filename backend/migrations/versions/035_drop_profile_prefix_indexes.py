@@ -0,0 +1,61 @@
+"""Drop dictionary_profiles indexes covered by ix_dict_profiles_latest
+
+Revision ID: 035_drop_profile_prefix_indexes
+Revises: 034_bigint_dictionary_counts
+Create Date: 2026-10-17
+
+Every profile lookup filters on connection_id, schema_name and table_name
+(and usually column_name), which are the leading columns of
+ix_dict_profiles_latest. The single-column indexes on connection_id,
+schema_name and table_name served nothing that index does not, but each
+added a write to every profile insert.
+
+ix_dict_profiles_latest is rebuilt with computed_at DESC to match the
+ORDER BY of get_latest_profile and get_profiles_for_table. A backward scan
+would also work, but it is slower than a forward scan. The new index is
+built under a temporary name and renamed into place, so profile lookups
+always have an index.
+
+ix_dict_profiles_column stays: column_name is not a leading column anywhere.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '035_drop_profile_prefix_indexes'
+down_revision = '034_bigint_dictionary_counts'
+branch_labels = None
+depends_on = None
+
+# index name -> column, as created by 011
+PREFIX_INDEXES = {
+    'ix_dict_profiles_connection_id': 'connection_id',
+    'ix_dict_profiles_schema': 'schema_name',
+    'ix_dict_profiles_table': 'table_name',
+}
+
+PROFILE_KEY = ['connection_id', 'schema_name', 'table_name', 'column_name']
+
+
+def _replace_latest_index(computed_at) -> None:
+    create_index_concurrently('ix_dict_profiles_latest_new', 'dictionary_profiles', PROFILE_KEY + [computed_at])
+    drop_index_concurrently('ix_dict_profiles_latest', 'dictionary_profiles')
+    op.execute('ALTER INDEX ix_dict_profiles_latest_new RENAME TO ix_dict_profiles_latest')
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        _replace_latest_index(sa.text('computed_at DESC'))
+
+        for name in PREFIX_INDEXES:
+            drop_index_concurrently(name, 'dictionary_profiles')
+
+
+def downgrade() -> None:
+    for name, column in PREFIX_INDEXES.items():
+        create_index_concurrently(name, 'dictionary_profiles', [column])
+
+    _replace_latest_index('computed_at')
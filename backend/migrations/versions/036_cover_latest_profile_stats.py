@@ -0,0 +1,45 @@
+"""Cover the latest-profile stats in ix_dict_profiles_latest
+
+Revision ID: 036_cover_latest_profile_stats
+Revises: 035_drop_profile_prefix_indexes
+Create Date: 2026-10-17
+
+get_dictionary_context (LLM grounding for a table) reads only the null
+fraction and distinct counts of each column's latest profile, via
+get_profile_summaries_for_table. Including those columns in
+ix_dict_profiles_latest lets that DISTINCT ON query run as an index-only
+scan instead of a heap fetch per column. The INCLUDE columns are stored in
+the leaf pages but are not part of the sort key.
+
+The full-row profile endpoints still select every column and gain nothing
+from INCLUDE, so only the columns that the summary query reads are covered.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '036_cover_latest_profile_stats'
+down_revision = '035_drop_profile_prefix_indexes'
+branch_labels = None
+depends_on = None
+
+PROFILE_KEY = ['connection_id', 'schema_name', 'table_name', 'column_name', sa.text('computed_at DESC')]
+SUMMARY_COLUMNS = ['null_fraction', 'distinct_count', 'distinct_count_estimate']
+
+
+def _replace_latest_index(**kw) -> None:
+    create_index_concurrently('ix_dict_profiles_latest_new', 'dictionary_profiles', PROFILE_KEY, **kw)
+    drop_index_concurrently('ix_dict_profiles_latest', 'dictionary_profiles')
+    op.execute('ALTER INDEX ix_dict_profiles_latest_new RENAME TO ix_dict_profiles_latest')
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        _replace_latest_index(postgresql_include=SUMMARY_COLUMNS)
+
+
+def downgrade() -> None:
+    _replace_latest_index()
@@ -0,0 +1,38 @@
+"""Store dictionary_usage_logs.query_hash as a raw SHA-256 digest
+
+Revision ID: 037_bytea_usage_query_hash
+Revises: 036_cover_latest_profile_stats
+Create Date: 2026-10-17
+
+query_hash held the 64-character hex form of a SHA-256 digest. Stored as
+bytea it is 32 bytes, so rows and ix_dict_usage_query_hash are about half
+the size. Equality probes also become a plain byte comparison instead of
+a collation-aware text comparison.
+
+Existing values are decoded in place. The ALTER rewrites the table and
+rebuilds the index.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '037_bytea_usage_query_hash'
+down_revision = '036_cover_latest_profile_stats'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        op.execute(
+            "ALTER TABLE dictionary_usage_logs "
+            "ALTER COLUMN query_hash TYPE bytea USING decode(query_hash, 'hex')"
+        )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE dictionary_usage_logs "
+        "ALTER COLUMN query_hash TYPE varchar(64) USING encode(query_hash, 'hex')"
+    )
@@ -0,0 +1,48 @@
+"""GIN-index the enhanced dictionary tag and usage arrays
+
+Revision ID: 038_dictionary_jsonb_gin_indexes
+Revises: 037_bytea_usage_query_hash
+Create Date: 2026-10-17
+
+The JSONB arrays that answer "assets tagged pii" or "queries that touched
+table X" are indexed with jsonb_path_ops, as in 020. Query them with
+containment (tags @> '["pii"]'); jsonb_path_ops does not serve the ? and
+?| key-existence operators.
+
+top_values, top_filters and top_group_bys are only ever read whole with
+their row and are left unindexed.
+"""
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '038_dictionary_jsonb_gin_indexes'
+down_revision = '037_bytea_usage_query_hash'
+branch_labels = None
+depends_on = None
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ('ix_dict_assets_tags_gin', 'dictionary_assets', 'tags'),
+    ('ix_dict_assets_issue_tags_gin', 'dictionary_assets', 'issue_tags'),
+    ('ix_dict_fields_tags_gin', 'dictionary_fields', 'tags'),
+    ('ix_dict_usage_tables_used_gin', 'dictionary_usage_logs', 'tables_used'),
+    ('ix_dict_usage_columns_used_gin', 'dictionary_usage_logs', 'columns_used'),
+]
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        for name, table, column in GIN_INDEXES:
+            create_index_concurrently(
+                name,
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'}
+            )
+
+
+def downgrade() -> None:
+    for name, table, _ in GIN_INDEXES:
+        drop_index_concurrently(name, table)
@@ -0,0 +1,81 @@
+"""Mirror dictionary tags into a text[] column for tag filters
+
+Revision ID: 039_flatten_dictionary_tags
+Revises: 038_dictionary_jsonb_gin_indexes
+Create Date: 2026-10-17
+
+dictionary_assets.tags and dictionary_fields.tags are JSONB arrays of
+strings. A trigger now keeps a tags_flat text[] copy, which tag filters
+(search_assets(tag=...)) match with tags_flat @> ARRAY[...]. That uses a
+plain array GIN index and does not unpack the JSONB of each candidate row.
+tags stays the source of truth, and the application never writes
+tags_flat. A generated column is not possible here, because generated
+columns cannot use subqueries or set-returning functions.
+
+The tags GIN indexes from 038 are dropped because the tags_flat indexes
+replace them.
+"""
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '039_flatten_dictionary_tags'
+down_revision = '038_dictionary_jsonb_gin_indexes'
+branch_labels = None
+depends_on = None
+
+# table -> (tags_flat GIN index, jsonb tags GIN index from 038)
+TAGGED_TABLES = {
+    'dictionary_assets': ('ix_dict_assets_tags_flat', 'ix_dict_assets_tags_gin'),
+    'dictionary_fields': ('ix_dict_fields_tags_flat', 'ix_dict_fields_tags_gin'),
+}
+
+FLATTEN_TAGS = (
+    "CASE WHEN jsonb_typeof({tags}) = 'array' "
+    "THEN ARRAY(SELECT jsonb_array_elements_text({tags})) END"
+)
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION set_tags_flat()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW.tags_flat = {FLATTEN_TAGS.format(tags='NEW.tags')};
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """)
+
+        for table in TAGGED_TABLES:
+            op.execute(f'ALTER TABLE {table} ADD COLUMN tags_flat text[]')
+            op.execute(f"""
+                CREATE TRIGGER {table}_set_tags_flat
+                BEFORE INSERT OR UPDATE OF tags ON {table}
+                FOR EACH ROW
+                EXECUTE FUNCTION set_tags_flat();
+            """)
+            op.execute(f"UPDATE {table} SET tags_flat = {FLATTEN_TAGS.format(tags='tags')} WHERE tags IS NOT NULL")
+
+        for table, (flat_index, jsonb_index) in TAGGED_TABLES.items():
+            create_index_concurrently(flat_index, table, ['tags_flat'], postgresql_using='gin')
+            drop_index_concurrently(jsonb_index, table)
+
+
+def downgrade() -> None:
+    for table, (flat_index, jsonb_index) in TAGGED_TABLES.items():
+        create_index_concurrently(
+            jsonb_index,
+            table,
+            ['tags'],
+            postgresql_using='gin',
+            postgresql_ops={'tags': 'jsonb_path_ops'}
+        )
+        drop_index_concurrently(flat_index, table)
+
+    for table in TAGGED_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_set_tags_flat ON {table}')
+        op.execute(f'ALTER TABLE {table} DROP COLUMN tags_flat')
+    op.execute('DROP FUNCTION IF EXISTS set_tags_flat()')
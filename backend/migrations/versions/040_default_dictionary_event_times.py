@@ -0,0 +1,39 @@
+"""Default dictionary usage and profile timestamps to now()
+
+Revision ID: 040_default_dictionary_event_times
+Revises: 039_flatten_dictionary_tags
+Create Date: 2026-10-17
+
+025 gave the created_at/updated_at columns of the 011 tables NOW()
+defaults, but dictionary_usage_logs.event_at and
+dictionary_profiles.computed_at still had to be supplied by every writer.
+With a default, raw SQL inserts and seeds can omit them, as
+seed_evaluation_packs does for its timestamps. Setting a default only
+touches the catalog.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '040_default_dictionary_event_times'
+down_revision = '039_flatten_dictionary_tags'
+branch_labels = None
+depends_on = None
+
+EVENT_TIME_COLUMNS = [
+    ('dictionary_usage_logs', 'event_at'),
+    ('dictionary_profiles', 'computed_at'),
+]
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        for table, column in EVENT_TIME_COLUMNS:
+            op.alter_column(table, column, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table, column in EVENT_TIME_COLUMNS:
+        op.alter_column(table, column, server_default=None)
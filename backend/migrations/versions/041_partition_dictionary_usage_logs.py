@@ -0,0 +1,154 @@
+"""Range-partition dictionary_usage_logs by event_at
+
+Revision ID: 041_partition_dictionary_usage_logs
+Revises: 040_default_dictionary_event_times
+Create Date: 2026-10-17
+
+dictionary_usage_logs gets a row for every logged query and is only read
+over recent windows (aggregate_usage_stats reads the last N days). Monthly
+RANGE partitions on event_at let those reads prune to one or two months.
+They also let retention drop a month with DETACH/DROP PARTITION instead of
+DELETE + VACUUM. This follows the table_analysis_links layout from 017.
+
+Partitions are named dictionary_usage_logs_<year>_<month>. They are created
+by create_dictionary_usage_logs_partitions(start_date, months_ahead), which
+is idempotent. The migration covers existing rows through three months
+ahead. Run the function periodically (e.g. SELECT
+create_dictionary_usage_logs_partitions()) to stay ahead of NOW(). A DEFAULT
+partition catches anything outside the ranges. If rows for a month landed
+there before its partition existed, the function detaches the DEFAULT
+partition, moves them into the new partition and reattaches it. That briefly
+takes an ACCESS EXCLUSIVE lock on the table.
+
+The primary key becomes (id, event_at), because unique constraints on a
+partitioned table must include the partition key. ids are UUIDv7 and stay
+unique on their own.
+
+dictionary_profiles is not partitioned: latest-profile lookups filter by
+column with no computed_at bound, so they would probe every partition, and
+old profiles are not purged by age.
+"""
+from alembic import op
+from migrations.helpers import maintenance_settings
+
+
+# revision identifiers, used by Alembic.
+revision = '041_partition_dictionary_usage_logs'
+down_revision = '040_default_dictionary_event_times'
+branch_labels = None
+depends_on = None
+
+
+def _create_indexes() -> None:
+    op.create_index('ix_dict_usage_connection_id', 'dictionary_usage_logs', ['connection_id'])
+    op.create_index('ix_dict_usage_query_hash', 'dictionary_usage_logs', ['query_hash'])
+    op.create_index(
+        'ix_dict_usage_event_at_brin',
+        'dictionary_usage_logs',
+        ['event_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+    for column in ('tables_used', 'columns_used'):
+        op.create_index(
+            f'ix_dict_usage_{column}_gin',
+            'dictionary_usage_logs',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'}
+        )
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE dictionary_usage_logs RENAME TO dictionary_usage_logs_unpartitioned')
+    op.execute('ALTER TABLE dictionary_usage_logs_unpartitioned RENAME CONSTRAINT dictionary_usage_logs_pkey TO dictionary_usage_logs_unpartitioned_pkey')
+
+    op.execute("""
+        CREATE TABLE dictionary_usage_logs (
+            LIKE dictionary_usage_logs_unpartitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id, event_at)
+        ) PARTITION BY RANGE (event_at)
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION create_dictionary_usage_logs_partitions(
+            start_date date DEFAULT CURRENT_DATE,
+            months_ahead integer DEFAULT 3
+        )
+        RETURNS void AS $$
+        DECLARE
+            month_start date := date_trunc('month', start_date)::date;
+            month_end date;
+            last_start date := (date_trunc('month', NOW()) + make_interval(months => months_ahead))::date;
+            partition_name text;
+            move_rows boolean;
+        BEGIN
+            WHILE month_start <= last_start LOOP
+                month_end := (month_start + interval '1 month')::date;
+                partition_name := format('dictionary_usage_logs_%s', to_char(month_start, 'YYYY_MM'));
+
+                IF to_regclass(quote_ident(partition_name)) IS NULL THEN
+                    -- Rows for this month already in the DEFAULT partition would
+                    -- violate its new constraint, so move them over while it is detached
+                    move_rows := false;
+                    IF to_regclass('dictionary_usage_logs_default') IS NOT NULL THEN
+                        move_rows := EXISTS (
+                            SELECT 1 FROM dictionary_usage_logs_default
+                            WHERE event_at >= month_start AND event_at < month_end
+                        );
+                    END IF;
+                    IF move_rows THEN
+                        ALTER TABLE dictionary_usage_logs DETACH PARTITION dictionary_usage_logs_default;
+                    END IF;
+
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF dictionary_usage_logs FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, month_start, month_end
+                    );
+
+                    IF move_rows THEN
+                        INSERT INTO dictionary_usage_logs
+                        SELECT * FROM dictionary_usage_logs_default
+                        WHERE event_at >= month_start AND event_at < month_end;
+                        DELETE FROM dictionary_usage_logs_default
+                        WHERE event_at >= month_start AND event_at < month_end;
+                        ALTER TABLE dictionary_usage_logs ATTACH PARTITION dictionary_usage_logs_default DEFAULT;
+                    END IF;
+                END IF;
+
+                month_start := month_end;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        SELECT create_dictionary_usage_logs_partitions(
+            COALESCE((SELECT min(event_at)::date FROM dictionary_usage_logs_unpartitioned), CURRENT_DATE)
+        )
+    """)
+    op.execute('CREATE TABLE dictionary_usage_logs_default PARTITION OF dictionary_usage_logs DEFAULT')
+
+    op.execute('INSERT INTO dictionary_usage_logs SELECT * FROM dictionary_usage_logs_unpartitioned')
+    op.execute('DROP TABLE dictionary_usage_logs_unpartitioned')
+
+    # Indexes on the parent cascade to every partition
+    with maintenance_settings():
+        _create_indexes()
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE dictionary_usage_logs RENAME TO dictionary_usage_logs_partitioned')
+    op.execute('ALTER TABLE dictionary_usage_logs_partitioned RENAME CONSTRAINT dictionary_usage_logs_pkey TO dictionary_usage_logs_partitioned_pkey')
+
+    op.execute("""
+        CREATE TABLE dictionary_usage_logs (
+            LIKE dictionary_usage_logs_partitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id)
+        )
+    """)
+    op.execute('INSERT INTO dictionary_usage_logs SELECT * FROM dictionary_usage_logs_partitioned')
+    # Dropping the parent drops all of its partitions
+    op.execute('DROP TABLE dictionary_usage_logs_partitioned')
+    op.execute('DROP FUNCTION IF EXISTS create_dictionary_usage_logs_partitions(date, integer)')
+
+    _create_indexes()
@@ -0,0 +1,110 @@
+"""Make the dictionary_usage_logs partitions unlogged
+
+Revision ID: 042_unlogged_usage_log_partitions
+Revises: 041_partition_dictionary_usage_logs
+Create Date: 2026-10-17
+
+Usage logs are telemetry. They only feed the query_count_30d and
+last_queried_at counters, which aggregate_usage_stats recomputes. Unlogged
+partitions skip WAL, which roughly halves the bytes written per logged
+query.
+
+The trade-offs are accepted for this table:
+- after a crash, Postgres truncates every unlogged partition, so usage
+  counters restart from the next aggregation;
+- unlogged tables are not replicated, so standbys see an empty table.
+  Aggregate on the primary.
+
+A partitioned parent has no storage of its own, so persistence is set per
+partition. Existing partitions are switched (a rewrite of each), and
+create_dictionary_usage_logs_partitions() now creates new ones UNLOGGED.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '042_unlogged_usage_log_partitions'
+down_revision = '041_partition_dictionary_usage_logs'
+branch_labels = None
+depends_on = None
+
+PARTITION_FUNCTION = """
+    CREATE OR REPLACE FUNCTION create_dictionary_usage_logs_partitions(
+        start_date date DEFAULT CURRENT_DATE,
+        months_ahead integer DEFAULT 3
+    )
+    RETURNS void AS $$
+    DECLARE
+        month_start date := date_trunc('month', start_date)::date;
+        month_end date;
+        last_start date := (date_trunc('month', NOW()) + make_interval(months => months_ahead))::date;
+        partition_name text;
+        move_rows boolean;
+    BEGIN
+        WHILE month_start <= last_start LOOP
+            month_end := (month_start + interval '1 month')::date;
+            partition_name := format('dictionary_usage_logs_%s', to_char(month_start, 'YYYY_MM'));
+
+            IF to_regclass(quote_ident(partition_name)) IS NULL THEN
+                -- Rows for this month already in the DEFAULT partition would
+                -- violate its new constraint, so move them over while it is detached
+                move_rows := false;
+                IF to_regclass('dictionary_usage_logs_default') IS NOT NULL THEN
+                    move_rows := EXISTS (
+                        SELECT 1 FROM dictionary_usage_logs_default
+                        WHERE event_at >= month_start AND event_at < month_end
+                    );
+                END IF;
+                IF move_rows THEN
+                    ALTER TABLE dictionary_usage_logs DETACH PARTITION dictionary_usage_logs_default;
+                END IF;
+
+                EXECUTE format(
+                    'CREATE {persistence}TABLE %I PARTITION OF dictionary_usage_logs FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_end
+                );
+
+                IF move_rows THEN
+                    INSERT INTO dictionary_usage_logs
+                    SELECT * FROM dictionary_usage_logs_default
+                    WHERE event_at >= month_start AND event_at < month_end;
+                    DELETE FROM dictionary_usage_logs_default
+                    WHERE event_at >= month_start AND event_at < month_end;
+                    ALTER TABLE dictionary_usage_logs ATTACH PARTITION dictionary_usage_logs_default DEFAULT;
+                END IF;
+            END IF;
+
+            month_start := month_end;
+        END LOOP;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def _set_partitions_persistence(persistence: str) -> None:
+    op.execute(f"""
+        DO $$
+        DECLARE
+            part regclass;
+        BEGIN
+            FOR part IN
+                SELECT inhrelid::regclass FROM pg_inherits
+                WHERE inhparent = 'dictionary_usage_logs'::regclass
+            LOOP
+                EXECUTE format('ALTER TABLE %s SET {persistence}', part);
+            END LOOP;
+        END;
+        $$
+    """)
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        op.execute(PARTITION_FUNCTION.format(persistence='UNLOGGED '))
+        _set_partitions_persistence('UNLOGGED')
+
+
+def downgrade() -> None:
+    op.execute(PARTITION_FUNCTION.format(persistence=''))
+    _set_partitions_persistence('LOGGED')
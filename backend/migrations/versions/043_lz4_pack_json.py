@@ -0,0 +1,37 @@
+"""Compress evaluation pack documents with lz4 and keep them inline
+
+Revision ID: 043_lz4_pack_json
+Revises: 042_unlogged_usage_log_partitions
+Create Date: 2026-10-17
+
+evaluation_pack_version.pack_json documents are a few KB each and are read
+whole on every evaluation. They are compressed with lz4 instead of pglz,
+which compresses and decompresses several times faster at a similar ratio.
+toast_tuple_target is raised to 4096 so that a typical compressed version
+row stays inline, avoiding a TOAST fetch when it is read.
+
+Both settings apply to rows written from now on. Existing rows keep pglz
+until they are rewritten (VACUUM FULL, or any update of the row).
+SET COMPRESSION lz4 requires PostgreSQL 14+ built with lz4, as the stock
+packages and images are.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '043_lz4_pack_json'
+down_revision = '042_unlogged_usage_log_partitions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        op.execute('ALTER TABLE evaluation_pack_version ALTER COLUMN pack_json SET COMPRESSION lz4')
+        op.execute('ALTER TABLE evaluation_pack_version SET (toast_tuple_target = 4096)')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE evaluation_pack_version RESET (toast_tuple_target)')
+    op.execute('ALTER TABLE evaluation_pack_version ALTER COLUMN pack_json SET COMPRESSION default')
@@ -0,0 +1,112 @@
+"""Flag the latest profile of each column
+
+Revision ID: 044_dictionary_profile_is_latest
+Revises: 043_lz4_pack_json
+Create Date: 2026-10-17
+
+Finding a column's current profile meant scanning its history in
+computed_at order (ORDER BY ... LIMIT 1, DISTINCT ON, or max() joined back).
+dictionary_profiles.is_latest marks the current row instead, and the
+partial unique index ix_dict_profiles_latest_one enforces one current row
+per (connection, schema, table, column). Latest-profile reads become a
+lookup on that small index. It INCLUDEs the summary stats that 036 had
+put on ix_dict_profiles_latest, and that index goes back to a plain key
+for the full-history listing.
+
+Profiles are written by external profilers as well as the app, so a BEFORE
+INSERT trigger maintains the flag in the inserting transaction. It clears
+the flag on the previous latest row unless that row is newer, so a late
+insert of an older profile joins the history without becoming current.
+Two concurrent inserts for the same column conflict on the unique index,
+and one of them fails instead of both becoming latest.
+"""
+import sqlalchemy as sa
+
+from alembic import op
+from migrations.helpers import create_index_concurrently, drop_index_concurrently, lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '044_dictionary_profile_is_latest'
+down_revision = '043_lz4_pack_json'
+branch_labels = None
+depends_on = None
+
+PROFILE_KEY = ['connection_id', 'schema_name', 'table_name', 'column_name']
+SUMMARY_COLUMNS = ['null_fraction', 'distinct_count', 'distinct_count_estimate']
+
+SAME_COLUMN = ' AND '.join(f'p.{column} = NEW.{column}' for column in PROFILE_KEY)
+
+
+def _replace_history_index(**kw) -> None:
+    create_index_concurrently(
+        'ix_dict_profiles_latest_new',
+        'dictionary_profiles',
+        PROFILE_KEY + [sa.text('computed_at DESC')],
+        **kw
+    )
+    drop_index_concurrently('ix_dict_profiles_latest', 'dictionary_profiles')
+    op.execute('ALTER INDEX ix_dict_profiles_latest_new RENAME TO ix_dict_profiles_latest')
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        # Constant default: metadata-only on PG11+, no table rewrite
+        op.add_column(
+            'dictionary_profiles',
+            sa.Column('is_latest', sa.Boolean(), nullable=False, server_default=sa.text('true'))
+        )
+        # Ties on computed_at are broken by id, which is time-ordered (031)
+        op.execute(f"""
+            UPDATE dictionary_profiles p
+            SET is_latest = false
+            WHERE EXISTS (
+                SELECT 1 FROM dictionary_profiles n
+                WHERE {' AND '.join(f'n.{column} = p.{column}' for column in PROFILE_KEY)}
+                  AND (n.computed_at, n.id) > (p.computed_at, p.id)
+            )
+        """)
+
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION set_dictionary_profile_latest()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                UPDATE dictionary_profiles p
+                SET is_latest = false
+                WHERE {SAME_COLUMN}
+                  AND p.is_latest
+                  AND p.computed_at <= NEW.computed_at;
+
+                NEW.is_latest := NOT EXISTS (
+                    SELECT 1 FROM dictionary_profiles p
+                    WHERE {SAME_COLUMN} AND p.is_latest
+                );
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        """)
+        op.execute("""
+            CREATE TRIGGER dictionary_profiles_set_latest
+            BEFORE INSERT ON dictionary_profiles
+            FOR EACH ROW
+            EXECUTE FUNCTION set_dictionary_profile_latest();
+        """)
+
+        create_index_concurrently(
+            'ix_dict_profiles_latest_one',
+            'dictionary_profiles',
+            PROFILE_KEY,
+            unique=True,
+            postgresql_where=sa.text('is_latest'),
+            postgresql_include=SUMMARY_COLUMNS
+        )
+        _replace_history_index()
+
+
+def downgrade() -> None:
+    _replace_history_index(postgresql_include=SUMMARY_COLUMNS)
+    drop_index_concurrently('ix_dict_profiles_latest_one', 'dictionary_profiles')
+
+    op.execute('DROP TRIGGER IF EXISTS dictionary_profiles_set_latest ON dictionary_profiles')
+    op.execute('DROP FUNCTION IF EXISTS set_dictionary_profile_latest()')
+    op.drop_column('dictionary_profiles', 'is_latest')
@@ -0,0 +1,61 @@
+"""Cap curated free-text metadata at 2000 characters
+
+Revision ID: 045_cap_curated_text_lengths
+Revises: 044_dictionary_profile_is_latest
+Create Date: 2026-10-17
+
+Definitions, grain and row meaning, known issues, relationship notes and
+pack change notes are short, hand-written prose. With no limit, one bad
+paste or API call could store megabytes per row in TOAST. The columns stay
+text and get CHECK (char_length(...) <= 2000) constraints, and the request
+models enforce the same limit so callers get a 422 instead of a database
+error. Changing the type to varchar(2000) would have enforced the same limit,
+but it takes an ACCESS EXCLUSIVE lock while every row is checked. A
+NOT VALID constraint validated afterwards checks rows under SHARE UPDATE
+EXCLUSIVE, as in 030.
+
+query_text and other captured (not curated) text stays unbounded.
+"""
+from alembic import op
+from migrations.helpers import lock_timeout
+
+
+# revision identifiers, used by Alembic.
+revision = '045_cap_curated_text_lengths'
+down_revision = '044_dictionary_profile_is_latest'
+branch_labels = None
+depends_on = None
+
+MAX_LENGTH = 2000
+
+CURATED_TEXT_COLUMNS = [
+    ('dictionary_assets', 'business_definition'),
+    ('dictionary_assets', 'grain'),
+    ('dictionary_assets', 'row_meaning'),
+    ('dictionary_assets', 'known_issues'),
+    ('dictionary_fields', 'business_definition'),
+    ('dictionary_fields', 'known_issues'),
+    ('dictionary_relationships', 'notes'),
+    ('evaluation_pack_version', 'change_note'),
+]
+
+
+def _constraint_name(table: str, column: str) -> str:
+    return f'ck_{table}_{column}_length'
+
+
+def upgrade() -> None:
+    with lock_timeout():
+        for table, column in CURATED_TEXT_COLUMNS:
+            op.execute(
+                f'ALTER TABLE {table} ADD CONSTRAINT {_constraint_name(table, column)} '
+                f'CHECK (char_length({column}) <= {MAX_LENGTH}) NOT VALID'
+            )
+
+        for table, column in CURATED_TEXT_COLUMNS:
+            op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {_constraint_name(table, column)}')
+
+
+def downgrade() -> None:
+    for table, column in CURATED_TEXT_COLUMNS:
+        op.drop_constraint(_constraint_name(table, column), table, type_='check')
@@ -4,35 +4,39 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import create_engine
-from datetime import datetime
-from uuid import uuid4
+from typing import Any, Dict, Tuple
 
 from core.config import settings
+from db.connection import json_dumps
 from db.models import evaluation_pack, evaluation_pack_version
 
-# Create engine
-engine = create_engine(settings.database_url)
+# Create engine; list inserts go through psycopg's executemany, which pipelines
+# the rows in one round trip (insertmanyvalues, pinned at the psycopg 3
+# defaults, takes over for INSERT ... RETURNING), and pack_json/tags are
+# encoded once with orjson
+engine = create_engine(
+    settings.database_url,
+    use_insertmanyvalues=True,
+    insertmanyvalues_page_size=1000,
+    json_serializer=json_dumps
+)
 
+# Keys of a spec that make up the version's pack_json
+PACK_JSON_KEYS = (
+    "id", "name", "model_family", "description",
+    "metrics", "slices", "comparators", "economic_mapping", "outputs"
+)
 
-def seed_evaluation_packs():
-    """Seed baseline evaluation packs for all 4 model families."""
-    
-    # 1. Forecasting Evaluation Pack
-    forecasting_pack = {
-        "id": "pack_forecasting_standard",
-        "name": "Forecasting Standard Evaluation v1",
-        "model_family": "forecasting",
-        "status": "approved",
-        "tags": ["standard", "time-series", "baseline"],
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
-    
-    forecasting_pack_json = {
+# One entry per model family; each becomes an approved pack with a 1.0.0 version
+PACK_SPECS = [
+    # Forecasting Evaluation Pack
+    {
         "id": "pack_forecasting_standard",
         "name": "Forecasting Standard Evaluation v1",
         "model_family": "forecasting",
         "description": "Standard evaluation pack for forecasting models measuring accuracy, bias, and coverage",
+        "tags": ["standard", "time-series", "baseline"],
+        "change_note": "Initial baseline forecasting evaluation pack",
         "metrics": [
             {
                 "key": "MAPE",
@@ -109,35 +113,15 @@ def seed_evaluation_packs():
             "artifacts": ["forecast_plot", "residuals_plot", "seasonality_chart"],
             "reports": ["pdf_summary", "html_dashboard"]
         }
-    }
-    
-    forecasting_version = {
-        "version_id": "ver_pack_forecasting_standard_v1",
-        "pack_id": "pack_forecasting_standard",
-        "version_number": "1.0.0",
-        "pack_json": forecasting_pack_json,
-        "diff_from_prev": None,
-        "created_by": "system",
-        "created_at": datetime.utcnow(),
-        "change_note": "Initial baseline forecasting evaluation pack"
-    }
-    
-    # 2. Pricing Evaluation Pack
-    pricing_pack = {
-        "id": "pack_pricing_standard",
-        "name": "Pricing Standard Evaluation v1",
-        "model_family": "pricing",
-        "status": "approved",
-        "tags": ["standard", "optimization", "baseline"],
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
-    
-    pricing_pack_json = {
+    },
+    # Pricing Evaluation Pack
+    {
         "id": "pack_pricing_standard",
         "name": "Pricing Standard Evaluation v1",
         "model_family": "pricing",
         "description": "Standard evaluation pack for pricing models measuring lift, calibration, and elasticity accuracy",
+        "tags": ["standard", "optimization", "baseline"],
+        "change_note": "Initial baseline pricing evaluation pack",
         "metrics": [
             {
                 "key": "revenue_lift",
@@ -219,35 +203,15 @@ def seed_evaluation_packs():
             "artifacts": ["price_response_curves", "elasticity_heatmap", "lift_by_segment"],
             "reports": ["pricing_strategy_summary", "a_b_test_recommendations"]
         }
-    }
-    
-    pricing_version = {
-        "version_id": "ver_pack_pricing_standard_v1",
-        "pack_id": "pack_pricing_standard",
-        "version_number": "1.0.0",
-        "pack_json": pricing_pack_json,
-        "diff_from_prev": None,
-        "created_by": "system",
-        "created_at": datetime.utcnow(),
-        "change_note": "Initial baseline pricing evaluation pack"
-    }
-    
-    # 3. Next Best Action Evaluation Pack
-    nba_pack = {
-        "id": "pack_nba_standard",
-        "name": "NBA Standard Evaluation v1",
-        "model_family": "next_best_action",
-        "status": "approved",
-        "tags": ["standard", "uplift", "personalization", "baseline"],
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
-    
-    nba_pack_json = {
+    },
+    # Next Best Action Evaluation Pack
+    {
         "id": "pack_nba_standard",
         "name": "NBA Standard Evaluation v1",
         "model_family": "next_best_action",
         "description": "Standard evaluation pack for NBA models measuring uplift, precision, and incremental value",
+        "tags": ["standard", "uplift", "personalization", "baseline"],
+        "change_note": "Initial baseline NBA evaluation pack",
         "metrics": [
             {
                 "key": "uplift",
@@ -329,35 +293,15 @@ def seed_evaluation_packs():
             "artifacts": ["uplift_curve", "qini_curve", "action_distribution_chart", "segment_performance"],
             "reports": ["campaign_optimization_report", "holdout_analysis"]
         }
-    }
-    
-    nba_version = {
-        "version_id": "ver_pack_nba_standard_v1",
-        "pack_id": "pack_nba_standard",
-        "version_number": "1.0.0",
-        "pack_json": nba_pack_json,
-        "diff_from_prev": None,
-        "created_by": "system",
-        "created_at": datetime.utcnow(),
-        "change_note": "Initial baseline NBA evaluation pack"
-    }
-    
-    # 4. Location Scoring Evaluation Pack
-    location_pack = {
-        "id": "pack_location_standard",
-        "name": "Location Scoring Standard Evaluation v1",
-        "model_family": "location_scoring",
-        "status": "approved",
-        "tags": ["standard", "geospatial", "site-selection", "baseline"],
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
-    
-    location_pack_json = {
+    },
+    # Location Scoring Evaluation Pack
+    {
         "id": "pack_location_standard",
         "name": "Location Scoring Standard Evaluation v1",
         "model_family": "location_scoring",
         "description": "Standard evaluation pack for location scoring models measuring rank accuracy, calibration, and hit rate",
+        "tags": ["standard", "geospatial", "site-selection", "baseline"],
+        "change_note": "Initial baseline location scoring evaluation pack",
         "metrics": [
             {
                 "key": "rank_correlation",
@@ -435,41 +379,51 @@ def seed_evaluation_packs():
             "reports": ["site_selection_recommendations", "market_penetration_analysis"]
         }
     }
+]
+
+
+def make_pack_pair(spec: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the evaluation_pack row and its initial evaluation_pack_version row.
+    Timestamps are left to the columns' now() server defaults.
+    """
+    pack_row = {
+        "id": spec["id"],
+        "name": spec["name"],
+        "model_family": spec["model_family"],
+        "status": "approved",
+        "tags": spec["tags"]
+    }
     
-    location_version = {
-        "version_id": "ver_pack_location_standard_v1",
-        "pack_id": "pack_location_standard",
+    version_row = {
+        "version_id": f"ver_{spec['id']}_v1",
+        "pack_id": spec["id"],
         "version_number": "1.0.0",
-        "pack_json": location_pack_json,
+        "pack_json": {key: spec[key] for key in PACK_JSON_KEYS},
         "diff_from_prev": None,
         "created_by": "system",
-        "created_at": datetime.utcnow(),
-        "change_note": "Initial baseline location scoring evaluation pack"
+        "change_note": spec["change_note"]
     }
     
-    # Insert into database
-    with engine.connect() as conn:
+    return pack_row, version_row
+
+
+def seed_evaluation_packs():
+    """Seed baseline evaluation packs for all 4 model families."""
+    pairs = [make_pack_pair(spec) for spec in PACK_SPECS]
+    
+    # Insert into database in one transaction, one multi-row INSERT per table
+    with engine.begin() as conn:
         # Insert packs
-        conn.execute(
-            evaluation_pack.insert(),
-            [forecasting_pack, pricing_pack, nba_pack, location_pack]
-        )
+        conn.execute(evaluation_pack.insert(), [pack for pack, _ in pairs])
         
         # Insert versions
-        conn.execute(
-            evaluation_pack_version.insert(),
-            [forecasting_version, pricing_version, nba_version, location_version]
-        )
+        conn.execute(evaluation_pack_version.insert(), [version for _, version in pairs])
         
-        conn.commit()
-        
-        print("✓ Successfully seeded 4 evaluation packs:")
-        print("  - Forecasting Standard Evaluation v1")
-        print("  - Pricing Standard Evaluation v1")
-        print("  - NBA Standard Evaluation v1")
-        print("  - Location Scoring Standard Evaluation v1")
+        print(f"✓ Successfully seeded {len(PACK_SPECS)} evaluation packs:")
+        for spec in PACK_SPECS:
+            print(f"  - {spec['name']}")
 
 
 if __name__ == "__main__":
     seed_evaluation_packs()
-
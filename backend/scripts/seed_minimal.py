@@ -20,25 +20,17 @@ def seed():
     METADATA.create_all(engine)
     
     with engine.begin() as conn:
-        # Create a demo org
+        # Create a demo org and its admin user; users references orgs, so the
+        # tables are loaded in that order with one executemany each
         demo_org_id = uuid.uuid4()
-        conn.execute(
-            models.orgs.insert().values(
-                id=demo_org_id,
-                name="Demo Org"
-            )
-        )
-        
-        # Create a demo user
         demo_user_id = uuid.uuid4()
-        conn.execute(
-            models.users.insert().values(
-                id=demo_user_id,
-                org_id=demo_org_id,
-                email="demo@nex.ai",
-                role="admin"
-            )
-        )
+        
+        conn.execute(models.orgs.insert(), [
+            {'id': demo_org_id, 'name': "Demo Org"},
+        ])
+        conn.execute(models.users.insert(), [
+            {'id': demo_user_id, 'org_id': demo_org_id, 'email': "demo@nex.ai", 'role': "admin"},
+        ])
         
         print(f"✓ Created demo org: {demo_org_id} (Demo Org)")
         print(f"✓ Created demo user: {demo_user_id} (demo@nex.ai)")
@@ -4,10 +4,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import create_engine, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime, timedelta
-from uuid import uuid4
+from secrets import token_hex
 import random
 
+import numpy as np
+
 from core.config import settings
 from db.models import (
     ml_recipe, ml_recipe_version, ml_model, ml_run, ml_monitor_snapshot,
@@ -15,23 +18,109 @@ from db.models import (
     evaluation_result, monitor_evaluation_snapshot
 )
 
-# Create engine
-engine = create_engine(settings.database_url)
+# Create engine; list inserts go through psycopg's executemany, which pipelines
+# the rows in one round trip. INSERT ... RETURNING (Step 2) is instead folded
+# into multi-row INSERTs of up to 1000 rows (the psycopg 3 defaults, pinned
+# because the seed relies on them), and SQLAlchemy shrinks a page to stay
+# under the dialect's bind-parameter limit, so no insert needs manual chunking.
+engine = create_engine(
+    settings.database_url,
+    use_insertmanyvalues=True,
+    insertmanyvalues_page_size=1000
+)
+
+MODEL_STATUSES = ['draft', 'staging', 'production', 'retired']
+MODEL_STATUS_WEIGHTS = [0.1, 0.2, 0.6, 0.1]  # Favor production models
+MODEL_OWNERS = ['data-science-team', 'ml-ops', 'analytics', 'product-team']
+
+RUN_TYPES = ['train', 'eval', 'backtest']
+RUN_STATUSES = ['succeeded', 'succeeded', 'succeeded', 'failed']  # Favor success
+# Plot file names listed in every run's artifacts_json (shared, never mutated)
+RUN_PLOTS = ('plot_0.png', 'plot_1.png', 'plot_2.png')
+
+# Uniform (low, high) range of every generated metric, per model family
+METRIC_RANGES = {
+    'forecasting': {
+        'MAPE': (0.10, 0.30),
+        'RMSE': (30, 120),
+        'MAE': (20, 80),
+        'forecast_bias': (-0.1, 0.1),
+        'coverage_80': (0.70, 0.90)
+    },
+    'pricing': {
+        'revenue_lift': (0.01, 0.08),
+        'margin_impact': (0.02, 0.10),
+        'elasticity_accuracy': (0.10, 0.40),
+        'calibration': (0.80, 0.98),
+        'constraint_violations': (0.0, 0.05)
+    },
+    'next_best_action': {
+        'uplift': (0.05, 0.18),
+        'precision_at_10': (0.15, 0.40),
+        'qini_coefficient': (0.08, 0.20),
+        'incremental_revenue': (50000, 150000),
+        'action_distribution': (0.60, 0.85)
+    },
+    'location_scoring': {
+        'rank_correlation': (0.60, 0.85),
+        'calibration': (0.75, 0.95),
+        'hit_rate_at_10': (0.30, 0.60),
+        'lift_top_decile': (1.5, 3.0),
+        'geographic_coverage': (0.80, 0.95)
+    }
+}
+
+# Family -> (metric keys, lows, highs), built once for batch_metrics
+FAMILY_SPECS = {
+    family: (list(ranges), *np.array(list(ranges.values()), dtype=float).T)
+    for family, ranges in METRIC_RANGES.items()
+}
+
+
+
+def _drift_exponent(key: str) -> int:
+    """Direction a metric moves as a model drifts: errors grow, accuracies shrink."""
+    key = key.lower()
+    if 'error' in key or 'mape' in key:
+        return 1
+    if 'accuracy' in key or 'r2' in key:
+        return -1
+    return 0
 
 
-def seed_complete_ml_data():
-    """Seed all ML development components with interconnected data."""
+# Family -> per-metric drift exponent, aligned with FAMILY_SPECS keys
+DRIFT_EXPONENTS = {
+    family: np.array([_drift_exponent(key) for key in ranges])
+    for family, ranges in METRIC_RANGES.items()
+}
+
+# Default RNG seed, so repeated seeds generate the same data (ids stay unique)
+RANDOM_SEED = 42
+
+
+def seed_complete_ml_data(verbose: bool = False, seed: int | None = RANDOM_SEED):
+    """Seed all ML development components with interconnected data.
     
-    with engine.connect() as conn:
+    Each step prints a count; verbose also prints a line per created row.
+    All random values come from generators seeded with seed (None for a
+    different dataset on every run).
+    """
+    rng = random.Random(seed)
+    metrics_rng = np.random.default_rng(seed)
+    
+    # One transaction for the whole seed: committed once on success
+    with engine.begin() as conn:
         print("🌱 Starting comprehensive ML Model Development seeding...\n")
         
+        # Every generated timestamp is an offset from the same seed time
+        now = datetime.utcnow()
+        
         # Step 1: Check existing recipes and packs
         print("📋 Step 1: Checking existing recipes and evaluation packs...")
-        recipes_result = conn.execute(select(ml_recipe)).fetchall()
-        recipes = [dict(row._mapping) for row in recipes_result]
-        
-        packs_result = conn.execute(select(evaluation_pack)).fetchall()
-        packs = [dict(row._mapping) for row in packs_result]
+        # Stream through a server-side cursor instead of buffering the full
+        # result; rows are only read, so their mappings are kept without copying
+        recipes = [row._mapping for row in conn.execute(select(ml_recipe).execution_options(yield_per=1000))]
+        packs = [row._mapping for row in conn.execute(select(evaluation_pack).execution_options(yield_per=1000))]
         
         if not recipes:
             print("❌ No recipes found! Please run seed_ml_recipes.py first.")
@@ -44,78 +133,87 @@ def seed_complete_ml_data():
         print(f"   ✓ Found {len(recipes)} recipes")
         print(f"   ✓ Found {len(packs)} evaluation packs\n")
         
+        recipe_by_id = {r['id']: r for r in recipes}
+        # First pack wins per family, as with the linear scan this replaces
+        packs_by_family = {p['model_family']: p for p in reversed(packs)}
+        
         # Step 2: Attach evaluation packs to recipes
         print("📎 Step 2: Attaching evaluation packs to recipes...")
-        attachments_created = 0
+        attach_rows = [
+            {'recipe_id': recipe['id'], 'pack_id': packs_by_family[recipe['model_family']]['id']}
+            for recipe in recipes
+            if recipe['model_family'] in packs_by_family
+        ]
+        
+        # Already-attached pairs are skipped by the primary key; created_at
+        # comes from the server default. Passed as executemany rows so the
+        # INSERT is paged like the other steps' inserts.
+        attached = []
+        if attach_rows:
+            attached = conn.execute(
+                pg_insert(recipe_evaluation_pack)
+                .on_conflict_do_nothing(index_elements=['recipe_id', 'pack_id'])
+                .returning(recipe_evaluation_pack.c.recipe_id),
+                attach_rows
+            ).scalars().all()
+        attachments_created = len(attached)
+        
+        if verbose:
+            for recipe_id in attached:
+                recipe = recipe_by_id[recipe_id]
+                print(f"   ✓ Attached {packs_by_family[recipe['model_family']]['name']} to {recipe['name']}")
         
-        for recipe in recipes:
-            # Find matching pack by model_family
-            matching_pack = next(
-                (p for p in packs if p['model_family'] == recipe['model_family']),
-                None
-            )
-            
-            if matching_pack:
-                try:
-                    conn.execute(
-                        recipe_evaluation_pack.insert().values(
-                            recipe_id=recipe['id'],
-                            pack_id=matching_pack['id'],
-                            created_at=datetime.utcnow()
-                        )
-                    )
-                    attachments_created += 1
-                    print(f"   ✓ Attached {matching_pack['name']} to {recipe['name']}")
-                except Exception as e:
-                    # Skip if already attached
-                    pass
-        
-        conn.commit()
         print(f"   ✓ Created {attachments_created} recipe-pack attachments\n")
         
         # Step 3: Create ML Models from recipes
         print("🤖 Step 3: Creating ML models from recipes...")
         models_data = []
         
-        for recipe in recipes:
-            if recipe['status'] == 'approved':
-                # Create 1-2 models per approved recipe
-                num_models = random.randint(1, 2)
+        # Latest version of every recipe in one query
+        latest_version_by_recipe = {
+            row.recipe_id: row._mapping for row in conn.execute(
+                select(ml_recipe_version)
+                .distinct(ml_recipe_version.c.recipe_id)
+                .order_by(ml_recipe_version.c.recipe_id, ml_recipe_version.c.created_at.desc())
+            )
+        }
+        
+        # Create 1-2 models per approved recipe
+        approved_recipes = [
+            r for r in recipes
+            if r['status'] == 'approved' and r['id'] in latest_version_by_recipe
+        ]
+        model_counts = [rng.randint(1, 2) for _ in approved_recipes]
+        
+        # Statuses and owners for every model in one draw each
+        total_models = sum(model_counts)
+        model_statuses = iter(rng.choices(MODEL_STATUSES, MODEL_STATUS_WEIGHTS, k=total_models))
+        model_owners = iter(rng.choices(MODEL_OWNERS, k=total_models))
+        
+        for recipe, num_models in zip(approved_recipes, model_counts):
+            latest_version = latest_version_by_recipe[recipe['id']]
+            
+            for i in range(num_models):
+                model_id = f"model_{recipe['model_family']}_{token_hex(4)}"
                 
-                for i in range(num_models):
-                    model_id = f"model_{recipe['model_family']}_{uuid4().hex[:8]}"
-                    
-                    # Get recipe version
-                    recipe_versions = conn.execute(
-                        select(ml_recipe_version)
-                        .where(ml_recipe_version.c.recipe_id == recipe['id'])
-                        .order_by(ml_recipe_version.c.created_at.desc())
-                    ).fetchall()
-                    
-                    if recipe_versions:
-                        latest_version = dict(recipe_versions[0]._mapping)
-                        
-                        statuses = ['draft', 'staging', 'production', 'retired']
-                        weights = [0.1, 0.2, 0.6, 0.1]  # Favor production models
-                        
-                        model_data = {
-                            'id': model_id,
-                            'name': f"{recipe['name']} Model v{i+1}",
-                            'model_family': recipe['model_family'],
-                            'recipe_id': recipe['id'],
-                            'recipe_version_id': latest_version['version_id'],
-                            'status': random.choices(statuses, weights)[0],
-                            'owner': random.choice(['data-science-team', 'ml-ops', 'analytics', 'product-team']),
-                            'created_at': datetime.utcnow() - timedelta(days=random.randint(10, 90)),
-                            'updated_at': datetime.utcnow() - timedelta(days=random.randint(0, 10))
-                        }
-                        
-                        models_data.append(model_data)
-                        print(f"   ✓ Created {model_data['name']} ({model_data['status']})")
+                model_data = {
+                    'id': model_id,
+                    'name': f"{recipe['name']} Model v{i+1}",
+                    'model_family': recipe['model_family'],
+                    'recipe_id': recipe['id'],
+                    'recipe_version_id': latest_version['version_id'],
+                    'status': next(model_statuses),
+                    'owner': next(model_owners),
+                    'created_at': now - timedelta(days=rng.randint(10, 90)),
+                    'updated_at': now - timedelta(days=rng.randint(0, 10))
+                }
+                
+                models_data.append(model_data)
+                if verbose:
+                    print(f"   ✓ Created {model_data['name']} ({model_data['status']})")
         
         if models_data:
             conn.execute(ml_model.insert(), models_data)
-            conn.commit()
         
         print(f"   ✓ Created {len(models_data)} ML models\n")
         
@@ -125,21 +223,18 @@ def seed_complete_ml_data():
         
         for model_data in models_data:
             # Create 2-4 runs per model
-            num_runs = random.randint(2, 4)
+            num_runs = rng.randint(2, 4)
             
-            for i in range(num_runs):
-                run_id = f"run_{model_data['model_family']}_{uuid4().hex[:8]}"
-                
-                run_types = ['train', 'eval', 'backtest']
-                run_statuses = ['succeeded', 'succeeded', 'succeeded', 'failed']  # Favor success
-                run_type = random.choice(run_types)
-                run_status = random.choice(run_statuses)
-                
-                # Generate realistic metrics based on model family
-                metrics_json = generate_metrics_for_family(model_data['model_family'])
+            # Generate realistic metrics based on model family
+            run_metrics = batch_metrics(metrics_rng, model_data['model_family'], num_runs)
+            run_types = rng.choices(RUN_TYPES, k=num_runs)
+            run_statuses = rng.choices(RUN_STATUSES, k=num_runs)
+            
+            for metrics_json, run_type, run_status in zip(run_metrics, run_types, run_statuses):
+                run_id = f"run_{model_data['model_family']}_{token_hex(4)}"
                 
-                started = datetime.utcnow() - timedelta(days=random.randint(1, 60))
-                finished = started + timedelta(minutes=random.randint(5, 120)) if run_status == 'succeeded' else None
+                started = now - timedelta(days=rng.randint(1, 60))
+                finished = started + timedelta(minutes=rng.randint(5, 120)) if run_status == 'succeeded' else None
                 
                 run_data = {
                     'id': run_id,
@@ -154,17 +249,17 @@ def seed_complete_ml_data():
                     'artifacts_json': {
                         'model_artifact': f"s3://ml-artifacts/{run_id}/model.pkl",
                         'training_data': f"s3://ml-artifacts/{run_id}/train_data.parquet",
-                        'plots': [f"plot_{j}.png" for j in range(3)]
+                        'plots': RUN_PLOTS
                     },
                     'logs_text': f"Run {run_type} completed {'successfully' if run_status == 'succeeded' else 'with errors'}"
                 }
                 
                 runs_data.append(run_data)
-                print(f"   ✓ Created {run_type} run for {model_data['name']} ({run_status})")
+                if verbose:
+                    print(f"   ✓ Created {run_type} run for {model_data['name']} ({run_status})")
         
         if runs_data:
             conn.execute(ml_run.insert(), runs_data)
-            conn.commit()
         
         print(f"   ✓ Created {len(runs_data)} runs\n")
         
@@ -176,50 +271,42 @@ def seed_complete_ml_data():
         
         for model_data in production_models:
             # Create 5-10 snapshots over time
-            num_snapshots = random.randint(5, 10)
+            num_snapshots = rng.randint(5, 10)
             
-            for i in range(num_snapshots):
-                snapshot_id = f"mon_{model_data['id']}_{uuid4().hex[:8]}"
-                
-                # Generate monitoring metrics with some drift over time
-                performance_metrics = generate_metrics_for_family(model_data['model_family'])
-                
-                # Add some degradation over time
-                drift_factor = 1 + (i * 0.02)  # 2% degradation per snapshot
-                for key in performance_metrics:
-                    if 'error' in key.lower() or 'mape' in key.lower():
-                        performance_metrics[key] *= drift_factor
-                    elif 'accuracy' in key.lower() or 'r2' in key.lower():
-                        performance_metrics[key] /= drift_factor
+            # Generate monitoring metrics with 2% degradation per snapshot
+            snapshot_metrics = batch_metrics(metrics_rng, model_data['model_family'], num_snapshots, drift=0.02)
+            
+            for i, performance_metrics in enumerate(snapshot_metrics):
+                snapshot_id = f"mon_{model_data['id']}_{token_hex(4)}"
                 
                 snapshot_data = {
                     'id': snapshot_id,
                     'model_id': model_data['id'],
-                    'captured_at': datetime.utcnow() - timedelta(days=num_snapshots - i),
+                    'captured_at': now - timedelta(days=num_snapshots - i),
                     'performance_metrics_json': performance_metrics,
                     'drift_metrics_json': {
-                        'psi': random.uniform(0.05, 0.25),
-                        'ks_stat': random.uniform(0.02, 0.15),
-                        'feature_drift_count': random.randint(0, 5)
+                        'psi': rng.uniform(0.05, 0.25),
+                        'ks_stat': rng.uniform(0.02, 0.15),
+                        'feature_drift_count': rng.randint(0, 5)
                     },
                     'data_freshness_json': {
-                        'last_update': (datetime.utcnow() - timedelta(hours=random.randint(1, 48))).isoformat(),
-                        'records_processed': random.randint(10000, 100000),
-                        'data_quality_score': random.uniform(0.85, 0.99)
+                        'last_update': (now - timedelta(hours=rng.randint(1, 48))).isoformat(),
+                        'records_processed': rng.randint(10000, 100000),
+                        'data_quality_score': rng.uniform(0.85, 0.99)
                     },
                     'alerts_json': {
-                        'triggered_alerts': random.randint(0, 2),
-                        'alert_types': ['drift_warning'] if random.random() > 0.7 else []
+                        'triggered_alerts': rng.randint(0, 2),
+                        'alert_types': ['drift_warning'] if rng.random() > 0.7 else []
                     }
                 }
                 
                 monitor_snapshots_data.append(snapshot_data)
             
-            print(f"   ✓ Created {num_snapshots} snapshots for {model_data['name']}")
+            if verbose:
+                print(f"   ✓ Created {num_snapshots} snapshots for {model_data['name']}")
         
         if monitor_snapshots_data:
             conn.execute(ml_monitor_snapshot.insert(), monitor_snapshots_data)
-            conn.commit()
         
         print(f"   ✓ Created {len(monitor_snapshots_data)} monitoring snapshots\n")
         
@@ -227,56 +314,63 @@ def seed_complete_ml_data():
         print("✅ Step 6: Creating evaluation results for runs...")
         eval_results_data = []
         
-        # Get successful runs
+        # Latest version of every pack in one query, shared with Step 7
+        latest_pack_version_by_pack = {
+            row.pack_id: row._mapping for row in conn.execute(
+                select(evaluation_pack_version)
+                .distinct(evaluation_pack_version.c.pack_id)
+                .order_by(evaluation_pack_version.c.pack_id, evaluation_pack_version.c.created_at.desc())
+            )
+        }
+        
+        # Thresholds of every pack as arrays, shared with Step 7
+        pack_specs = {
+            pack_id: build_pack_spec(pack_version['pack_json'])
+            for pack_id, pack_version in latest_pack_version_by_pack.items()
+        }
+        
+        # Get successful runs, grouped by the pack that evaluates them
         successful_runs = [r for r in runs_data if r['status'] == 'succeeded']
+        runs_by_pack = {}
         
         for run_data in successful_runs[:10]:  # Limit to 10 for demo
-            # Find matching pack
-            recipe = next((r for r in recipes if r['id'] == run_data['recipe_id']), None)
+            recipe = recipe_by_id.get(run_data['recipe_id'])
             if not recipe:
                 continue
             
-            matching_pack = next(
-                (p for p in packs if p['model_family'] == recipe['model_family']),
-                None
-            )
+            matching_pack = packs_by_family.get(recipe['model_family'])
             
-            if matching_pack:
-                # Get pack version
-                pack_versions = conn.execute(
-                    select(evaluation_pack_version)
-                    .where(evaluation_pack_version.c.pack_id == matching_pack['id'])
-                    .order_by(evaluation_pack_version.c.created_at.desc())
-                ).fetchall()
+            if matching_pack and matching_pack['id'] in latest_pack_version_by_pack:
+                runs_by_pack.setdefault(matching_pack['id'], []).append(run_data)
+        
+        for pack_id, pack_runs in runs_by_pack.items():
+            pack_version = latest_pack_version_by_pack[pack_id]
+            
+            # Generate evaluation results for all of the pack's runs at once
+            pack_spec = pack_specs[pack_id]
+            values = metric_matrix([r['metrics_json'] for r in pack_runs], pack_spec['keys'])
+            results, statuses = evaluate_batch(values, pack_spec['keys'], pack_spec)
+            
+            for run_data, results_json, status in zip(pack_runs, results, statuses):
+                result_id = f"eval_{run_data['id']}_{token_hex(4)}"
                 
-                if pack_versions:
-                    pack_version = dict(pack_versions[0]._mapping)
-                    
-                    result_id = f"eval_{run_data['id']}_{uuid4().hex[:8]}"
-                    
-                    # Generate evaluation results
-                    metrics = run_data['metrics_json']
-                    pack_json = pack_version['pack_json']
-                    
-                    results_json, status = evaluate_run(metrics, pack_json)
-                    
-                    eval_result = {
-                        'id': result_id,
-                        'run_id': run_data['id'],
-                        'pack_id': matching_pack['id'],
-                        'pack_version_id': pack_version['version_id'],
-                        'executed_at': run_data['finished_at'] or datetime.utcnow(),
-                        'status': status,
-                        'results_json': results_json,
-                        'summary_text': generate_summary(results_json, status)
-                    }
-                    
-                    eval_results_data.append(eval_result)
+                eval_result = {
+                    'id': result_id,
+                    'run_id': run_data['id'],
+                    'pack_id': pack_id,
+                    'pack_version_id': pack_version['version_id'],
+                    'executed_at': run_data['finished_at'] or now,
+                    'status': status,
+                    'results_json': results_json,
+                    'summary_text': generate_summary(results_json, status)
+                }
+                
+                eval_results_data.append(eval_result)
+                if verbose:
                     print(f"   ✓ Evaluated run {run_data['id'][:20]}... → {status.upper()}")
         
         if eval_results_data:
             conn.execute(evaluation_result.insert(), eval_results_data)
-            conn.commit()
         
         print(f"   ✓ Created {len(eval_results_data)} evaluation results\n")
         
@@ -285,32 +379,23 @@ def seed_complete_ml_data():
         monitor_eval_snapshots_data = []
         
         for model_data in production_models[:5]:  # Limit to 5 for demo
-            matching_pack = next(
-                (p for p in packs if p['model_family'] == model_data['model_family']),
-                None
-            )
+            matching_pack = packs_by_family.get(model_data['model_family'])
             
             if matching_pack:
-                pack_versions = conn.execute(
-                    select(evaluation_pack_version)
-                    .where(evaluation_pack_version.c.pack_id == matching_pack['id'])
-                    .order_by(evaluation_pack_version.c.created_at.desc())
-                ).fetchall()
+                pack_version = latest_pack_version_by_pack.get(matching_pack['id'])
                 
-                if pack_versions:
-                    pack_version = dict(pack_versions[0]._mapping)
+                if pack_version:
+                    # Create 3-5 monitoring snapshots, evaluated straight from the drawn array
+                    keys, values = draw_metrics(metrics_rng, model_data['model_family'], rng.randint(3, 5))
+                    results, statuses = evaluate_batch(values, keys, pack_specs[matching_pack['id']])
                     
-                    # Create 3-5 monitoring snapshots
-                    for i in range(random.randint(3, 5)):
-                        snapshot_id = f"mon_eval_{model_data['id']}_{uuid4().hex[:8]}"
-                        
-                        metrics = generate_metrics_for_family(model_data['model_family'])
-                        results_json, status = evaluate_run(metrics, pack_version['pack_json'])
+                    for results_json, status in zip(results, statuses):
+                        snapshot_id = f"mon_eval_{model_data['id']}_{token_hex(4)}"
                         
                         monitor_eval_snapshot = {
                             'id': snapshot_id,
                             'model_id': model_data['id'],
-                            'captured_at': datetime.utcnow() - timedelta(days=random.randint(1, 30)),
+                            'captured_at': now - timedelta(days=rng.randint(1, 30)),
                             'pack_id': matching_pack['id'],
                             'pack_version_id': pack_version['version_id'],
                             'status': status,
@@ -319,11 +404,11 @@ def seed_complete_ml_data():
                         
                         monitor_eval_snapshots_data.append(monitor_eval_snapshot)
                     
-                    print(f"   ✓ Created monitoring evals for {model_data['name']}")
+                    if verbose:
+                        print(f"   ✓ Created monitoring evals for {model_data['name']}")
         
         if monitor_eval_snapshots_data:
             conn.execute(monitor_evaluation_snapshot.insert(), monitor_eval_snapshots_data)
-            conn.commit()
         
         print(f"   ✓ Created {len(monitor_eval_snapshots_data)} monitoring evaluation snapshots\n")
         
@@ -344,106 +429,115 @@ def seed_complete_ml_data():
         print("   Open http://localhost:3000/model-development to explore!")
 
 
-def generate_metrics_for_family(model_family: str) -> dict:
-    """Generate realistic metrics based on model family."""
-    if model_family == 'forecasting':
-        return {
-            'MAPE': random.uniform(0.10, 0.30),
-            'RMSE': random.uniform(30, 120),
-            'MAE': random.uniform(20, 80),
-            'forecast_bias': random.uniform(-0.1, 0.1),
-            'coverage_80': random.uniform(0.70, 0.90)
-        }
-    elif model_family == 'pricing':
-        return {
-            'revenue_lift': random.uniform(0.01, 0.08),
-            'margin_impact': random.uniform(0.02, 0.10),
-            'elasticity_accuracy': random.uniform(0.10, 0.40),
-            'calibration': random.uniform(0.80, 0.98),
-            'constraint_violations': random.uniform(0.0, 0.05)
-        }
-    elif model_family == 'next_best_action':
-        return {
-            'uplift': random.uniform(0.05, 0.18),
-            'precision_at_10': random.uniform(0.15, 0.40),
-            'qini_coefficient': random.uniform(0.08, 0.20),
-            'incremental_revenue': random.uniform(50000, 150000),
-            'action_distribution': random.uniform(0.60, 0.85)
-        }
-    elif model_family == 'location_scoring':
-        return {
-            'rank_correlation': random.uniform(0.60, 0.85),
-            'calibration': random.uniform(0.75, 0.95),
-            'hit_rate_at_10': random.uniform(0.30, 0.60),
-            'lift_top_decile': random.uniform(1.5, 3.0),
-            'geographic_coverage': random.uniform(0.80, 0.95)
-        }
-    else:
-        return {}
+def draw_metrics(
+    rng: np.random.Generator,
+    model_family: str,
+    n: int,
+    drift: float = 0.0
+) -> tuple[list[str], np.ndarray]:
+    """Draw n sets of realistic metrics for a model family in one call.
+    
+    Returns the metric keys and an (n, len(keys)) array of values. With
+    drift, row i is degraded by a factor of (1 + i * drift).
+    """
+    if model_family not in FAMILY_SPECS:
+        return [], np.empty((n, 0))
+    
+    keys, lows, highs = FAMILY_SPECS[model_family]
+    values = rng.uniform(lows, highs, size=(n, len(keys)))
+    if drift:
+        factors = (1 + drift * np.arange(n))[:, None]
+        values *= factors ** DRIFT_EXPONENTS[model_family]
+    return keys, values
 
 
-def evaluate_run(metrics: dict, pack_json: dict) -> tuple[dict, str]:
-    """Evaluate metrics against pack thresholds."""
-    results = {
-        'metrics': [],
-        'slices': [],
-        'comparators': []
-    }
+def batch_metrics(rng: np.random.Generator, model_family: str, n: int, drift: float = 0.0) -> list[dict]:
+    """Generate n metric dicts for a model family (see draw_metrics)."""
+    keys, values = draw_metrics(rng, model_family, n, drift)
+    return [dict(zip(keys, row)) for row in values.tolist()]
+
+
+def metric_matrix(metrics_list: list[dict], keys: list[str]) -> np.ndarray:
+    """Stack metric dicts into an (n, len(keys)) array; missing metrics are 0."""
+    return np.array(
+        [[metrics.get(key, 0) for key in keys] for metrics in metrics_list],
+        dtype=float
+    ).reshape(len(metrics_list), len(keys))
+
+
+def build_pack_spec(pack_json: dict) -> dict:
+    """Lay out a pack's metric thresholds as arrays, one entry per metric.
     
-    overall_status = 'pass'
+    Missing (or zero) warn/fail thresholds become NaN, which never compares
+    true, so those checks are skipped. sign is -1 for lower_is_better, which
+    turns every check into "signed value <= signed threshold". The static
+    part of each metric's result entry is prebuilt in templates.
+    """
+    metric_defs = pack_json.get('metrics', [])
     
-    for metric_def in pack_json.get('metrics', []):
-        metric_key = metric_def['key']
-        actual_value = metrics.get(metric_key, 0)
-        
-        thresholds = metric_def.get('thresholds', {})
-        direction = metric_def.get('direction', 'higher_is_better')
-        
-        # Check thresholds
-        metric_status = check_threshold(actual_value, thresholds, direction)
-        
-        results['metrics'].append({
-            'key': metric_key,
-            'display_name': metric_def.get('display_name', metric_key),
-            'actual_value': actual_value,
-            'thresholds': thresholds,
-            'status': metric_status,
-            'direction': direction
-        })
-        
-        # Update overall status
-        if metric_status == 'fail':
-            overall_status = 'fail'
-        elif metric_status == 'warn' and overall_status != 'fail':
-            overall_status = 'warn'
+    def threshold_array(level: str) -> np.ndarray:
+        return np.array(
+            [m.get('thresholds', {}).get(level) or np.nan for m in metric_defs],
+            dtype=float
+        )
     
-    return results, overall_status
+    return {
+        'keys': [m['key'] for m in metric_defs],
+        'templates': [
+            {
+                'key': m['key'],
+                'display_name': m.get('display_name', m['key']),
+                'thresholds': m.get('thresholds', {}),
+                'direction': m.get('direction', 'higher_is_better')
+            }
+            for m in metric_defs
+        ],
+        'warn': threshold_array('warn'),
+        'fail': threshold_array('fail'),
+        'sign': np.array(
+            [-1.0 if m.get('direction', 'higher_is_better') == 'lower_is_better' else 1.0 for m in metric_defs]
+        )
+    }
+
 
+# Metric status by severity, as computed by evaluate_batch
+STATUSES = ('pass', 'warn', 'fail')
 
-def check_threshold(value: float, thresholds: dict, direction: str) -> str:
-    """Check if a value passes thresholds."""
-    promote = thresholds.get('promote')
-    warn = thresholds.get('warn')
-    fail = thresholds.get('fail')
+
+def evaluate_batch(values: np.ndarray, keys: list[str], pack_spec: dict) -> tuple[list[dict], list[str]]:
+    """Evaluate a batch of metric sets against a pack's thresholds.
+    
+    values is an (n, len(keys)) metric array; pack metrics missing from keys
+    evaluate as 0. Every threshold check for the batch is one array
+    comparison, and the results_json dicts are assembled in a single pass
+    afterwards. A set's overall status is its worst metric status.
+    """
+    column = {key: j for j, key in enumerate(keys)}
+    actual = np.zeros((len(values), len(pack_spec['keys'])))
+    for j, key in enumerate(pack_spec['keys']):
+        if key in column:
+            actual[:, j] = values[:, column[key]]
     
-    if direction == 'lower_is_better':
-        if fail and value >= fail:
-            return 'fail'
-        elif warn and value >= warn:
-            return 'warn'
-        elif promote and value <= promote:
-            return 'pass'
-        else:
-            return 'pass'
-    else:  # higher_is_better
-        if fail and value <= fail:
-            return 'fail'
-        elif warn and value <= warn:
-            return 'warn'
-        elif promote and value >= promote:
-            return 'pass'
-        else:
-            return 'pass'
+    sign = pack_spec['sign']
+    signed = actual * sign
+    severity = np.where(
+        signed <= sign * pack_spec['fail'], 2,
+        np.where(signed <= sign * pack_spec['warn'], 1, 0)
+    )
+    overall = severity.max(axis=1, initial=0)
+    
+    results = [
+        {
+            'metrics': [
+                {**template, 'actual_value': value, 'status': STATUSES[level]}
+                for template, value, level in zip(pack_spec['templates'], row_values, row_severity)
+            ],
+            'slices': [],
+            'comparators': []
+        }
+        for row_values, row_severity in zip(actual.tolist(), severity.tolist())
+    ]
+    return results, [STATUSES[worst] for worst in overall.tolist()]
 
 
 def generate_summary(results_json: dict, status: str) -> str:
@@ -458,5 +552,5 @@ def generate_summary(results_json: dict, status: str) -> str:
 
 
 if __name__ == "__main__":
-    seed_complete_ml_data()
+    seed_complete_ml_data(verbose='-v' in sys.argv or '--verbose' in sys.argv)
 
@@ -4,11 +4,13 @@ Seed script for default prompt recipes.
 Run this once to populate the database with the 6 specialized analysis prompts.
 """
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import insert, tuple_
 from sqlmodel import Session, select
 from db_session import engine
 from domains.data_explorer.db_models import PromptRecipe
@@ -46,25 +48,34 @@ def seed_prompt_recipes():
         default_recipes.append(recipe_data)
     
     # Insert recipes into database
-    with Session(engine) as session:
-        for recipe_data in default_recipes:
-            # Check if recipe already exists
-            existing = session.exec(
-                select(PromptRecipe).where(
-                    PromptRecipe.name == recipe_data["name"],
-                    PromptRecipe.action_type == recipe_data["action_type"]
+    # psycopg pipeline mode around the whole seed: the SELECT is synced when
+    # its rows are fetched, and the insert and COMMIT then go out without
+    # waiting on each other. The session is bound to the pipelined connection
+    # so it is not returned to the pool while the pipeline is open.
+    with engine.connect() as conn, conn.connection.driver_connection.pipeline(), Session(conn) as session:
+        # Check which recipes already exist, in one query
+        keys = [(r["name"], r["action_type"]) for r in default_recipes]
+        existing = {
+            tuple(row) for row in session.exec(
+                select(PromptRecipe.name, PromptRecipe.action_type).where(
+                    tuple_(PromptRecipe.name, PromptRecipe.action_type).in_(keys)
                 )
-            ).first()
-            
-            if existing:
+            )
+        }
+        
+        # Core insert skips the model's default_factory, so stamp timestamps here
+        now = datetime.utcnow()
+        new_recipes = []
+        for recipe_data in default_recipes:
+            if (recipe_data["name"], recipe_data["action_type"]) in existing:
                 print(f"✓ Recipe already exists: {recipe_data['name']}")
                 continue
             
-            # Create new recipe
-            recipe = PromptRecipe(**recipe_data)
-            session.add(recipe)
+            new_recipes.append({**recipe_data, "created_at": now, "updated_at": now})
             print(f"+ Created recipe: {recipe_data['name']}")
         
+        if new_recipes:
+            session.execute(insert(PromptRecipe), new_recipes)
         session.commit()
         print(f"\n✅ Seeded {len(default_recipes)} prompt recipes successfully!")
 
@@ -180,7 +180,8 @@ reference_repos_by_family = {
 def update_recipes():
     """Update all recipe versions with reference_repos."""
     
-    with engine.connect() as conn:
+    # One transaction: every version is updated, or none on error
+    with engine.begin() as conn:
         # Get all recipe versions
         result = conn.execute(text("""
             SELECT rv.version_id, rv.recipe_id, rv.manifest_json, r.model_family
@@ -211,7 +212,6 @@ def update_recipes():
             else:
                 print(f"- Skipped {recipe_id} (already has reference_repos or unknown family)")
         
-        conn.commit()
         print(f"\n✓ Successfully updated {len(versions)} recipe versions")
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""Tests for DataExplorerService table and query paging."""
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from domains.data_explorer.service import DataExplorerService
+
+
+def fake_connection(columns, rows):
+    """Build a get_explorer_connection stand-in returning the given table rows."""
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.fetchall.side_effect = [[(name,) for name in columns], rows]
+    cursor.fetchone.return_value = (1000,)
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def get_connection(db_id):
+        yield conn
+
+    return get_connection, cursor
+
+
+class TestGetTableRowsKeyset:
+    """Test keyset pagination in get_table_rows."""
+
+    def test_first_page_orders_by_key(self):
+        """Test the first keyset page is ordered by the key, with no offset."""
+        get_connection, cursor = fake_connection(["id", "name"], [(1, "a"), (2, "b")])
+        with patch("domains.data_explorer.service.get_explorer_connection", get_connection):
+            result = DataExplorerService.get_table_rows(
+                "public", "users", page_size=2, key_column="id"
+            )
+
+        query, params = cursor.execute.call_args.args
+        assert "ORDER BY" in repr(query)
+        assert "OFFSET" not in repr(query)
+        assert "WHERE" not in repr(query)
+        assert params == (2,)
+        assert result.rows == [[1, "a"], [2, "b"]]
+        assert result.next_after == "2"
+
+    def test_next_page_continues_after_cursor(self):
+        """Test a page with after= filters on key > after."""
+        get_connection, cursor = fake_connection(["name", "id"], [("c", 3), ("d", 4)])
+        with patch("domains.data_explorer.service.get_explorer_connection", get_connection):
+            result = DataExplorerService.get_table_rows(
+                "public", "users", page_size=2, key_column="id", after="2"
+            )
+
+        query, params = cursor.execute.call_args.args
+        assert "WHERE" in repr(query)
+        assert params == ("2", 2)
+        # The cursor is read from the key column, wherever it sits in the row
+        assert result.next_after == "4"
+
+    def test_short_page_has_no_cursor(self):
+        """Test the last (short) page ends pagination."""
+        get_connection, _ = fake_connection(["id"], [(5,)])
+        with patch("domains.data_explorer.service.get_explorer_connection", get_connection):
+            result = DataExplorerService.get_table_rows(
+                "public", "users", page_size=2, key_column="id", after="4"
+            )
+
+        assert result.next_after is None
+
+    def test_offset_paging_without_key(self):
+        """Test offset paging is used when no key column is given."""
+        get_connection, cursor = fake_connection(["id"], [(3,), (4,)])
+        with patch("domains.data_explorer.service.get_explorer_connection", get_connection):
+            result = DataExplorerService.get_table_rows("public", "users", page=2, page_size=2)
+
+        query, params = cursor.execute.call_args.args
+        assert "OFFSET" in repr(query)
+        assert params == (2, 2)
+        assert result.next_after is None
+
+
+def fake_json_connection(columns, probe_count, rows_json):
+    """Build a get_explorer_connection stand-in returning one execute_query_json result row."""
+    cursor = MagicMock()
+    cursor.__enter__.return_value = cursor
+    cursor.description = [SimpleNamespace(name=name) for name in columns + ["probe_count", "rows_json"]]
+    cursor.fetchone.return_value = tuple([None] * len(columns)) + (probe_count, rows_json)
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def get_connection(db_id):
+        yield conn
+
+    return get_connection, cursor
+
+
+class TestExecuteQueryJson:
+    """Test the single-statement JSON paging in execute_query_json."""
+
+    def run(self, probe_count, page=1, page_size=2):
+        """Run a query against a result with probe_count rows in the probe window."""
+        get_connection, cursor = fake_json_connection(["id", "name"], probe_count, "[]")
+        with patch("domains.data_explorer.service.get_explorer_connection", get_connection):
+            result = DataExplorerService.execute_query_json("SELECT id, name FROM t;", page=page, page_size=page_size)
+        return result, cursor
+
+    def test_single_statement(self):
+        """Test the page is read once, with no full COUNT(*) over the query."""
+        result, cursor = self.run(2)
+        queries = [repr(call.args[0]) for call in cursor.execute.call_args_list]
+        assert len(queries) == 2  # SET LOCAL statement_timeout, then the page
+        assert "COUNT(*) FROM q" not in queries[1]
+        assert "LIMIT 0" in queries[1]
+        assert result["columns"] == ["id", "name"]
+
+    def test_probe_row_means_more(self):
+        """Test an extra probe row reports another page and no total."""
+        result, _ = self.run(3)
+        assert result["row_count"] == 2
+        assert result["has_more"] is True
+        assert result["total_rows_estimate"] is None
+
+    def test_last_page_has_total(self):
+        """Test the last page knows the total row count."""
+        result, _ = self.run(1, page=3)
+        assert result["row_count"] == 1
+        assert result["has_more"] is False
+        assert result["total_rows_estimate"] == 5
+
+    def test_page_past_the_end(self):
+        """Test an empty page past the end has no total."""
+        result, _ = self.run(0, page=4)
+        assert result["has_more"] is False
+        assert result["total_rows_estimate"] is None
+
+    def test_empty_result(self):
+        """Test an empty first page reports zero rows in total."""
+        result, _ = self.run(0)
+        assert result["total_rows_estimate"] == 0
@@ -0,0 +1,28 @@
+"""Tests for the JSON codec of the shared and seed engines."""
+from decimal import Decimal
+
+import numpy as np
+import orjson
+
+from db.connection import _engine, json_dumps
+
+
+class TestJsonCodec:
+    """Test which engines encode JSON binds with json_dumps."""
+
+    def test_shared_engine_uses_stdlib_json(self):
+        """Test the app-wide engine keeps SQLAlchemy's default str serializer."""
+        assert _engine.dialect._json_serializer is None
+        assert _engine.dialect._json_deserializer is None
+
+    def test_seed_engine_uses_json_dumps(self):
+        """Test the evaluation pack seed engine encodes binds to bytes."""
+        from scripts.seed_evaluation_packs import engine
+
+        assert engine.dialect._json_serializer is json_dumps
+
+    def test_numpy_and_decimal_values(self):
+        """Test metric values from numpy or Decimal are encoded, not rejected."""
+        encoded = json_dumps({"auc": np.float64(0.9), "n": np.int64(3), "cost": Decimal("1.5"), 1: np.arange(2)})
+        assert isinstance(encoded, bytes)
+        assert orjson.loads(encoded) == {"auc": 0.9, "n": 3, "cost": 1.5, "1": [0, 1]}
@@ -0,0 +1,37 @@
+"""Tests for time-ordered dictionary primary keys."""
+from unittest.mock import patch
+
+from domains.data_explorer.dictionary_enhanced_models import uuid7
+
+
+class TestUuid7:
+    """Test the RFC 9562 layout and ordering of uuid7()."""
+
+    def test_version_and_variant(self):
+        """Test the version nibble is 7 and the variant bits are 0b10."""
+        for _ in range(100):
+            value = uuid7()
+            assert value.version == 7
+            assert (value.int >> 62) & 0x3 == 0x2
+
+    def test_timestamp_prefix(self):
+        """Test the top 48 bits are the unix time in milliseconds."""
+        now_ns = 1_760_000_000_123_456_789
+        with patch("time.time_ns", return_value=now_ns):
+            value = uuid7()
+        assert value.int >> 80 == now_ns // 1_000_000
+
+    def test_later_ids_sort_higher(self):
+        """Test ids from a later millisecond sort after earlier ones."""
+        start_ms = 1_760_000_000_000
+        times_ns = [(start_ms + n) * 1_000_000 for n in range(50)]
+        with patch("time.time_ns", side_effect=times_ns):
+            values = [uuid7() for _ in range(50)]
+        assert values == sorted(values)
+        assert [str(v) for v in values] == sorted(str(v) for v in values)
+
+    def test_ids_are_unique(self):
+        """Test ids within the same millisecond still differ."""
+        with patch("time.time_ns", return_value=1_760_000_000_000_000_000):
+            values = {uuid7() for _ in range(1000)}
+        assert len(values) == 1000
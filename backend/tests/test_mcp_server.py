@@ -0,0 +1,206 @@
+"""Tests for the MCP data explorer server's tool handling."""
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cachetools import TTLCache
+from pydantic import ValidationError
+
+import mcp_server
+
+
+def rows_result():
+    """A get_table_rows stand-in result."""
+    result = MagicMock()
+    result.model_dump.return_value = {"rows": []}
+    return result
+
+
+class TestSampleRows:
+    """Test how sample_rows chooses between keyset and offset paging."""
+
+    def sample(self, pk_columns, **kwargs):
+        """Call handle_sample_rows and return the get_table_rows call kwargs."""
+        args = {"connection_id": "default", "schema": "public", "table": "t", "limit": 50, "offset": 0}
+        args.update(kwargs)
+        with patch.object(mcp_server, "get_primary_key_columns", return_value=pk_columns), \
+                patch.object(mcp_server.DataExplorerService, "get_table_rows", return_value=rows_result()) as get_rows:
+            mcp_server.handle_sample_rows(**args)
+        return get_rows.call_args.kwargs
+
+    def test_single_column_key_uses_keyset(self):
+        """Test a single-column primary key pages by key."""
+        call = self.sample(["id"])
+        assert call["key_column"] == "id"
+        assert call["after"] is None
+
+    def test_after_cursor_is_passed_through(self):
+        """Test after= continues keyset paging."""
+        call = self.sample(["id"], after="42")
+        assert call["key_column"] == "id"
+        assert call["after"] == "42"
+
+    def test_explicit_offset_uses_offset_paging(self):
+        """Test an explicit offset falls back to page/page_size."""
+        call = self.sample(["id"], limit=50, offset=100)
+        assert "key_column" not in call
+        assert call["page"] == 3
+        assert call["page_size"] == 50
+
+    def test_composite_key_uses_offset_paging(self):
+        """Test tables without a single-column key are paged by offset."""
+        call = self.sample(["a", "b"])
+        assert "key_column" not in call
+        assert call["page"] == 1
+
+    def test_page_size_is_capped(self):
+        """Test the page size never exceeds 500 rows."""
+        call = self.sample([], limit=1000)
+        assert call["page_size"] == 500
+
+
+class TestQueryCacheKey:
+    """Test run_query cache key normalization."""
+
+    def test_whitespace_is_normalized(self):
+        """Test queries differing only in spacing share a key."""
+        assert mcp_server.query_cache_key("default", "SELECT  *\tFROM t", 1, 100) == \
+            mcp_server.query_cache_key("default", "  SELECT * FROM t ;", 1, 100)
+
+    def test_line_breaks_are_kept(self):
+        """Test a line break is not folded into a space, so a comment can't absorb the next line."""
+        assert mcp_server.query_cache_key("default", "SELECT 1 -- x\nFROM t", 1, 100) != \
+            mcp_server.query_cache_key("default", "SELECT 1 -- x FROM t", 1, 100)
+        assert mcp_server.query_cache_key("default", "SELECT 1 -- x\n\n  FROM t", 1, 100) == \
+            mcp_server.query_cache_key("default", "SELECT 1 -- x\nFROM t", 1, 100)
+
+    def test_quoted_text_is_kept_verbatim(self):
+        """Test whitespace inside literals and quoted identifiers is significant."""
+        assert mcp_server.query_cache_key("default", "SELECT 'a  b'", 1, 100) != \
+            mcp_server.query_cache_key("default", "SELECT 'a b'", 1, 100)
+        assert mcp_server.query_cache_key("default", 'SELECT 1 AS "a  b"', 1, 100) != \
+            mcp_server.query_cache_key("default", 'SELECT 1 AS "a b"', 1, 100)
+
+    def test_connection_and_page_are_part_of_the_key(self):
+        """Test the same SQL on another connection or page gets its own key."""
+        key = mcp_server.query_cache_key("default", "SELECT 1", 1, 100)
+        assert key != mcp_server.query_cache_key("db2", "SELECT 1", 1, 100)
+        assert key != mcp_server.query_cache_key("default", "SELECT 1", 2, 100)
+        assert key != mcp_server.query_cache_key("default", "SELECT 1", 1, 50)
+
+
+class TestDispatchTool:
+    """Test tool argument validation and routing."""
+
+    def dispatch(self, name, arguments):
+        """Dispatch a tool call with the handler replaced by a mock."""
+        handler = MagicMock(return_value="result")
+        _, args_model = mcp_server.TOOLS[name]
+        with patch.dict(mcp_server.TOOLS, {name: (handler, args_model)}):
+            return mcp_server.dispatch_tool(name, arguments), handler
+
+    def test_defaults_are_filled_in(self):
+        """Test omitted arguments take the defaults declared in inputSchema."""
+        result, handler = self.dispatch("sample_rows", {"schema": "public", "table": "t"})
+        assert result == "result"
+        handler.assert_called_once_with(
+            connection_id="default", schema="public", table="t", limit=50, offset=0, after=None
+        )
+
+    def test_no_arguments(self):
+        """Test a tool without required arguments accepts None."""
+        _, handler = self.dispatch("list_schemas", None)
+        handler.assert_called_once_with(connection_id="default")
+
+    def test_missing_required_argument_is_rejected(self):
+        """Test a call without a required argument never reaches the handler."""
+        with pytest.raises(ValidationError):
+            self.dispatch("run_query", {})
+
+    @pytest.mark.parametrize("arguments", [
+        {"schema": "public", "table": "t", "limit": 0},
+        {"schema": "public", "table": "t", "limit": 501},
+        {"schema": "public", "table": "t", "offset": -1},
+    ])
+    def test_out_of_range_arguments_are_rejected(self, arguments):
+        """Test the inputSchema bounds are enforced."""
+        with pytest.raises(ValidationError):
+            self.dispatch("sample_rows", arguments)
+
+    def test_run_query_page_size_is_bounded(self):
+        """Test run_query rejects pages over 1000 rows."""
+        with pytest.raises(ValidationError):
+            self.dispatch("run_query", {"sql": "SELECT 1", "page_size": 1001})
+
+    def test_unknown_tool(self):
+        """Test an unknown tool name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown tool"):
+            mcp_server.dispatch_tool("drop_table", {})
+
+
+class TestRunTool:
+    """Test coalescing of identical in-flight tool calls."""
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        """Test a coalesced waiter still gets the result when the first caller is cancelled."""
+        release = threading.Event()
+        dispatch = MagicMock(side_effect=lambda name, arguments: release.wait(5) and "result")
+
+        async def scenario():
+            first = asyncio.create_task(mcp_server.run_tool("list_schemas", {}))
+            await asyncio.sleep(0.01)
+            second = asyncio.create_task(mcp_server.run_tool("list_schemas", {}))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        with patch.object(mcp_server, "dispatch_tool", dispatch):
+            assert asyncio.run(scenario()) == "result"
+        dispatch.assert_called_once()
+        assert mcp_server._inflight == {}
+
+    def test_errors_reach_every_caller(self):
+        """Test a failing call raises in each coalesced caller and is not kept."""
+        release = threading.Event()
+
+        def fail(name, arguments):
+            release.wait(5)
+            raise ValueError("boom")
+
+        async def scenario():
+            calls = [asyncio.create_task(mcp_server.run_tool("list_schemas", {})) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            release.set()
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        with patch.object(mcp_server, "dispatch_tool", MagicMock(side_effect=fail)) as dispatch:
+            results = asyncio.run(scenario())
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        dispatch.assert_called_once()
+        assert mcp_server._inflight == {}
+
+
+class TestListConnections:
+    """Test list_connections goes through the metadata TTL cache."""
+
+    def test_new_connection_seen_after_ttl(self):
+        """Test a connection added after the first call shows up once the entry expires."""
+        now = [0.0]
+        config = MagicMock(id="default", description="primary", host="h", port=5432, database="d")
+        config.name = "Default"
+        added = MagicMock(id="db2", description="replica", host="h2", port=5432, database="d")
+        added.name = "Replica"
+        cache = TTLCache(maxsize=16, ttl=mcp_server.METADATA_CACHE_TTL, timer=lambda: now[0])
+
+        with patch.object(mcp_server, "_metadata_cache", cache), \
+                patch.object(mcp_server, "get_database_configs", side_effect=[[config], [config, added]]):
+            assert [c["id"] for c in mcp_server.handle_list_connections()] == ["default"]
+            # Served from the cache until the TTL passes
+            assert [c["id"] for c in mcp_server.handle_list_connections()] == ["default"]
+            now[0] += mcp_server.METADATA_CACHE_TTL + 1
+            assert [c["id"] for c in mcp_server.handle_list_connections()] == ["default", "db2"]
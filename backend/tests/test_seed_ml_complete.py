@@ -0,0 +1,125 @@
+"""Tests for the vectorized evaluation in the ML seed script."""
+import numpy as np
+import pytest
+
+from scripts.seed_ml_complete import STATUSES, build_pack_spec, evaluate_batch, metric_matrix
+
+
+def check_threshold(value, thresholds, direction):
+    """The per-metric check evaluate_batch replaced, kept as the reference."""
+    warn = thresholds.get('warn')
+    fail = thresholds.get('fail')
+    if direction == 'lower_is_better':
+        if fail and value >= fail:
+            return 'fail'
+        elif warn and value >= warn:
+            return 'warn'
+        return 'pass'
+    else:
+        if fail and value <= fail:
+            return 'fail'
+        elif warn and value <= warn:
+            return 'warn'
+        return 'pass'
+
+
+PACK = {
+    'metrics': [
+        {'key': 'auc', 'thresholds': {'warn': 0.75, 'fail': 0.7}, 'direction': 'higher_is_better'},
+        {'key': 'latency_ms', 'thresholds': {'warn': 200, 'fail': 500}, 'direction': 'lower_is_better'},
+        {'key': 'recall', 'thresholds': {'warn': 0.6}},
+        {'key': 'drift', 'thresholds': {'warn': 0, 'fail': 0.3}, 'direction': 'lower_is_better'},
+        {'key': 'coverage', 'thresholds': {}},
+    ]
+}
+
+
+class TestEvaluateBatch:
+    """Test evaluate_batch against the original per-metric check_threshold."""
+
+    def evaluate(self, metrics_list, pack=PACK):
+        """Run evaluate_batch over metric dicts the way the seed script does."""
+        keys = sorted({key for metrics in metrics_list for key in metrics})
+        return evaluate_batch(metric_matrix(metrics_list, keys), keys, build_pack_spec(pack))
+
+    def expected(self, metrics, pack=PACK):
+        """Metric statuses from the reference check_threshold."""
+        return [
+            check_threshold(
+                metrics.get(m['key'], 0), m.get('thresholds', {}), m.get('direction', 'higher_is_better')
+            )
+            for m in pack['metrics']
+        ]
+
+    @pytest.mark.parametrize("metrics", [
+        {'auc': 0.9, 'latency_ms': 100, 'recall': 0.8, 'drift': 0.1, 'coverage': 0.5},
+        {'auc': 0.75, 'latency_ms': 200, 'recall': 0.6, 'drift': 0.3, 'coverage': 0},
+        {'auc': 0.72, 'latency_ms': 300, 'recall': 0.59, 'drift': 0.29, 'coverage': 1},
+        {'auc': 0.7, 'latency_ms': 500, 'recall': 0.0, 'drift': 0.0, 'coverage': -1},
+        {'auc': 0.1, 'latency_ms': 10_000, 'recall': 0.9, 'drift': 5.0, 'coverage': 1},
+    ])
+    def test_matches_check_threshold(self, metrics):
+        """Test every metric status, including values exactly on a threshold."""
+        results, _ = self.evaluate([metrics])
+        assert [m['status'] for m in results[0]['metrics']] == self.expected(metrics)
+
+    def test_random_batch_matches_check_threshold(self):
+        """Test a larger batch row by row."""
+        rng = np.random.default_rng(0)
+        metrics_list = [
+            {
+                'auc': float(rng.uniform(0.6, 0.9)),
+                'latency_ms': float(rng.uniform(0, 800)),
+                'recall': float(rng.uniform(0.4, 0.8)),
+                'drift': float(rng.uniform(0, 0.5)),
+                'coverage': float(rng.uniform(0, 1)),
+            }
+            for _ in range(200)
+        ]
+        results, _ = self.evaluate(metrics_list)
+        for result, metrics in zip(results, metrics_list):
+            assert [m['status'] for m in result['metrics']] == self.expected(metrics)
+
+    def test_missing_metric_evaluates_as_zero(self):
+        """Test a pack metric absent from the batch is checked as 0."""
+        metrics = {'latency_ms': 100}
+        results, _ = self.evaluate([metrics])
+        assert results[0]['metrics'][0]['actual_value'] == 0
+        assert [m['status'] for m in results[0]['metrics']] == self.expected(metrics)
+
+    def test_zero_or_missing_thresholds_are_skipped(self):
+        """Test a zero warn threshold and an empty thresholds dict never trigger."""
+        results, _ = self.evaluate([{'drift': 0.2, 'coverage': -100}])
+        statuses = {m['key']: m['status'] for m in results[0]['metrics']}
+        assert statuses['drift'] == 'pass'
+        assert statuses['coverage'] == 'pass'
+
+    def test_overall_is_worst_status(self):
+        """Test each set's overall status is its worst metric status."""
+        metrics_list = [
+            {'auc': 0.9, 'latency_ms': 100, 'recall': 0.8, 'drift': 0.1, 'coverage': 1},
+            {'auc': 0.72, 'latency_ms': 100, 'recall': 0.8, 'drift': 0.1, 'coverage': 1},
+            {'auc': 0.72, 'latency_ms': 600, 'recall': 0.8, 'drift': 0.1, 'coverage': 1},
+        ]
+        results, overall = self.evaluate(metrics_list)
+        assert overall == ['pass', 'warn', 'fail']
+        for result, status in zip(results, overall):
+            worst = max(STATUSES.index(m['status']) for m in result['metrics'])
+            assert STATUSES[worst] == status
+
+    def test_result_entries(self):
+        """Test result entries carry the metric definition and actual value."""
+        results, _ = self.evaluate([{'auc': 0.9, 'latency_ms': 100}])
+        entry = results[0]['metrics'][2]
+        assert entry['key'] == 'recall'
+        assert entry['display_name'] == 'recall'
+        assert entry['direction'] == 'higher_is_better'
+        assert entry['thresholds'] == {'warn': 0.6}
+        assert results[0]['slices'] == []
+        assert results[0]['comparators'] == []
+
+    def test_empty_pack(self):
+        """Test a pack without metrics passes."""
+        results, overall = self.evaluate([{'auc': 0.9}], pack={'metrics': []})
+        assert results[0]['metrics'] == []
+        assert overall == ['pass']